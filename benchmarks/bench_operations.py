@@ -0,0 +1,168 @@
+"""
+	Times the main operations of the library (startup, login, section navigation, filtering, paging, detail reads)
+	against the local mock Maximo server, and compares them with a stored baseline. Requires Chrome.
+
+	Usage:
+		python -m benchmarks.bench_operations [--repeat 3] [--latency 0.05] [--records 200] [--page-size 20]
+		python -m benchmarks.bench_operations --save-baseline benchmarks/baseline.json
+		python -m benchmarks.bench_operations --compare benchmarks/baseline.json [--tolerance 0.25]
+
+	With `--compare` the scenarios run with the settings stored in the baseline (unless given explicitly), and the
+	exit code is 1 if any scenario got slower than `tolerance` (relative) or sends more WebDriver commands than
+	in the baseline. If the baseline file is missing or has no results yet, the comparison is skipped (exit code 0).
+
+	Timings depend on the machine: record the baseline (`--save-baseline`) on the machine running the comparisons.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import maximo_gui_connector as MGC
+
+from benchmarks.mock_maximo import MockMaximoServer
+
+
+def newMaximo(server: MockMaximoServer, **config):
+	config = dict({ "headless": True, "instrumentation": True, "cache_dir": tempfile.mkdtemp(prefix="maximo_bench_"), "download_dir": tempfile.mkdtemp(prefix="maximo_bench_downloads_") }, **config)
+	return MGC.MaximoAutomation(config, login_url=server.login_url)
+
+
+def timed(fn):
+	start = time.perf_counter()
+	fn()
+	return time.perf_counter() - start
+
+
+def runScenarios(server: MockMaximoServer):
+	"""Runs every scenario once
+
+	Returns:
+		tuple: Seconds taken by each scenario (dict), WebDriver commands sent by each operation (dict)
+	"""
+	results = {}
+
+	start = time.perf_counter()
+	maximo = newMaximo(server)
+	results["startup"] = time.perf_counter() - start
+
+	try:
+		results["login"] = timed(lambda: maximo.login("bench", "bench"))
+		results["goto_section (cold)"] = timed(lambda: maximo.goto_section("changes"))
+		results["setFilters"] = timed(lambda: maximo.setFilters({ "status": "APPR,INPRG", "priority": "1,2" }))
+		results["getAllRecordsFromTable"] = timed(lambda: maximo.getAllRecordsFromTable())
+		results["setFilters (reset)"] = timed(lambda: maximo.setFilters({ "status": "", "priority": "" }))
+		results["getAllRecordsFromTable (export)"] = timed(lambda: maximo.getAllRecordsFromTable(export=True))
+		results["getTableRowsAll (projected)"] = timed(lambda: maximo.getTableRowsAll(columns=["Change", "Status"]))
+		results["detail read"] = timed(lambda: (maximo.quickSearch("CH0000001"), maximo.getNamedInput("Status:").get_attribute("value")))
+		results["goto_section (warm)"] = timed(lambda: maximo.goto_section("incidents"))
+		results["logout"] = timed(lambda: maximo.logout())
+
+		commands = { name: stats["commands"] for name, stats in maximo.instrumentation.toDict().items() }
+	finally:
+		maximo.close()
+
+	# Page load and navigation with and without resource blocking
+	for suffix, config in ((" (no blocking)", {}), (" (block_resources)", { "block_resources": True })):
+		maximo = newMaximo(server, **config)
+		try:
+			results["page load" + suffix] = timed(lambda: maximo.driver.get(server.login_url))
+			results["login" + suffix] = timed(lambda: maximo.login("bench", "bench"))
+			results["goto_section" + suffix] = timed(lambda: maximo.goto_section("changes"))
+			results["page load" + suffix + " JS heap MB"] = maximo.driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null;")
+		finally:
+			maximo.close()
+
+	return results, commands
+
+
+# Used when neither the command line nor the baseline specify a setting
+DEFAULT_SETTINGS = { "repeat": 3, "latency": 0.05, "records": 200, "page_size": 20 }
+
+
+def compare(results: dict, commands: dict, baseline: dict, tolerance: float):
+	"""
+	Returns:
+		list: Description of every regression found
+	"""
+	regressions = []
+
+	for name, seconds in results.items():
+		# Memory figures are informative only
+		if name.endswith(" MB"): continue
+
+		previous = baseline.get("timings", {}).get(name)
+		if previous and seconds is not None and seconds > previous * (1 + tolerance):
+			regressions.append(f"{name}: {seconds:.3f}s (baseline {previous:.3f}s, +{(seconds / previous - 1) * 100:.0f}%)")
+
+	for name, count in commands.items():
+		previous = baseline.get("commands", {}).get(name)
+		if previous is not None and count > previous:
+			regressions.append(f"{name}: {count} WebDriver commands (baseline {previous})")
+
+	return regressions
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--repeat", type=int, help=f"Runs of every scenario; the median is reported (default: {DEFAULT_SETTINGS['repeat']})")
+	parser.add_argument("--latency", type=float, help=f"Mock server latency in seconds (default: {DEFAULT_SETTINGS['latency']})")
+	parser.add_argument("--records", type=int, help=f"Records of every application (default: {DEFAULT_SETTINGS['records']})")
+	parser.add_argument("--page-size", type=int, help=f"Rows of every list page (default: {DEFAULT_SETTINGS['page_size']})")
+	parser.add_argument("--save-baseline", metavar="PATH", help="Save the results as the new baseline")
+	parser.add_argument("--compare", metavar="PATH", help="Compare the results with a saved baseline")
+	parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown when comparing (default: %(default)s)")
+	args = parser.parse_args()
+
+	baseline = None
+	if args.compare:
+		if os.path.isfile(args.compare):
+			with open(args.compare) as f:
+				baseline = json.load(f)
+		else:
+			print(f"Baseline '{args.compare}' not found: the comparison will be skipped")
+
+	# The committed baseline holds only the settings until it is recorded on the machine running the comparisons
+	has_results = bool(baseline and (baseline.get("timings") or baseline.get("commands")))
+	if baseline is not None and not has_results:
+		print(f"Baseline '{args.compare}' has no results yet (record it with --save-baseline): the comparison will be skipped")
+
+	# Results are comparable only if the scenarios ran with the same settings
+	for name, default in DEFAULT_SETTINGS.items():
+		if getattr(args, name) is None:
+			setattr(args, name, (baseline or {}).get("settings", {}).get(name, default))
+
+	server = MockMaximoServer(latency=args.latency, records=args.records, page_size=args.page_size).startInBackground()
+
+	runs = [runScenarios(server) for _ in range(args.repeat)]
+
+	timings = { name: statistics.median(run[0][name] for run in runs) if runs[0][0][name] is not None else None for name in runs[0][0] }
+	commands = runs[-1][1]
+
+	for name, value in timings.items():
+		unit = "" if name.endswith(" MB") else "s"
+		print(f"{name:<35} {value:10.3f}{unit}" if value is not None else f"{name:<35} {'n/a':>10}")
+
+	print()
+	for name, count in sorted(commands.items()):
+		print(f"{name:<35} {count:6d} WebDriver commands")
+
+	result = { "settings": { name: getattr(args, name) for name in DEFAULT_SETTINGS }, "timings": timings, "commands": commands }
+
+	if args.save_baseline:
+		with open(args.save_baseline, "w") as f:
+			json.dump(result, f, indent=4)
+
+		print(f"\nBaseline saved to '{args.save_baseline}'")
+
+	if has_results:
+		regressions = compare(timings, commands, baseline, args.tolerance)
+
+		if regressions:
+			print("\nRegressions found:\n\t" + "\n\t".join(regressions))
+			sys.exit(1)
+
+		print("\nNo regressions found")
@@ -0,0 +1,71 @@
+"""
+	Compares the memory taken by a big table harvest stored as a list of dictionaries (the format returned by
+	`getAllRecordsFromTable()`) and as a `ColumnarTable`. Does not need a browser.
+
+	Usage:
+		python -m benchmarks.bench_table_memory [--rows 100000]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from maximo_gui_connector.table import ColumnarTable
+
+
+HEADERS = ["Change", "Summary", "Status", "Owner Group", "Owner", "Priority", "Target Start", "Target Finish"]
+
+
+def generateRecords(rows: int):
+	""" Builds rows similar to the ones of a Changes list view, as they arrive from the browser (new strings for every cell) """
+	rnd = random.Random(0)
+	statuses = ["NEW", "APPR", "INPRG", "REVIEW", "CLOSE"]
+	groups = [f"GROUP_{i:02}" for i in range(15)]
+
+	for index in range(rows):
+		values = [
+			f"CH{index:08}",
+			f"Summary of change number {index % 5000}",
+			rnd.choice(statuses),
+			rnd.choice(groups),
+			f"USER{rnd.randrange(200):03}",
+			str(rnd.randrange(1, 5)),
+			f"10/{rnd.randrange(1, 29):02}/21 10:00 AM",
+			f"11/{rnd.randrange(1, 29):02}/21 06:00 PM",
+		]
+
+		# Simulate JSON decoding, which creates a new string object for every value
+		yield { "data": { header: "".join(list(value)) for header, value in zip(HEADERS, values) }, "element_id": f"m6a7dfd2f_tbod_tdrow-tr[R:{index % 20}]" }
+
+
+def measure(build):
+	gc.collect()
+	tracemalloc.start()
+
+	result = build()
+	current, _ = tracemalloc.get_traced_memory()
+
+	tracemalloc.stop()
+	return result, current
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--rows", type=int, default=100000, help="Number of rows to generate (default: %(default)s)")
+	args = parser.parse_args()
+
+	records, records_size = measure(lambda: list(generateRecords(args.rows)))
+	del records
+
+	def buildTable():
+		table = ColumnarTable(HEADERS)
+		for record in generateRecords(args.rows):
+			table.append([record["data"][header] for header in HEADERS], record["element_id"])
+
+		return table
+
+	table, table_size = measure(buildTable)
+
+	print(f"Rows:              {len(table)}")
+	print(f"List of dicts:     {records_size / 1024 / 1024:8.1f} MB")
+	print(f"ColumnarTable:     {table_size / 1024 / 1024:8.1f} MB  ({records_size / table_size:.1f}x smaller)")
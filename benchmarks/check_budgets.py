@@ -0,0 +1,95 @@
+"""
+	Runs the public operations against the local mock Maximo server and checks that none of them sends more
+	WebDriver commands than its budget (see `maximo_gui_connector.budget.COMMAND_BUDGETS`) in a real browser. Requires Chrome.
+	The same budgets are checked without a browser by the test suite (tests/test_budgets.py).
+
+	Usage:
+		python -m benchmarks.check_budgets [--records 60] [--page-size 20]
+
+	The exit code is 1 if any budget was exceeded, so that it can run in CI after every change.
+"""
+import argparse
+import math
+import sys
+import tempfile
+
+from selenium import webdriver
+
+import maximo_gui_connector as MGC
+from maximo_gui_connector.budget import CommandBudget
+from maximo_gui_connector.cache import getDefaultCacheDir
+from maximo_gui_connector.driver import resolveChromeDriver
+
+from benchmarks.mock_maximo import MockMaximoServer
+
+
+def checkBudgets(server: MockMaximoServer):
+	"""Runs every operation inside its budget
+
+	Returns:
+		list: (operation, commands used, limit, error message or None) for every check
+	"""
+	chrome_options = webdriver.ChromeOptions()
+	chrome_options.add_argument("--headless")
+
+	driver = webdriver.Chrome(resolveChromeDriver(getDefaultCacheDir()), options=chrome_options)
+	maximo = MGC.MaximoAutomation({ "driver": driver, "instrumentation": True, "cache_dir": tempfile.mkdtemp(prefix="maximo_budgets_") }, login_url=server.login_url)
+
+	checks = []
+
+	budget = None
+
+	def check(operation: str, fn):
+		nonlocal budget
+		budget = CommandBudget(maximo.instrumentation, operation)
+		try:
+			with budget:
+				result = fn()
+		except MGC.MaximoBudgetExceeded as e:
+			checks.append((operation, budget.used, budget.limit, str(e)))
+			return None
+
+		checks.append((operation, budget.used, budget.limit, None))
+		return result
+
+	try:
+		maximo.login("budget", "budget")
+		maximo.goto_section("changes")
+
+		check("get_sections", lambda: maximo.get_sections(force_rescan=True))
+		check("setFilters", lambda: maximo.setFilters({ "status": "APPR,INPRG,NEW" }))
+
+		def getAllRecords():
+			rows = maximo.getAllRecordsFromTable()
+			# The number of pages is only known once they have been read
+			budget.pages = max(1, math.ceil(len(rows) / server.page_size))
+			return rows
+
+		rows = check("getAllRecordsFromTable", getAllRecords)
+
+		maximo.quickSearch(rows[0]["data"]["Change"])
+		check("setNamedInput", lambda: maximo.setNamedInput({ "Summary:": "Changed by the budget check" }))
+		check("detectDialogs", lambda: maximo.detectDialogs())
+
+	finally:
+		maximo.close()
+
+	return checks
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--records", type=int, default=60, help="Records of every application (default: %(default)s)")
+	parser.add_argument("--page-size", type=int, default=20, help="Rows of every list page (default: %(default)s)")
+	args = parser.parse_args()
+
+	server = MockMaximoServer(latency=0.01, records=args.records, page_size=args.page_size).startInBackground()
+
+	checks = checkBudgets(server)
+	for operation, used, limit, error in checks:
+		print(f"{operation:<25} {used:4d} / {limit:<4d} {'EXCEEDED' if error else 'ok'}")
+
+	failed = [error for operation, used, limit, error in checks if error]
+	if failed:
+		print("\n" + "\n".join(failed))
+		sys.exit(1)
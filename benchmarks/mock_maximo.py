@@ -0,0 +1,590 @@
+"""
+	Minimal stand-in for the Maximo web UI, reproducing the element IDs, globals (`waitOn`, `APPTARGET`...) and
+	dialog structure the library relies on, with configurable latency and table sizes.
+
+	Every UI event is sent to the server with `sendEvent()` (like Maximo does): `waitOn` stays true until the
+	response, delayed by `latency` seconds, has been rendered.
+
+	Usage:
+		python -m benchmarks.mock_maximo [--port 8080] [--latency 0.1] [--records 500] [--page-size 20]
+
+	Then point `MaximoAutomation(login_url="http://localhost:8080/maximo/webclient/login/login.jsp")` to it.
+	Any username is accepted; the password "wrong" makes the login fail.
+"""
+import argparse
+import html
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+LOGIN_PATH = "/maximo/webclient/login/login.jsp"
+UI_PATH = "/maximo/ui/"
+
+# Format of the dates shown in the tables (the one of the en-US locale)
+DATE_FORMAT = "%m/%d/%y %I:%M %p"
+
+# 1x1 transparent GIF, served for every image of the UI
+GIF_BYTES = bytes.fromhex("47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b")
+
+APPS = {
+	"mp2change": {
+		"label": "Changes (MP)",
+		"prefix": "CH",
+		"columns": ["Change", "Summary", "Status", "Owner Group", "Owner", "Priority", "Changed Date"],
+		"statuses": ["NEW", "APPR", "INPRG", "REVIEW", "CLOSE"],
+	},
+	"mp2inc": {
+		"label": "Incidents (MP)",
+		"prefix": "IN",
+		"columns": ["Incident", "Summary", "Status", "Owner Group", "Owner", "Priority", "Changed Date"],
+		"statuses": ["QUEUED", "INPROG", "RESOLVED", "CLOSED"],
+	},
+	"mp2activ": {
+		"label": "Activities and Tasks(MP)",
+		"prefix": "AC",
+		"columns": ["Activity", "Summary", "Status", "Owner Group", "Owner", "Priority", "Changed Date"],
+		"statuses": ["WAPPR", "INPRG", "COMP"],
+	},
+}
+
+
+def generateRecords(app: str, count: int):
+	""" Deterministic records for an application, most recently changed first """
+	rnd = random.Random(app)
+	definition = APPS[app]
+	now = datetime(2021, 10, 1, 12, 0)
+
+	records = []
+	for index in range(count):
+		changed = now - timedelta(minutes=index * 17)
+		records.append(dict(zip(definition["columns"], [
+			f"{definition['prefix']}{index + 1:07}",
+			f"Summary of record number {index + 1}",
+			rnd.choice(definition["statuses"]),
+			f"GROUP_{rnd.randrange(10):02}",
+			f"USER{rnd.randrange(50):03}",
+			str(rnd.randrange(1, 5)),
+			changed.strftime(DATE_FORMAT),
+		])))
+
+	return records
+
+
+def matchesFilter(value: str, expression: str):
+	"""Applies a list view filter the way Maximo does (simplified):
+		- "=A,=B"	exact match with one of the values
+		- "!=A"		not equal
+		- "A,B"		contains one of the values (case insensitive, "%" is a wildcard)
+		- ">=D"		comparison (also "<=", ">", "<"), on dates if both sides are dates
+	"""
+	expression = expression.strip()
+	if not expression:
+		return True
+
+	regex_result = re.match(r"^(>=|<=|>|<)(.*)$", expression)
+	if regex_result:
+		operator, operand = regex_result.group(1), regex_result.group(2).strip()
+		try:
+			value, operand = datetime.strptime(value, DATE_FORMAT), datetime.strptime(operand, DATE_FORMAT)
+		except ValueError:
+			pass
+
+		return { ">=": value >= operand, "<=": value <= operand, ">": value > operand, "<": value < operand }[operator]
+
+	if expression.startswith("!="):
+		return value.lower() != expression[2:].strip().lower()
+
+	for option in expression.split(","):
+		option = option.strip()
+
+		if option.startswith("="):
+			if value.lower() == option[1:].strip().lower(): return True
+		elif option.replace("%", "").lower() in value.lower():
+			return True
+
+	return False
+
+
+class MockSession(object):
+	def __init__(self, username: str):
+		self.username = username
+		self.last_seen = time.time()
+		self.lock = threading.Lock()
+		self.reset("startcntr")
+
+	def reset(self, app: str):
+		self.app = app
+		self.page = 0
+		self.filter_row = False
+		self.pending_filters = {}
+		self.filters = {}
+		self.detail = None
+		self.msgbox = None
+		self.detail_values = {}
+
+
+class MockMaximoServer(ThreadingHTTPServer):
+	daemon_threads = True
+
+	def __init__(self, address: tuple = ("127.0.0.1", 0), latency: float = 0.1, records: int = 500, page_size: int = 20, session_timeout: float = None):
+		super().__init__(address, MockMaximoHandler)
+
+		self.session_timeout = session_timeout
+
+		self.latency = latency
+		self.page_size = page_size
+		self.records = { app: generateRecords(app, records) for app in APPS }
+		self.sessions = {}
+
+	@property
+	def base_url(self):
+		return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+	@property
+	def login_url(self):
+		return self.base_url + LOGIN_PATH
+
+	def startInBackground(self):
+		""" Serves the requests from a daemon thread and returns the server itself """
+		threading.Thread(target=self.serve_forever, daemon=True).start()
+		return self
+
+
+class MockMaximoHandler(BaseHTTPRequestHandler):
+	server: MockMaximoServer
+
+	def log_message(self, format, *args):
+		pass
+
+	# ------------------------------------------------------------------ helpers
+	def send(self, status: int, body, content_type: str = "text/html; charset=utf-8", headers: dict = {}):
+		body = body.encode("utf-8") if isinstance(body, str) else body
+
+		self.send_response(status)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(body)))
+		for name, value in headers.items():
+			self.send_header(name, value)
+		self.end_headers()
+
+		self.wfile.write(body)
+
+	def redirect(self, location: str, headers: dict = {}):
+		self.send(302, "", headers=dict(headers, Location=location))
+
+	def getSession(self):
+		cookie = SimpleCookie(self.headers.get("Cookie", ""))
+		session_id = cookie["JSESSIONID"].value if "JSESSIONID" in cookie else None
+
+		session = self.server.sessions.get(session_id)
+		if session is None:
+			return None
+
+		# Sessions expire after `session_timeout` seconds without requests
+		if self.server.session_timeout and time.time() - session.last_seen > self.server.session_timeout:
+			self.server.sessions.pop(session_id, None)
+			return None
+
+		session.last_seen = time.time()
+		return session
+
+	def readBody(self):
+		return self.rfile.read(int(self.headers.get("Content-Length", 0) or 0)).decode("utf-8")
+
+	# ------------------------------------------------------------------ routes
+	def do_GET(self):
+		path = urlparse(self.path).path
+
+		if path == LOGIN_PATH:
+			return self.send(200, renderLoginPage())
+
+		if path == UI_PATH:
+			session = self.getSession()
+			if session is None:
+				return self.redirect(LOGIN_PATH)
+
+			with session.lock:
+				return self.send(200, renderMainPage(self.server, session))
+
+		if path == "/maximo/logout":
+			return self.send(200, renderLogoutPage())
+
+		if path == "/maximo/download":
+			session = self.getSession()
+			if session is None:
+				return self.redirect(LOGIN_PATH)
+
+			time.sleep(self.server.latency)
+
+			with session.lock:
+				body = renderExport(self.server, session)
+
+			return self.send(200, body, "application/vnd.ms-excel; charset=utf-8", { "Content-Disposition": f'attachment; filename="{session.app}.xls"' })
+
+		if path.startswith("/static/"):
+			if path.endswith(".gif"):
+				return self.send(200, GIF_BYTES, "image/gif", { "Cache-Control": "no-store" })
+
+			if path.endswith(".woff"):
+				return self.send(200, b"\0" * 32 * 1024, "font/woff", { "Cache-Control": "no-store" })
+
+			if path.endswith(".css"):
+				return self.send(200, "@font-face { font-family: mock; src: url('/static/mock.woff'); } body { font-family: mock, sans-serif; }", "text/css")
+
+		self.send(404, "Not found")
+
+	def do_HEAD(self):
+		path = urlparse(self.path).path
+
+		if path == UI_PATH:
+			return self.send_empty(200 if self.getSession() else 302)
+
+		self.send_empty(404)
+
+	def send_empty(self, status: int):
+		self.send_response(status)
+		if status == 302:
+			self.send_header("Location", LOGIN_PATH)
+		self.send_header("Content-Length", "0")
+		self.end_headers()
+
+	def do_POST(self):
+		path = urlparse(self.path).path
+
+		if path == "/maximo/login":
+			form = parse_qs(self.readBody())
+			username = (form.get("username") or [""])[0]
+			password = (form.get("password") or [""])[0]
+
+			time.sleep(self.server.latency)
+
+			if not username or password == "wrong":
+				return self.send(200, renderLoginPage(error=True))
+
+			session_id = uuid.uuid4().hex
+			self.server.sessions[session_id] = MockSession(username)
+
+			return self.redirect(UI_PATH, { "Set-Cookie": f"JSESSIONID={session_id}; Path=/maximo; HttpOnly" })
+
+		if path == "/maximo/logout":
+			cookie = SimpleCookie(self.headers.get("Cookie", ""))
+			if "JSESSIONID" in cookie:
+				self.server.sessions.pop(cookie["JSESSIONID"].value, None)
+
+			return self.redirect(LOGIN_PATH)
+
+		if path == "/maximo/event":
+			session = self.getSession()
+			if session is None:
+				return self.send(401, json.dumps({ "expired": True }), "application/json")
+
+			event = json.loads(self.readBody() or "{}")
+			time.sleep(self.server.latency)
+
+			with session.lock:
+				render = handleEvent(self.server, session, event.get("type"), event.get("target"), event.get("value"))
+				body = { "html": renderContent(self.server, session) if render else None, "apptarget": session.app, "applabel": appLabel(session.app) }
+
+			return self.send(200, json.dumps(body), "application/json")
+
+		self.send(404, "Not found")
+
+
+def appLabel(app: str):
+	return APPS[app]["label"] if app in APPS else "Start Center"
+
+
+def handleEvent(server: MockMaximoServer, session: MockSession, event_type: str, target: str, value):
+	"""Updates the session state
+
+	Returns:
+		bool: Whether the content must be rendered again
+	"""
+	if event_type == "changeapp":
+		session.reset(value if value in APPS else "startcntr")
+		return True
+
+	if event_type == "setvalue":
+		regex_result = re.search(r"_tfrow_\[C:([0-9]+)\]_txt-tb$", target or "")
+		if regex_result:
+			column = APPS[session.app]["columns"][int(regex_result.group(1)) - 1]
+			session.pending_filters[column] = value or ""
+		else:
+			session.detail_values[target] = value
+
+		return False
+
+	if event_type == "togglefilter":
+		session.filter_row = not session.filter_row
+		return True
+
+	if event_type == "filter":
+		session.filters = dict(session.pending_filters)
+		session.page = 0
+		return True
+
+	if event_type == "nextpage":
+		if (session.page + 1) * server.page_size < len(filteredRecords(server, session)):
+			session.page += 1
+		return True
+
+	if event_type == "quicksearch":
+		records = server.records.get(session.app, [])
+		key_column = APPS[session.app]["columns"][0] if session.app in APPS else None
+		found = next((record for record in records if key_column and record[key_column].lower() == str(value).strip().lower()), None)
+
+		if found:
+			session.detail = found
+			session.detail_values = {}
+		else:
+			session.msgbox = "BMXAA4186E - No records were found that match the specified query"
+
+		return True
+
+	if event_type == "closemsg":
+		session.msgbox = None
+		return True
+
+	if event_type == "list":
+		session.detail = None
+		return True
+
+	return False
+
+
+def filteredRecords(server: MockMaximoServer, session: MockSession):
+	records = server.records.get(session.app, [])
+
+	for column, expression in session.filters.items():
+		records = [record for record in records if matchesFilter(record[column], expression)]
+
+	return records
+
+
+# ---------------------------------------------------------------------------------------------------- rendering
+def renderLoginPage(error: bool = False):
+	error_html = """
+		<div class="dialog" role="main">
+			<div class="message">Login failed</div>
+			<div class="messageDesc">BMXAA7901E - You cannot log in at this time. Contact the system administrator.</div>
+		</div>
+	""" if error else ""
+
+	return f"""<!DOCTYPE html>
+<html><head><title>Welcome to Maximo</title><link rel="stylesheet" href="/static/mock.css"></head>
+<body>
+	{error_html}
+	<form method="post" action="/maximo/login">
+		<img src="/static/logo.gif">
+		<input id="j_username" name="username" type="text">
+		<input id="j_password" name="password" type="password">
+		<button id="loginbutton" type="submit">Sign In</button>
+	</form>
+</body></html>"""
+
+
+def renderLogoutPage():
+	return """<!DOCTYPE html>
+<html><head><title>Logout</title></head>
+<body>
+	<form id="returnFrm" method="post" action="/maximo/logout">
+		<button id="submit" type="submit">Return to Login</button>
+	</form>
+</body></html>"""
+
+
+def renderMainPage(server: MockMaximoServer, session: MockSession):
+	menu_items = ['<li><a id="menu0_changeapp_startcntr_a" href="javascript: sendEvent(\'changeapp\', \'startcntr\', \'startcntr\')">Start Center</a></li>']
+	for app, definition in APPS.items():
+		menu_items.append(f'<li><a id="menu0_changeapp_{app}_a" href="javascript: sendEvent(\'changeapp\', \'startcntr\', \'{app}\')">{html.escape(definition["label"])}</a></li>')
+
+	return f"""<!DOCTYPE html>
+<html><head><title>Maximo</title><link rel="stylesheet" href="/static/mock.css"></head>
+<body>
+	<script>
+		var waitOn = false;
+		var pendingEvents = 0;
+		var APPTARGET = {json.dumps(session.app)};
+		var APP_KEY_LABEL = {json.dumps(appLabel(session.app))};
+		var LOGOUTURL = "/maximo/logout";
+
+		function sendEvent (type, target, value) {{
+			pendingEvents++;
+			waitOn = true;
+
+			fetch("/maximo/event", {{ method: "POST", credentials: "same-origin", body: JSON.stringify({{ type: type, target: target, value: value }}) }})
+				.then(response => {{
+					if (response.status == 401) {{ window.location = "{LOGIN_PATH}"; return null; }}
+					return response.json();
+				}})
+				.then(data => {{
+					if (data) {{
+						if (data.html !== null) document.getElementById("main").innerHTML = data.html;
+						APPTARGET = data.apptarget;
+						APP_KEY_LABEL = data.applabel;
+					}}
+				}})
+				.finally(() => {{
+					pendingEvents--;
+					waitOn = pendingEvents > 0;
+				}});
+		}}
+
+		function getRowFromId (id) {{
+			let regex_result = /\\[R:([0-9]+)\\]/.exec(id);
+			return regex_result ? regex_result[1] : null;
+		}}
+	</script>
+
+	<div id="titlebar">
+		<img src="/static/titlebar_logo.gif">
+		<button id="titlebar-tb_gotoButton" onclick="document.getElementById('menu0').style.display = 'block'">Go To Applications</button>
+		<a id="titlebar_hyperlink_9-lbsignout" href="javascript: window.location = LOGOUTURL">Sign Out</a>
+	</div>
+	<ul id="menu0" style="display: none">
+		<li class="submenu"><a href="#">Applications</a></li>
+		{"".join(menu_items)}
+	</ul>
+
+	<div id="main">{renderContent(server, session)}</div>
+</body></html>"""
+
+
+def renderDialog(dialog_id: str, title: str, body: str, buttons: list):
+	buttons_html = "".join(f'<button class="pb" type="button" ctype="pushbutton" id="{button_id}" onclick="{html.escape(onclick)}">{html.escape(text)}</button>' for button_id, text, onclick in buttons)
+
+	return f"""
+		<div id="{dialog_id}-dialog_inner" role="alertdialog">
+			<div id="{dialog_id}-dialog_content0">{html.escape(title)}</div>
+			<div id="{dialog_id}-dialog_content1">
+				<div id="{dialog_id}_bodydiv"><span id="mb_msg">{html.escape(body)}</span></div>
+				{buttons_html}
+			</div>
+		</div>
+		<div id="{dialog_id}-dialog_inner_dialogwait" class="wait_modal"></div>
+	"""
+
+
+def renderContent(server: MockMaximoServer, session: MockSession):
+	if session.app not in APPS:
+		return '<div id="startcntr"><img src="/static/startcntr.gif"> Start Center</div>'
+
+	parts = ["""
+		<div id="quicksearch_container">
+			<input id="quicksearch" class="fld text" type="text" value="">
+			<img id="quicksearchQSImage" src="/static/qs_search.gif" onclick="sendEvent('quicksearch', 'quicksearch', document.getElementById('quicksearch').value)">
+			<img id="quicksearchQSMenuImage" src="/static/qs_menu.gif">
+		</div>
+	"""]
+
+	if session.msgbox:
+		parts.append(renderDialog("msgbox", "System Message", session.msgbox, [("m88dbf6ce-pb", "OK", "sendEvent('closemsg')")]))
+
+	if session.detail:
+		parts.append(renderDetail(session))
+	else:
+		parts.append(renderList(server, session))
+
+	return "".join(parts)
+
+
+def renderDetail(session: MockSession):
+	fields = []
+	for index, (label, value) in enumerate(session.detail.items()):
+		input_id = f"mx{index}_txt-tb"
+		value = session.detail_values.get(input_id, value)
+
+		fields.append(f'<div><label class="text label" for="{input_id}">{html.escape(label)}:</label><input id="{input_id}" class="fld text" type="text" value="{html.escape(value)}"></div>')
+
+	return f"""
+		<div id="m397b0593-tabs_middle">
+			<div id="m397b0593-co3_0"><ul>
+				<li><a title="List View" onclick="sendEvent('list')">List View</a></li>
+				<li class="on"><a title="Details" class="on">Details</a></li>
+			</ul></div>
+			{"".join(fields)}
+		</div>
+	"""
+
+
+def renderList(server: MockMaximoServer, session: MockSession):
+	columns = APPS[session.app]["columns"]
+	records = filteredRecords(server, session)
+
+	start = session.page * server.page_size
+	page = records[start:start + server.page_size]
+	has_next = start + server.page_size < len(records)
+
+	header_cells = ['<th id="m6a7dfd2f_ttrow_[C:0]-c"></th>']
+	filter_cells = ['<td headers="m6a7dfd2f_ttrow_[C:0]-c"></td>']
+	for number, column in enumerate(columns, 1):
+		header_cells.append(f'<th id="m6a7dfd2f_ttrow_[C:{number}]-c"><span id="m6a7dfd2f_ttrow_[C:{number}]_ttitle-lb">{html.escape(column)}</span><img src="/static/btn_sort.gif" alt="Sort Ascending"></th>')
+
+		value = html.escape(session.pending_filters.get(column, ""))
+		filter_cells.append(f'<td headers="m6a7dfd2f_ttrow_[C:{number}]-c"><input id="m6a7dfd2f_tfrow_[C:{number}]_txt-tb" class="fld text" type="text" value="{value}" onchange="sendEvent(\'setvalue\', this.id, this.value)"></td>')
+
+	rows = []
+	for row_number, record in enumerate(page):
+		cells = [f'<td id="m6a7dfd2f_tdrow_[C:0]-c[R:{row_number}]"><img src="/static/checkbox.gif"></td>']
+		for number, column in enumerate(columns, 1):
+			cells.append(f'<td id="m6a7dfd2f_tdrow_[C:{number}]-c[R:{row_number}]">{html.escape(record[column])}</td>')
+
+		rows.append(f'<tr class="tablerow" id="m6a7dfd2f_tbod_tdrow-tr[R:{row_number}]">{"".join(cells)}</tr>')
+
+	counter = f"{start + 1 if page else 0} - {start + len(page)} of {len(records)}"
+	filter_image = "tablebtn_filter_on.gif" if session.filter_row else "tablebtn_filter_off.gif"
+	next_image = "tablebtn_next_on.gif" if has_next else "tablebtn_next_off.gif"
+
+	return f"""
+		<table id="m6a7dfd2f_tbl">
+			<tr><td colspan="{len(columns) + 1}">
+				<a id="m6a7dfd2f-lb2" href="javascript: sendEvent('togglefilter')">Filter</a>
+				<img id="m6a7dfd2f-ti_img" src="/static/{filter_image}">
+				<img id="m6a7dfd2f-ti2_img" src="/static/tablebtn_filter.gif" onclick="sendEvent('filter')">
+				<span id="m6a7dfd2f-lb3">{counter}</span>
+				<img id="m6a7dfd2f-ti7_img" src="/static/{next_image}" source="{next_image}" onclick="sendEvent('nextpage')">
+				<img id="m6a7dfd2f-ti5_img" src="/static/tablebtn_download.gif" alt="Download" onclick="window.location.href = '/maximo/download'">
+			</td></tr>
+			<tr id="m6a7dfd2f_tbod_ttrow-tr">{"".join(header_cells)}</tr>
+			{f'<tr id="m6a7dfd2f_tbod_tfrow-tr">{"".join(filter_cells)}</tr>' if session.filter_row else ""}
+			<tbody id="m6a7dfd2f_tbod-tbd">{"".join(rows)}</tbody>
+		</table>
+	"""
+
+
+def renderExport(server: MockMaximoServer, session: MockSession):
+	""" The whole filtered list as an HTML table, like the "Download" button of Maximo produces """
+	columns = APPS[session.app]["columns"]
+
+	rows = ["<tr>" + "".join(f"<th>{html.escape(column)}</th>" for column in columns) + "</tr>"]
+	for record in filteredRecords(server, session):
+		rows.append("<tr>" + "".join(f"<td>{html.escape(record[column])}</td>" for column in columns) + "</tr>")
+
+	return f"<html><head><meta charset=\"utf-8\"></head><body><table border=\"1\">{''.join(rows)}</table></body></html>"
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=8080)
+	parser.add_argument("--latency", type=float, default=0.1, help="Seconds added to every server round trip (default: %(default)s)")
+	parser.add_argument("--records", type=int, default=500, help="Records of every application (default: %(default)s)")
+	parser.add_argument("--page-size", type=int, default=20, help="Rows of every list page (default: %(default)s)")
+	parser.add_argument("--session-timeout", type=float, default=None, help="Seconds of inactivity after which a session expires (default: never)")
+	args = parser.parse_args()
+
+	server = MockMaximoServer((args.host, args.port), args.latency, args.records, args.page_size, args.session_timeout)
+	print(f"Mock Maximo listening on {server.login_url}")
+
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
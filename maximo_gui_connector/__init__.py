@@ -5,4 +5,12 @@
 # ██║ ╚═╝ ██║██║  ██║██╔╝ ██╗██║██║ ╚═╝ ██║╚██████╔╝      ╚██████╔╝╚██████╔╝██║      ╚██████╗╚██████╔╝██║ ╚████║██║ ╚████║███████╗╚██████╗   ██║   ╚██████╔╝██║  ██║
 # ╚═╝     ╚═╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝╚═╝     ╚═╝ ╚═════╝        ╚═════╝  ╚═════╝ ╚═╝       ╚═════╝ ╚═════╝ ╚═╝  ╚═══╝╚═╝  ╚═══╝╚══════╝ ╚═════╝   ╚═╝    ╚═════╝ ╚═╝  ╚═╝
                                                                                                                                                                   
-from maximo_gui_connector.main import *
\ No newline at end of file
+from maximo_gui_connector.main import *
+from maximo_gui_connector.pool import MaximoSessionPool
+from maximo_gui_connector.query import buildWhereClause, Raw
+from maximo_gui_connector.table import ColumnarTable, RowView
+from maximo_gui_connector.instrumentation import Instrumentation
+from maximo_gui_connector.budget import CommandBudget, COMMAND_BUDGETS
+from maximo_gui_connector.sync import RecordStore, IncrementalSync
+from maximo_gui_connector.watch import ListWatcher
+from maximo_gui_connector.snapshot import DomSnapshot
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+	WebDriver round-trip budgets of the public operations, and the context manager used to enforce them
+"""
+from maximo_gui_connector.instrumentation import Instrumentation
+from maximo_gui_connector.main import MaximoBudgetExceeded
+
+
+# Maximum number of WebDriver commands each operation may send (with the default `wait_mode` "event" and no `auto_relogin`, which adds one check to every call).
+# A tuple means (fixed commands, commands for each page of the list table)
+COMMAND_BUDGETS = {
+	# Cold scan: click on the GoTo button, wait for the menu, a single harvesting script
+	"get_sections": 5,
+	# One script for every dialog on the page
+	"detectDialogs": 1,
+	# All the inputs are set by one script, plus the `waitUntilReady()` before and after (editable inputs only)
+	"setNamedInput": 4,
+	# Filter row toggle, columns metadata, one script filling all the inputs, apply and the waits in between (+ one rescan)
+	"setFilters": 16,
+	# Page counter, one harvesting script, next page button and the wait for the next page
+	"getAllRecordsFromTable": (0, 8),
+}
+
+
+class CommandBudget(object):
+	"""
+		Context manager raising `MaximoBudgetExceeded` when the code inside the block sends more WebDriver commands
+		than allowed for `operation`. The commands are counted by the instrumentation of the instance (see `config.instrumentation`):
+
+			maximo = MaximoAutomation({ "instrumentation": True })
+
+			with CommandBudget(maximo.instrumentation, "setFilters"):
+				maximo.setFilters({ "status": "APPR" })
+
+			with CommandBudget(maximo.instrumentation, "getAllRecordsFromTable") as budget:
+				rows = maximo.getAllRecordsFromTable()
+				budget.pages = math.ceil(len(rows) / 20)
+	"""
+
+	def __init__(self, instrumentation: Instrumentation, operation: str, pages: int = 1, limit: int = None):
+		"""
+		Args:
+			instrumentation (Instrumentation): The instrumentation whose driver sends the commands
+			operation (str): Name of the operation (a key of `COMMAND_BUDGETS`)
+			pages (int, optional): Pages of the list table read inside the block (only for per-page budgets). It can be updated inside the block. Defaults to 1.
+			limit (int, optional): Use this limit instead of the one in `COMMAND_BUDGETS`. Defaults to None.
+		"""
+		if instrumentation is None:
+			raise ValueError("Command budgets need the instrumentation to be enabled (see `config.instrumentation`)")
+
+		if limit is None and operation not in COMMAND_BUDGETS:
+			raise ValueError(f"No budget defined for operation '{operation}'. Available: {list(COMMAND_BUDGETS.keys())}")
+
+		self.instrumentation = instrumentation
+		self.operation = operation
+		self.pages = pages
+		self.used = None
+		self.commands = None
+
+		self.__limit = limit
+		self.__counting = None
+
+	@property
+	def limit(self):
+		""" Maximum number of commands allowed """
+		if self.__limit is not None:
+			return self.__limit
+
+		budget = COMMAND_BUDGETS[self.operation]
+		return budget[0] + budget[1] * self.pages if isinstance(budget, tuple) else budget
+
+	def __enter__(self):
+		self.__counting = self.instrumentation.countCommands()
+		self.commands = self.__counting.__enter__()
+
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.__counting.__exit__(exc_type, exc_value, traceback)
+		self.used = sum(self.commands.values())
+
+		# Don't hide the error raised by the operation itself
+		if exc_type is not None:
+			return False
+
+		if self.used > self.limit:
+			raise MaximoBudgetExceeded(
+				f"'{self.operation}' sent {self.used} WebDriver commands, but its budget is {self.limit}: {dict(self.commands)}",
+				operation=self.operation, used=self.used, limit=self.limit
+			)
+
+		return False
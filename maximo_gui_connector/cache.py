@@ -0,0 +1,251 @@
+"""
+	Small caches used to avoid reading the Maximo UI again: persistent ones (surviving the process) and in-memory ones
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+try:
+	import fcntl
+except ImportError:
+	# Windows
+	fcntl = None
+	import msvcrt
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def getDefaultCacheDir():
+	"""Returns the directory where the caches are stored by default:
+		- Windows:	%LOCALAPPDATA%\\maximo_gui_connector
+		- Others:	$XDG_CACHE_HOME/maximo_gui_connector (or ~/.cache/maximo_gui_connector)
+
+	Returns:
+		str: The path of the directory (it may not exist yet)
+	"""
+	if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+		base_dir = os.environ["LOCALAPPDATA"]
+	else:
+		base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+	return os.path.join(base_dir, "maximo_gui_connector")
+
+
+class _FileLock(object):
+	"""
+		Exclusive lock shared between processes, held on a side file (`<path>.lock`)
+	"""
+
+	def __init__(self, path: str):
+		self.path = path + ".lock"
+		self.__file = None
+
+	def __enter__(self):
+		os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+		self.__file = open(self.path, "a+")
+
+		if fcntl:
+			fcntl.flock(self.__file.fileno(), fcntl.LOCK_EX)
+		else:
+			self.__file.seek(0)
+			msvcrt.locking(self.__file.fileno(), msvcrt.LK_LOCK, 1)
+
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		try:
+			if fcntl:
+				fcntl.flock(self.__file.fileno(), fcntl.LOCK_UN)
+			else:
+				self.__file.seek(0)
+				msvcrt.locking(self.__file.fileno(), msvcrt.LK_UNLCK, 1)
+		finally:
+			self.__file.close()
+			self.__file = None
+
+
+class FileCache(object):
+	"""
+		Key/value store saved as a JSON file, where every entry expires after `ttl` seconds.
+		Updates are serialized between processes (ex. the sessions of a pool or the daemon) with a lock file.
+	"""
+
+	def __init__(self, path: str, ttl: float = None):
+		"""
+		Args:
+			path (str): Path of the JSON file. The parent directories are created when needed.
+			ttl (float, optional): Seconds after which an entry is considered expired. Defaults to None (never expires).
+		"""
+		self.path = path
+		self.ttl = ttl
+
+		self.__lock = threading.Lock()
+
+	def __read(self):
+		try:
+			with open(self.path, "r", encoding="utf-8") as f:
+				data = json.load(f)
+
+			return data if isinstance(data, dict) else {}
+
+		except FileNotFoundError:
+			return {}
+
+		except (OSError, ValueError) as e:
+			logger.warning(f"Cache file '{self.path}' is not readable and will be ignored: {e}")
+			return {}
+
+	def __write(self, data: dict):
+		directory = os.path.dirname(os.path.abspath(self.path))
+		os.makedirs(directory, exist_ok=True)
+
+		# Write to a temporary file and then replace the old one, so that a concurrent reader never sees half a file
+		fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+		try:
+			with os.fdopen(fd, "w", encoding="utf-8") as f:
+				json.dump(data, f)
+
+			os.chmod(tmp_path, 0o600)
+			os.replace(tmp_path, self.path)
+		except Exception:
+			try:
+				os.remove(tmp_path)
+			except OSError:
+				pass
+
+			raise
+
+	def get(self, key: str, default = None):
+		"""Returns the value stored for `key`, or `default` if not present or expired
+
+		Args:
+			key (str): The entry key
+			default (any, optional): Value returned when the entry is missing. Defaults to None.
+		"""
+		with self.__lock:
+			entry = self.__read().get(key)
+
+		if not entry:
+			return default
+
+		if self.ttl is not None and time.time() - entry["time"] > self.ttl:
+			logger.debug(f"Cache entry '{key}' of '{self.path}' has expired")
+			return default
+
+		return entry["value"]
+
+	def set(self, key: str, value):
+		"""Stores `value` (must be JSON serializable) for `key`
+
+		Args:
+			key (str): The entry key
+			value (any): The value to store
+		"""
+		with self.__lock:
+			try:
+				# Read and write under the same lock, so that the updates of other processes are not lost
+				with _FileLock(self.path):
+					data = self.__read()
+					data[key] = { "time": time.time(), "value": value }
+
+					self.__write(data)
+			except OSError as e:
+				logger.warning(f"Could not save cache file '{self.path}': {e}")
+
+	def invalidate(self, key: str = None):
+		"""Removes an entry, or every entry if `key` is not given
+
+		Args:
+			key (str, optional): The entry key. Defaults to None.
+		"""
+		with self.__lock:
+			try:
+				with _FileLock(self.path):
+					data = self.__read()
+
+					if key is None:
+						data = {}
+					elif key in data:
+						del data[key]
+					else:
+						return
+
+					self.__write(data)
+			except OSError as e:
+				logger.warning(f"Could not save cache file '{self.path}': {e}")
+
+
+class RecordDetailCache(object):
+	"""
+		In-memory cache of the fields read from the detail view of the records, keyed by (record ID, field label).
+		Entries expire after `ttl` seconds and the least recently used ones are evicted beyond `max_entries`.
+	"""
+
+	def __init__(self, ttl: float = 60, max_entries: int = 1000):
+		"""
+		Args:
+			ttl (float, optional): Seconds after which an entry is considered expired. Defaults to 60.
+			max_entries (int, optional): Max number of fields kept. Defaults to 1000.
+		"""
+		self.ttl = ttl
+		self.max_entries = max_entries
+
+		self.hits = 0
+		self.misses = 0
+
+		self.__lock = threading.Lock()
+		self.__entries = OrderedDict()
+
+	def get(self, record_id: str, label: str):
+		"""
+		Returns:
+			tuple: (True, value) if the field is cached, (False, None) otherwise
+		"""
+		key = (record_id, label)
+
+		with self.__lock:
+			entry = self.__entries.get(key)
+
+			if entry is None or time.time() - entry[1] > self.ttl:
+				if entry is not None: 
+					del self.__entries[key]
+
+				self.misses += 1
+				return False, None
+
+			self.__entries.move_to_end(key)
+			self.hits += 1
+
+			return True, entry[0]
+
+	def set(self, record_id: str, label: str, value):
+		key = (record_id, label)
+
+		with self.__lock:
+			self.__entries[key] = (value, time.time())
+			self.__entries.move_to_end(key)
+
+			while len(self.__entries) > self.max_entries:
+				self.__entries.popitem(last=False)
+
+	def invalidate(self, record_id: str = None):
+		"""Removes the fields of a record, or of every record if `record_id` is not given
+
+		Args:
+			record_id (str, optional): The record ID. Defaults to None.
+		"""
+		with self.__lock:
+			if record_id is None:
+				self.__entries.clear()
+				return
+
+			for key in [key for key in self.__entries if key[0] == record_id]:
+				del self.__entries[key]
+
+	def __len__(self):
+		return len(self.__entries)
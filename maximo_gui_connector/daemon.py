@@ -0,0 +1,362 @@
+"""
+	Long-lived process keeping a pool of logged-in Maximo sessions warm, and exposing the library operations
+	through a local HTTP API (on a TCP port bound to localhost or on a Unix socket).
+
+	Start it with the credentials in the environment:
+
+		MAXIMO_USERNAME=... MAXIMO_PASSWORD=... MAXIMO_DAEMON_TOKEN=... maximo-gui-daemon --port 8765 --sessions 2 --headless
+
+	Any local user can connect to a TCP port, so a token is required there (a Unix socket is accessible only by its owner).
+	Then send the steps to run (in order, on the same session) to `POST /run`:
+
+		curl -s localhost:8765/run -H "Authorization: Bearer $MAXIMO_DAEMON_TOKEN" -d '{ "steps": [
+			{ "op": "goto_section", "args": ["changes"] },
+			{ "op": "setFilters", "args": [{ "status": "APPR" }] },
+			{ "op": "getAllRecordsFromTable", "kwargs": { "columns": ["Change", "Status"] } }
+		] }'
+
+	The response contains the result of every step: { "results": [...] }.
+	Other endpoints: `GET /health` and `GET /metrics` (Prometheus format, needs `--instrumentation`).
+"""
+import argparse
+import datetime
+import hmac
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler
+
+from maximo_gui_connector.instrumentation import Instrumentation
+from maximo_gui_connector.main import MaximoError
+from maximo_gui_connector.pool import MaximoSessionPool
+from maximo_gui_connector.table import ColumnarTable
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Operations that can be requested through the API (anything else is rejected)
+ALLOWED_OPERATIONS = (
+	"goto_section",
+	"goto_tab",
+	"get_sections",
+	"getCurrentSection",
+	"getAvailableFiltersInListView",
+	"setFilters",
+	"quickSearch",
+	"getRecordFields",
+	"bulkLookup",
+	"advancedSearch",
+	"whereClauseSearch",
+	"getTableHeaders",
+	"getTableRowsAll",
+	"getAllRecordsFromTable",
+	"exportTable",
+	"setNamedInput",
+	"handleIfComingFromDetail",
+	"checkUpdateError",
+	"routeWorkflowDialog.openDialog",
+	"routeWorkflowDialog.closeDialog",
+	"routeWorkflowDialog.getStatus",
+	"routeWorkflowDialog.setStatus",
+	"routeWorkflowDialog.clickRouteWorkflow",
+)
+
+
+def _jsonDefault(value):
+	if isinstance(value, ColumnarTable):
+		return value.toRecords()
+
+	if isinstance(value, (datetime.date, datetime.datetime)):
+		return value.isoformat()
+
+	# Browser elements and the objects returned by chainable methods have no meaning outside of the process
+	return None
+
+
+def _isSocket(path: str):
+	""" Returns True if `path` exists and is a Unix socket (symbolic links are not followed) """
+	try:
+		return stat.S_ISSOCK(os.lstat(path).st_mode)
+	except FileNotFoundError:
+		return False
+
+
+def runSteps(maximo, steps: list):
+	"""Runs the steps, in order, on a session
+
+	Args:
+		maximo (MaximoAutomation): The session
+		steps (list): List of { "op": name, "args": [...], "kwargs": {...} }
+
+	Returns:
+		list: The result of every step
+	"""
+	results = []
+
+	for step in steps:
+		target = maximo
+		for attribute in step["op"].split("."):
+			target = getattr(target, attribute)
+
+		results.append(target(*step.get("args", []), **step.get("kwargs", {})))
+
+	return results
+
+
+def validateSteps(steps):
+	"""
+	Raises:
+		ValueError: If the steps are malformed or contain an operation that is not allowed
+	"""
+	if not isinstance(steps, list) or not steps:
+		raise ValueError("'steps' must be a non-empty list")
+
+	for index, step in enumerate(steps):
+		if not isinstance(step, dict) or not isinstance(step.get("op"), str):
+			raise ValueError(f"Step {index} must be an object with an 'op' string")
+
+		if step["op"] not in ALLOWED_OPERATIONS:
+			raise ValueError(f"Operation '{step['op']}' is not allowed. Allowed operations: {list(ALLOWED_OPERATIONS)}")
+
+		if not isinstance(step.get("args", []), list) or not isinstance(step.get("kwargs", {}), dict):
+			raise ValueError(f"Step {index}: 'args' must be a list and 'kwargs' an object")
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+	server: "MaximoDaemon"
+
+	def log_message(self, format, *args):
+		logger.debug("%s - %s" % (self.address_string(), format % args))
+
+	def address_string(self):
+		# Unix socket clients have no address
+		return self.client_address[0] if isinstance(self.client_address, tuple) and self.client_address else "unix"
+
+	def sendJSON(self, status: int, body):
+		data = json.dumps(body, default=_jsonDefault).encode("utf-8")
+
+		self.send_response(status)
+		self.send_header("Content-Type", "application/json")
+		self.send_header("Content-Length", str(len(data)))
+		self.end_headers()
+
+		self.wfile.write(data)
+
+	def isAuthorized(self):
+		token = self.server.token
+		# Constant-time comparison, so that the token can't be guessed from the response times
+		return not token or hmac.compare_digest(self.headers.get("Authorization", "").encode("utf-8"), f"Bearer {token}".encode("utf-8"))
+
+	def do_GET(self):
+		if not self.isAuthorized():
+			return self.sendJSON(401, { "error": "Unauthorized" })
+
+		if self.path == "/health":
+			return self.sendJSON(200, { "status": "ok", "sessions": self.server.pool.size, "pending": self.server.pending })
+
+		if self.path == "/metrics":
+			instrumentation = self.server.instrumentation
+			if instrumentation is None:
+				return self.sendJSON(404, { "error": "Instrumentation is not enabled" })
+
+			data = instrumentation.toPrometheus().encode("utf-8")
+
+			self.send_response(200)
+			self.send_header("Content-Type", "text/plain; version=0.0.4")
+			self.send_header("Content-Length", str(len(data)))
+			self.end_headers()
+
+			return self.wfile.write(data)
+
+		self.sendJSON(404, { "error": "Not found" })
+
+	def do_POST(self):
+		if not self.isAuthorized():
+			return self.sendJSON(401, { "error": "Unauthorized" })
+
+		if self.path != "/run":
+			return self.sendJSON(404, { "error": "Not found" })
+
+		try:
+			request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0) or 0)) or b"{}")
+			steps = request.get("steps")
+			validateSteps(steps)
+		except (ValueError, AttributeError) as e:
+			return self.sendJSON(400, { "error": str(e) })
+
+		status, body = self.server.run(steps, request.get("timeout"))
+		self.sendJSON(status, body)
+
+
+class MaximoDaemon(socketserver.ThreadingMixIn, socketserver.TCPServer):
+	"""
+		HTTP server running the requested steps on the sessions of a `MaximoSessionPool`.
+		Requests wait in the pool queue until a session is free.
+	"""
+	daemon_threads = True
+	allow_reuse_address = True
+
+	def __init__(self, pool: MaximoSessionPool, address = ("127.0.0.1", 8765), token: str = None, max_pending: int = 100):
+		"""
+		Args:
+			pool (MaximoSessionPool): The sessions used to run the requests
+			address (tuple|str, optional): (host, port) to listen on, or the path of a Unix socket. Defaults to ("127.0.0.1", 8765).
+			token (str, optional): If set, every request must have the header "Authorization: Bearer <token>". Defaults to None (strongly discouraged on a TCP port).
+			max_pending (int, optional): Requests that can wait for a session; the next ones are rejected with 503. Defaults to 100.
+
+		Raises:
+			MaximoError: If `address` is a path that exists and is not a socket (it is never deleted)
+		"""
+		self.pool = pool
+		self.token = token
+		# Only an instance shared by all the sessions can be exported
+		instrumentation = pool.config.get("instrumentation")
+		self.instrumentation = instrumentation if isinstance(instrumentation, Instrumentation) else None
+
+		self.pending = 0
+		self.max_pending = max_pending
+		self.__pending_lock = threading.Lock()
+
+		if isinstance(address, str):
+			self.address_family = socket.AF_UNIX
+			# Only a socket left by a previous run is removed: any other file at that path is a configuration error
+			if _isSocket(address):
+				os.remove(address)
+			elif os.path.lexists(address):
+				raise MaximoError(f"'{address}' already exists and is not a socket")
+
+		elif not token:
+			logger.warning("!!! No token set: ANY local user can run operations with the logged in Maximo sessions. Set a token or use a Unix socket !!!")
+
+		super().__init__(address, DaemonRequestHandler)
+
+	def server_bind(self):
+		if self.address_family != socket.AF_UNIX:
+			return super().server_bind()
+
+		# Only the owner can talk to the logged in sessions. The socket is created with the right permissions,
+		# since a `chmod()` after `bind()` would leave a window where any user can connect
+		old_umask = os.umask(0o177)
+		try:
+			super().server_bind()
+		finally:
+			os.umask(old_umask)
+
+	def run(self, steps: list, timeout: float = None):
+		"""Runs the steps on the first free session
+
+		Returns:
+			tuple: The HTTP status and the response body
+		"""
+		with self.__pending_lock:
+			if self.pending >= self.max_pending:
+				return 503, { "error": f"Too many pending requests ({self.pending})" }
+
+			self.pending += 1
+
+		try:
+			future = self.pool.submit(runSteps, steps)
+			return 200, { "results": future.result(timeout=timeout) }
+
+		except FutureTimeoutError:
+			# The steps keep running on their session: only the caller stops waiting
+			return 504, { "error": f"The steps did not complete within {timeout} seconds" }
+
+		except Exception as e:
+			logger.exception(f"Error while running steps {[step['op'] for step in steps]}")
+			return 500, { "error": str(e), "type": type(e).__name__ }
+
+		finally:
+			with self.__pending_lock:
+				self.pending -= 1
+
+
+def main(argv: list = None):
+	"""
+		Command line entry point (`maximo-gui-daemon`). The credentials are read from the environment variables
+		MAXIMO_USERNAME and MAXIMO_PASSWORD, the API token from MAXIMO_DAEMON_TOKEN (required on a TCP port, unless `--no-token` is passed).
+	"""
+	parser = argparse.ArgumentParser(description="Keeps Maximo sessions warm and exposes the library operations through a local HTTP API")
+	parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: %(default)s)")
+	parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: %(default)s)")
+	parser.add_argument("--socket", metavar="PATH", help="Listen on this Unix socket instead of a TCP port")
+	parser.add_argument("--sessions", type=int, default=1, help="Number of Maximo sessions to keep open (default: %(default)s)")
+	parser.add_argument("--login-url", help="URL of the Maximo login page")
+	parser.add_argument("--config", metavar="PATH", help="JSON file with the MaximoAutomation configuration")
+	parser.add_argument("--headless", action="store_true", help="Start the browsers in headless mode")
+	parser.add_argument("--instrumentation", action="store_true", help="Record timings and WebDriver commands (exposed on /metrics)")
+	parser.add_argument("--keepalive", type=float, metavar="SECONDS", help="Seconds of inactivity after which the sessions are kept alive, 0 to disable (default: the configuration's keepalive_interval, or 300)")
+	parser.add_argument("--max-pending", type=int, default=100, help="Requests that can wait for a free session (default: %(default)s)")
+	parser.add_argument("--no-token", action="store_true", help="Accept requests without a token on a TCP port (any local user can use the sessions)")
+	args = parser.parse_args(argv)
+
+	username = os.environ.get("MAXIMO_USERNAME")
+	password = os.environ.get("MAXIMO_PASSWORD")
+	if not username or not password:
+		parser.error("Set the MAXIMO_USERNAME and MAXIMO_PASSWORD environment variables")
+
+	if args.socket and os.path.lexists(args.socket) and not _isSocket(args.socket):
+		parser.error(f"'{args.socket}' already exists and is not a socket")
+
+	token = os.environ.get("MAXIMO_DAEMON_TOKEN")
+	if not token and not args.socket and not args.no_token:
+		parser.error("Set the MAXIMO_DAEMON_TOKEN environment variable (or pass --no-token) to listen on a TCP port")
+
+	config = {}
+	if args.config:
+		with open(args.config) as f:
+			config = json.load(f)
+
+	if args.headless: config["headless"] = True
+
+	# The sessions must survive the idle time between requests
+	if args.keepalive is not None:
+		config["keepalive_interval"] = args.keepalive or None
+	else:
+		config.setdefault("keepalive_interval", 300)
+
+	config.setdefault("auto_relogin", True)
+
+	if args.instrumentation:
+		# Shared by all the sessions, so that /metrics reports all of them
+		config["instrumentation"] = Instrumentation()
+
+	logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+	try:
+		pool = MaximoSessionPool(args.sessions, username, password, config=config, login_url=args.login_url)
+	except MaximoError as e:
+		logger.critical(f"Could not start the sessions: {e}")
+		sys.exit(1)
+
+	server = MaximoDaemon(pool, args.socket or (args.host, args.port), token=token, max_pending=args.max_pending)
+
+	def shutdown(signum, frame):
+		# `shutdown()` blocks until `serve_forever()` returns, so it can't run in the serving thread
+		threading.Thread(target=server.shutdown).start()
+
+	signal.signal(signal.SIGTERM, shutdown)
+
+	logger.info(f"Listening on {args.socket or f'http://{args.host}:{args.port}'}")
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+		if args.socket and _isSocket(args.socket):
+			os.remove(args.socket)
+
+		pool.close()
+
+
+if __name__ == "__main__":
+	main()
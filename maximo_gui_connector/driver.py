@@ -0,0 +1,101 @@
+"""
+	Resolution of the chromedriver executable, cached by the version of the local Chrome installation
+"""
+import logging
+import os
+import re
+import subprocess
+import sys
+
+from maximo_gui_connector.cache import FileCache
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+# Commands that print the version of the local Chrome installation, for each platform
+CHROME_VERSION_COMMANDS = {
+	"win32": [
+		["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+		["reg", "query", r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon", "/v", "version"],
+	],
+	"darwin": [
+		["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+		["/Applications/Chromium.app/Contents/MacOS/Chromium", "--version"],
+	],
+	"linux": [
+		["google-chrome", "--version"],
+		["google-chrome-stable", "--version"],
+		["chromium", "--version"],
+		["chromium-browser", "--version"],
+	],
+}
+
+
+def getChromeVersion():
+	"""Returns the version of the Chrome browser installed on this machine, without any network access
+
+	Returns:
+		str: The full version (ex. "120.0.6099.109"), or None if Chrome could not be found
+	"""
+	platform = "linux" if sys.platform.startswith("linux") else sys.platform
+
+	for command in CHROME_VERSION_COMMANDS.get(platform, []):
+		try:
+			output = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10).stdout.decode(errors="ignore")
+		except (OSError, subprocess.SubprocessError):
+			continue
+
+		regex_result = re.search(r"([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)", output)
+		if regex_result:
+			return regex_result.group(1)
+
+	return None
+
+
+def resolveChromeDriver(cache_dir: str = None, driver_path: str = None, offline: bool = False):
+	"""Returns the path of the chromedriver to use, calling `ChromeDriverManager().install()` (version
+	lookup and download) only when no driver has already been resolved for the installed Chrome version
+
+	Args:
+		cache_dir (str, optional): Directory where the resolved paths are remembered. Defaults to None (no cache).
+		driver_path (str, optional): Pinned chromedriver path, used as it is. Defaults to None.
+		offline (bool, optional): Never access the network. Defaults to False.
+
+	Returns:
+		str: The path of the chromedriver executable, or None if it can't be resolved offline
+	"""
+	if driver_path:
+		if not os.path.isfile(driver_path):
+			logger.error(f"Pinned chromedriver '{driver_path}' does not exist")
+			return None
+
+		return driver_path
+
+	cache = FileCache(os.path.join(cache_dir, "chromedriver.json")) if cache_dir else None
+
+	# The version is only the key of the cache: don't spawn the browser process if there is no cache
+	chrome_version = getChromeVersion() if cache else None
+
+	if cache and chrome_version:
+		cached_path = cache.get(chrome_version)
+
+		if cached_path and os.path.isfile(cached_path):
+			logger.debug(f"Using cached chromedriver for Chrome {chrome_version}: {cached_path}")
+			return cached_path
+
+	if offline:
+		if cache is None:
+			logger.error("No chromedriver available offline: a cache directory is needed to remember the one resolved online")
+		else:
+			logger.error(f"No chromedriver available offline for Chrome {chrome_version or '(version not detected)'}")
+		return None
+
+	from webdriver_manager.chrome import ChromeDriverManager
+
+	resolved_path = ChromeDriverManager().install()
+
+	if cache and chrome_version:
+		cache.set(chrome_version, resolved_path)
+
+	return resolved_path
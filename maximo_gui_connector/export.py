@@ -0,0 +1,123 @@
+"""
+	Streaming parsers for the files produced by the "Download" button of the Maximo list tables
+"""
+import csv
+import re
+from html.parser import HTMLParser
+
+from maximo_gui_connector.table import ColumnarTable
+
+
+# Size of the chunks read from the file
+CHUNK_SIZE = 64 * 1024
+
+# Partial files written by the browsers while a download is in progress
+PARTIAL_DOWNLOAD_SUFFIXES = (".crdownload", ".part", ".tmp")
+
+
+class _TableRowsParser(HTMLParser):
+	"""
+		Collects the rows of the HTML tables fed so far (Maximo exports the list as an HTML table saved with the .xls extension)
+	"""
+
+	def __init__(self):
+		super().__init__(convert_charrefs=True)
+
+		self.rows = []
+		self.__row = None
+		self.__cell = None
+
+	def handle_starttag(self, tag, attrs):
+		if tag == "tr":
+			self.__row = []
+		elif tag in ("td", "th") and self.__row is not None:
+			self.__cell = []
+		elif tag == "br" and self.__cell is not None:
+			self.__cell.append(" ")
+
+	def handle_endtag(self, tag):
+		if tag in ("td", "th") and self.__cell is not None:
+			self.__row.append(re.sub(r"\s+", " ", "".join(self.__cell)).strip())
+			self.__cell = None
+		elif tag == "tr" and self.__row is not None:
+			if self.__row: self.rows.append(self.__row)
+			self.__row = None
+
+	def handle_data(self, data):
+		if self.__cell is not None:
+			self.__cell.append(data)
+
+
+def _iterHtmlRows(f):
+	parser = _TableRowsParser()
+
+	while True:
+		chunk = f.read(CHUNK_SIZE)
+		if not chunk: break
+
+		parser.feed(chunk)
+
+		# Hand out the completed rows, so that only the current chunk is kept in memory
+		yield from parser.rows
+		parser.rows = []
+
+	parser.close()
+	yield from parser.rows
+
+
+def iterExportRows(path: str, encoding: str = "utf-8-sig"):
+	"""Reads an exported file row by row. Both HTML tables (the default format of Maximo) and CSV files are supported.
+
+	Args:
+		path (str): Path of the file
+		encoding (str, optional): Encoding of the file. Defaults to "utf-8-sig".
+
+	Yields:
+		list: The cells of each row (the first one contains the headers)
+	"""
+	with open(path, "r", encoding=encoding, errors="replace", newline="") as f:
+		start = f.read(CHUNK_SIZE)
+		f.seek(0)
+
+		if start.lstrip().startswith("<"):
+			yield from _iterHtmlRows(f)
+			return
+
+		try:
+			dialect = csv.Sniffer().sniff(start, delimiters=",;\t")
+		except csv.Error:
+			dialect = csv.excel
+
+		for row in csv.reader(f, dialect):
+			if row: yield [cell.strip() for cell in row]
+
+
+def parseExport(path: str, columns: list = None, columnar: bool = False, encoding: str = "utf-8-sig"):
+	"""Parses an exported file into the same structure returned by `MaximoAutomation.getAllRecordsFromTable()`
+
+	Args:
+		path (str): Path of the file
+		columns (list, optional): Names of the columns to return (Case Insensitive). Defaults to None (all the columns).
+		columnar (bool, optional): Return a `ColumnarTable` instead of a list of dictionaries. Defaults to False.
+		encoding (str, optional): Encoding of the file. Defaults to "utf-8-sig".
+
+	Returns:
+		list|ColumnarTable: List of { "data": { header: value }, "element_id": "" } (rows of an export have no element in the page), or the same rows as a `ColumnarTable`
+	"""
+	rows = iterExportRows(path, encoding)
+
+	headers = next(rows, None)
+	if headers is None:
+		return ColumnarTable([]) if columnar else []
+
+	wanted = set(column.strip().lower() for column in columns) if columns else None
+	indexes = [(index, header) for index, header in enumerate(headers) if header and (wanted is None or header.lower() in wanted)]
+
+	if columnar:
+		table = ColumnarTable([header for index, header in indexes])
+		for row in rows:
+			table.append([row[index] if index < len(row) else "" for index, header in indexes])
+
+		return table
+
+	return [{ "data": { header: row[index] for index, header in indexes if index < len(row) }, "element_id": "" } for row in rows]
@@ -0,0 +1,258 @@
+"""
+	Per-operation timings and WebDriver round-trip counters, exportable as JSON or Prometheus text format
+"""
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+# Upper bounds (in seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Operations whose duration is accounted as "wait time" of the operations calling them
+WAIT_OPERATIONS = ("waitUntilReady",)
+
+
+def isScriptCommand(command: str):
+	""" Whether a WebDriver command executes JavaScript (ex. "executeScript", "w3cExecuteScriptAsync") """
+	command = command.lower()
+	return "execute" in command and "script" in command
+
+
+class Histogram(object):
+	__slots__ = ("buckets", "counts", "count", "sum", "min", "max")
+
+	def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+		self.buckets = tuple(buckets)
+		self.counts = [0] * len(self.buckets)
+		self.count = 0
+		self.sum = 0.0
+		self.min = None
+		self.max = None
+
+	def observe(self, value: float):
+		self.count += 1
+		self.sum += value
+		self.min = value if self.min is None else min(self.min, value)
+		self.max = value if self.max is None else max(self.max, value)
+
+		for index, bound in enumerate(self.buckets):
+			if value <= bound:
+				self.counts[index] += 1
+				break
+
+	def toDict(self):
+		return {
+			"count": self.count,
+			"sum": self.sum,
+			"min": self.min,
+			"max": self.max,
+			"avg": self.sum / self.count if self.count else None,
+			"buckets": { str(bound): count for bound, count in zip(self.buckets, self.counts) },
+		}
+
+
+class OperationStats(object):
+	"""
+		Aggregated statistics of one operation (ex. "setFilters"). Counters are inclusive of the nested operations.
+	"""
+	__slots__ = ("latency", "commands", "wait_time", "sleep_time")
+
+	def __init__(self, buckets: tuple):
+		self.latency = Histogram(buckets)
+		self.commands = Counter()
+		self.wait_time = 0.0
+		self.sleep_time = 0.0
+
+	def toDict(self):
+		return {
+			"latency": self.latency.toDict(),
+			"commands": sum(self.commands.values()),
+			"scripts": sum(count for command, count in self.commands.items() if isScriptCommand(command)),
+			"commands_by_type": dict(self.commands),
+			"wait_time": self.wait_time,
+			"sleep_time": self.sleep_time,
+		}
+
+
+class _Frame(object):
+	__slots__ = ("name", "commands", "wait_time", "sleep_time")
+
+	def __init__(self, name: str):
+		self.name = name
+		self.commands = Counter()
+		self.wait_time = 0.0
+		self.sleep_time = 0.0
+
+
+class Instrumentation(object):
+	"""
+		Records, for every instrumented operation of `MaximoAutomation`:
+			- a latency histogram
+			- the WebDriver commands (and how many of them are `execute_script` calls) sent while running it
+			- the time spent inside `waitUntilReady()` and in fixed sleeps
+
+		The same instance can be shared between more `MaximoAutomation` instances (ex. the sessions of a pool).
+	"""
+
+	def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+		self.buckets = tuple(buckets)
+
+		self.__lock = threading.Lock()
+		self.__local = threading.local()
+		self.__stats = {}
+
+	def __stack(self):
+		if not hasattr(self.__local, "stack"):
+			self.__local.stack = []
+
+		return self.__local.stack
+
+	def wrapDriver(self, driver):
+		"""Counts every command sent through the WebDriver (including the ones sent by its elements)
+
+		Args:
+			driver (WebDriver): The Selenium WebDriver instance
+
+		Returns:
+			WebDriver: The same instance
+		"""
+		if getattr(driver, "_maximo_instrumentation", None) is self:
+			return driver
+
+		original_execute = driver.execute
+
+		def execute(driver_command, params = None):
+			self.recordCommand(driver_command)
+			return original_execute(driver_command, params)
+
+		driver.execute = execute
+		driver._maximo_instrumentation = self
+
+		return driver
+
+	@contextmanager
+	def measure(self, name: str):
+		"""Measures the operation running inside the `with` block
+
+		Args:
+			name (str): Name of the operation (ex. "setFilters")
+		"""
+		stack = self.__stack()
+		frame = _Frame(name)
+
+		stack.append(frame)
+		start = time.perf_counter()
+		try:
+			yield frame
+		finally:
+			duration = time.perf_counter() - start
+			stack.pop()
+
+			if name in WAIT_OPERATIONS:
+				for outer_frame in stack:
+					outer_frame.wait_time += duration
+
+			with self.__lock:
+				if name not in self.__stats:
+					self.__stats[name] = OperationStats(self.buckets)
+
+				stats = self.__stats[name]
+				stats.latency.observe(duration)
+				stats.commands.update(frame.commands)
+				stats.wait_time += frame.wait_time + (duration if name in WAIT_OPERATIONS else 0)
+				stats.sleep_time += frame.sleep_time
+
+	@contextmanager
+	def countCommands(self):
+		"""Counts the WebDriver commands sent inside the `with` block, without recording any statistic
+
+			with instrumentation.countCommands() as commands:
+				maximo.setFilters({ "status": "APPR" })
+
+			print(sum(commands.values()))
+
+		Yields:
+			Counter: The commands sent so far, by command name (updated while the block runs)
+		"""
+		stack = self.__stack()
+		frame = _Frame(None)
+
+		stack.append(frame)
+		try:
+			yield frame.commands
+		finally:
+			stack.remove(frame)
+
+	def recordCommand(self, command: str):
+		""" Accounts a WebDriver command to every operation currently running """
+		for frame in self.__stack():
+			frame.commands[command] += 1
+
+	def recordSleep(self, seconds: float):
+		""" Accounts a fixed sleep to every operation currently running """
+		for frame in self.__stack():
+			frame.sleep_time += seconds
+
+	def reset(self):
+		""" Discards everything recorded so far """
+		with self.__lock:
+			self.__stats = {}
+
+	def toDict(self):
+		"""
+		Returns:
+			dict: The statistics of every operation, by operation name
+		"""
+		with self.__lock:
+			return { name: stats.toDict() for name, stats in sorted(self.__stats.items()) }
+
+	def toJSON(self, **kwargs):
+		"""
+		Returns:
+			str: The statistics as JSON (`kwargs` are passed to `json.dumps`)
+		"""
+		return json.dumps(self.toDict(), **kwargs)
+
+	def toPrometheus(self, prefix: str = "maximo"):
+		"""Returns the statistics in the Prometheus text exposition format
+
+		Args:
+			prefix (str, optional): Prefix of the metric names. Defaults to "maximo".
+
+		Returns:
+			str: The metrics
+		"""
+		with self.__lock:
+			stats = sorted(self.__stats.items())
+
+			lines = [
+				f"# HELP {prefix}_operation_duration_seconds Duration of the library operations",
+				f"# TYPE {prefix}_operation_duration_seconds histogram",
+			]
+			for name, operation in stats:
+				cumulative = 0
+				for bound, count in zip(operation.latency.buckets, operation.latency.counts):
+					cumulative += count
+					lines.append(f'{prefix}_operation_duration_seconds_bucket{{operation="{name}",le="{bound}"}} {cumulative}')
+
+				lines.append(f'{prefix}_operation_duration_seconds_bucket{{operation="{name}",le="+Inf"}} {operation.latency.count}')
+				lines.append(f'{prefix}_operation_duration_seconds_sum{{operation="{name}"}} {operation.latency.sum}')
+				lines.append(f'{prefix}_operation_duration_seconds_count{{operation="{name}"}} {operation.latency.count}')
+
+			counters = [
+				("webdriver_commands_total", "WebDriver commands sent by the operations", lambda op: sum(op.commands.values())),
+				("webdriver_scripts_total", "execute_script calls sent by the operations", lambda op: sum(count for command, count in op.commands.items() if isScriptCommand(command))),
+				("wait_seconds_total", "Time spent by the operations waiting for Maximo to be ready", lambda op: op.wait_time),
+				("sleep_seconds_total", "Time spent by the operations in fixed sleeps", lambda op: op.sleep_time),
+			]
+			for metric, description, getter in counters:
+				lines.append(f"# HELP {prefix}_{metric} {description}")
+				lines.append(f"# TYPE {prefix}_{metric} counter")
+
+				for name, operation in stats:
+					lines.append(f'{prefix}_{metric}{{operation="{name}"}} {getter(operation)}')
+
+		return "\n".join(lines) + "\n"
@@ -4,24 +4,36 @@
 import time
 import re
 import logging
+import functools
 import os
+import fnmatch
+import shutil
+import tempfile
+import threading
 
 import selenium
 from selenium import webdriver
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver import ActionChains
 
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
-
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 # Just for Debug
 import json
 
+from urllib.parse import urlparse
+
+from maximo_gui_connector.cache import FileCache, RecordDetailCache, getDefaultCacheDir
+from maximo_gui_connector.driver import resolveChromeDriver
+from maximo_gui_connector.query import buildWhereClause
+from maximo_gui_connector.table import ColumnarTable
+from maximo_gui_connector.instrumentation import Instrumentation
+from maximo_gui_connector.export import parseExport, PARTIAL_DOWNLOAD_SUFFIXES
+from maximo_gui_connector.watch import ListWatcher
+from maximo_gui_connector.snapshot import DomSnapshot, JS_DOM_SNAPSHOT
+
 # import maximo_gui_connector.constants as constants
 
 # cSpell:includeRegExp #.*
@@ -48,6 +60,107 @@ https://blog.muya.co.ke/configuring-multiple-loggers-python/
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# ----------------------------------------------------------------------------------------------------
+# 
+#											JavaScript Snippets 
+# 
+# ----------------------------------------------------------------------------------------------------
+"""
+Functions shared by more injected scripts. Prepend them to the script that needs them.
+"""
+
+# Sets the value of a Maximo input firing the same events a user would (so that Maximo sends the new value to the server)
+JS_SET_INPUT_VALUE = """
+	function setMaximoInputValue (input, value) {
+		input.focus();
+		input.value = value;
+
+		input.dispatchEvent(new Event("input", { bubbles: true }));
+		input.dispatchEvent(new Event("change", { bubbles: true }));
+		input.blur();
+	}
+"""
+
+# ----------------------------------------------------------------------------------------------------
+# 
+#											Decorators 
+# 
+# ----------------------------------------------------------------------------------------------------
+# Operations that manage the session themselves, and must never trigger a re-login
+SESSION_OPERATIONS = ("login", "logout")
+
+def _operation(method = None, readonly: bool = False, idempotent: bool = None):
+	"""Marks a public operation of the library (use `@_operation(readonly=True)` for the ones that don't change the page 
+	and `@_operation(idempotent=True)` for the ones that change it, but can safely run again from the start): 
+		- when instrumentation is enabled (see `config.instrumentation`), its latency and the WebDriver commands it sends 
+		  are recorded under its name (ex. "setFilters", "routeWorkflowDialog.setStatus")
+		- when `config.auto_relogin` is enabled, the session is checked before running it and, if it expired while 
+		  running, the user is logged in again. Only idempotent operations (read-only ones are) are retried once: 
+		  the others may have been partially applied, so their error is raised
+		- operations that are not read-only discard the page snapshot (see `config.snapshot_mode`)
+	"""
+	if idempotent is None:
+		idempotent = readonly
+
+	if method is None:
+		return lambda method: _operation(method, readonly, idempotent)
+
+	name = method.__qualname__.replace("MaximoAutomation.", "").replace("RouteWorkflowInterface.", "routeWorkflowDialog.")
+
+	def run(self, args, kwargs):
+		instrumentation = self.instrumentation
+		if instrumentation is None:
+			return method(self, *args, **kwargs)
+
+		with instrumentation.measure(name):
+			return method(self, *args, **kwargs)
+
+	@functools.wraps(method)
+	def wrapper(self, *args, **kwargs):
+		maximo = self if isinstance(self, MaximoAutomation) else self.maximo
+
+		with maximo._operation_lock:
+			# Nested operations run inside the outermost one, which is the only one checking the session
+			revalidate = maximo._operation_depth == 0 and maximo.auto_relogin and maximo._credentials is not None and name not in SESSION_OPERATIONS
+
+			maximo._operation_depth += 1
+			if not readonly:
+				maximo._snapshot = None
+				maximo._write_depth += 1
+				maximo._write_count += 1
+
+			try:
+				if revalidate and maximo.isSessionExpired():
+					logger.warning(f"Session has expired. Logging in again before running '{name}'...")
+					maximo.relogin()
+
+				try:
+					return run(self, args, kwargs)
+
+				except (WebDriverException, MaximoError) as e:
+					if not revalidate or isinstance(e, MaximoLoginFailed) or not maximo.isSessionExpired():
+						raise
+
+					if not idempotent:
+						logger.warning(f"Session expired while running '{name}'. Logging in again, without retrying it (it may have been partially applied)...")
+						maximo.relogin()
+						raise
+
+					logger.warning(f"Session expired while running '{name}'. Logging in again and retrying...")
+					maximo.relogin()
+
+					return run(self, args, kwargs)
+
+			finally:
+				maximo._operation_depth -= 1
+				maximo._last_activity = time.time()
+
+				if not readonly:
+					maximo._write_depth -= 1
+					maximo._snapshot = None
+
+	return wrapper
+
 # ----------------------------------------------------------------------------------------------------
 # 
 #											Main Class 
@@ -60,8 +173,18 @@ class MaximoAutomation(object):
 
 	debug = False
 	headless = False
-
-	sections_cache = {}
+	instrumentation = None
+
+	SECTIONS_CACHE_TTL = 7 * 24 * 60 * 60
+	SESSION_STORE_TTL = 12 * 60 * 60
+
+	# URL patterns (Chrome DevTools wildcard syntax) blocked for each resource type by `config.block_resources`
+	BLOCKED_RESOURCE_PATTERNS = {
+		"image": ["*.gif", "*.png", "*.jpg", "*.jpeg", "*.svg", "*.ico", "*.bmp", "*.webp"],
+		"font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+		"media": ["*.mp3", "*.mp4", "*.ogg", "*.wav", "*.webm"],
+		"analytics": ["*google-analytics.com/*", "*googletagmanager.com/*", "*doubleclick.net/*"],
+	}
 	
 	def __init__(self, config: dict = {}, window_size: tuple = (), login_url: str = "https://ism.italycsc.com/UI/maximo/webclient/login/login.jsp"):
 		"""Establish a connection to Maximo
@@ -72,6 +195,25 @@ class MaximoAutomation(object):
 			config.debug (bool, optional): Add verbosity and tweak config Webdriver to log more info
 			config.headless (bool, optional): Whether to start
 			config.driver (Webdriver, optional): If you have already defined a Webdriver instance, you can pass that using this argument.
+			config.wait_mode (str, optional): How `waitUntilReady()` detects that Maximo is ready: "event" (resolved inside the browser as soon as the page settles) or "polling" (checked from Python every 0.5 sec.). Defaults to "event".
+			config.cache_dir (str, optional): Directory where the persistent caches (ex. sections, resolved chromedriver) are stored, so that the next processes can reuse them. `getDefaultCacheDir()` returns the standard location for the platform. Defaults to None (nothing is saved on disk).
+			config.sections_cache_ttl (int, optional): Seconds after which the sections saved on disk are scanned again. Defaults to 7 days.
+			config.persist_columns_cache (bool, optional): Whether to save the list view columns metadata on disk too. Defaults to False.
+			config.block_resources (bool|list, optional): Drop the requests of resources that automation never looks at (see `BLOCKED_RESOURCE_PATTERNS`), using Chrome DevTools. Either True (all the types) or a list of types (ex. ["image", "font"]). Defaults to False.
+			config.block_resources_patterns (list, optional): Additional URL patterns to block (ex. "*/analytics/*"). Defaults to [].
+			config.block_resources_allow (list, optional): Glob patterns removing whole patterns from the blocked ones (ex. "*.png*"). They are matched against the patterns, not against the URLs (see `blockResources()`). Defaults to [].
+			config.chromedriver_path (str, optional): Path of the chromedriver to use (no version lookup nor download). Defaults to None.
+			config.offline (bool, optional): Never download the chromedriver: use `chromedriver_path` or the one already resolved for the installed Chrome version (remembered in `cache_dir`). Defaults to False.
+			config.profile_template (str, optional): Chrome profile directory (ex. already containing certificates/settings) copied to a temporary `--user-data-dir` for this instance. Defaults to None.
+			config.instrumentation (bool|Instrumentation, optional): Record timings and WebDriver commands of every operation into `self.instrumentation`. Either True or an `Instrumentation` instance (ex. shared by more instances). Defaults to False.
+			config.session_store (bool|str, optional): Save the session cookies after login and reuse them on the next start, skipping the login form while the session is still valid. Either True (file inside `cache_dir`) or the path of the file. Defaults to False.
+			config.download_dir (str, optional): Directory where the browser saves the downloaded files (needed by `exportTable()`). Defaults to None (browser default, with confirmation prompt).
+			config.auto_relogin (bool, optional): Check the session before every operation and, when it has expired, log in again (with the credentials passed to `login()`), go back to the same section, filters and record, and retry the operation once if it is idempotent (others raise their error). Defaults to False.
+			config.keepalive_interval (float, optional): Seconds of inactivity after which a cheap request is sent to keep the session alive (see `startKeepalive()`). Defaults to None (disabled).
+			config.ping_url (str, optional): URL (absolute or relative to the current page) requested by `ping()`. It should need the session but have no side effects. Defaults to None (the current page without its query string, i.e. without the event and the UI session id).
+			config.detail_cache_ttl (float, optional): Cache the record fields read by `getRecordFields()` and `routeWorkflowDialog.getStatus()` for this many seconds (they are invalidated whenever the library writes the record). Defaults to None (disabled).
+			config.detail_cache_size (int, optional): Max number of record fields kept by the detail cache (least recently used are evicted). Defaults to 1000.
+			config.snapshot_mode (bool, optional): Answer the read-only queries (table headers and rows, record fields, status, dialog checks) from a copy of the page parsed locally, taken once and kept until the next operation that changes the page (see `snapshot()`). Defaults to False.
 		"""		
 
 
@@ -79,6 +221,63 @@ class MaximoAutomation(object):
 		
 		self.debug = bool(config["debug"]) if "debug" in config else False
 
+		instrumentation = config["instrumentation"] if "instrumentation" in config else False
+		if instrumentation:
+			self.instrumentation = instrumentation if isinstance(instrumentation, Instrumentation) else Instrumentation()
+		self.wait_mode = config["wait_mode"] if "wait_mode" in config else "event"
+		self._owns_driver = "driver" not in config
+		self._script_timeout = None
+
+		self.login_url = login_url
+		self.username = None
+
+		# Persistent caches
+		self.cache_dir = config["cache_dir"] if "cache_dir" in config else None
+		sections_cache_ttl = config["sections_cache_ttl"] if "sections_cache_ttl" in config else self.SECTIONS_CACHE_TTL
+
+		self.sections_cache = {}
+		self._sections_store = FileCache(os.path.join(self.cache_dir, "sections.json"), sections_cache_ttl) if self.cache_dir else None
+
+		persist_columns_cache = bool(config["persist_columns_cache"]) if "persist_columns_cache" in config else False
+
+		self._columns_cache = None
+		self._columns_store = FileCache(os.path.join(self.cache_dir, "columns.json")) if self.cache_dir and persist_columns_cache else None
+
+		session_store = config["session_store"] if "session_store" in config else False
+		if session_store is True:
+			session_store = os.path.join(self.cache_dir or getDefaultCacheDir(), "sessions.json")
+
+		self._session_store = FileCache(session_store, self.SESSION_STORE_TTL) if session_store else None
+
+		self.download_dir = os.path.abspath(config["download_dir"]) if "download_dir" in config and config["download_dir"] else None
+
+		# Session keepalive and re-login
+		self.auto_relogin = bool(config["auto_relogin"]) if "auto_relogin" in config else False
+		self.keepalive_interval = config["keepalive_interval"] if "keepalive_interval" in config else None
+		self.ping_url = config["ping_url"] if "ping_url" in config else None
+
+		self._credentials = None
+		self._operation_lock = threading.RLock()
+		self._operation_depth = 0
+		self._last_activity = time.time()
+		self._keepalive_thread = None
+		self._keepalive_stop = None
+
+		detail_cache_ttl = config["detail_cache_ttl"] if "detail_cache_ttl" in config else None
+		detail_cache_size = config["detail_cache_size"] if "detail_cache_size" in config else 1000
+		self.detail_cache = RecordDetailCache(detail_cache_ttl, detail_cache_size) if detail_cache_ttl else None
+
+		self.snapshot_mode = bool(config["snapshot_mode"]) if "snapshot_mode" in config else False
+		self._snapshot = None
+		# Operations that may have changed the page so far (see `iterRecordsFromTable()`)
+		self._write_count = 0
+		self._write_depth = 0
+
+		# What the user is looking at, restored after a re-login
+		self._current_section = None
+		self._current_filters = {}
+		self._current_record = None
+
 		# https://peter.sh/experiments/chromium-command-line-switches/#log-level
 		if self.debug: 
 			chrome_flags.append("--log-level=1") # Prints starting from DEBUG messages
@@ -90,6 +289,9 @@ class MaximoAutomation(object):
 			os.environ['WDM_LOG_LEVEL'] = '0'
 			os.environ['WDM_PRINT_FIRST_LINE'] = 'False'
 
+		self._profile_dir = None
+		startup_begin = time.time()
+
 		if not "driver" in config:
 			logger.debug("Using default WebDriver instance")
 			chrome_flags = chrome_flags + [
@@ -115,19 +317,72 @@ class MaximoAutomation(object):
 			if not self.debug:
 				chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
 
-			# Create the actual WebDriver instance
-			self.driver = webdriver.Chrome( ChromeDriverManager().install(), options=chrome_options )
+			if self.download_dir:
+				chrome_options.add_experimental_option("prefs", {
+					"download.default_directory": self.download_dir,
+					"download.prompt_for_download": False,
+					"download.directory_upgrade": True,
+				})
+
+			pinned_driver_path = config["chromedriver_path"] if "chromedriver_path" in config else None
+
+			driver_path = resolveChromeDriver(self.cache_dir, pinned_driver_path, bool(config["offline"]) if "offline" in config else False)
+			if not driver_path:
+				if pinned_driver_path:
+					raise MaximoError(f"The chromedriver '{pinned_driver_path}' does not exist. Check 'chromedriver_path' in the configuration")
+
+				raise MaximoError("Cannot find a chromedriver to use offline. Set 'chromedriver_path' (or 'cache_dir', to reuse the one resolved online) in the configuration")
+
+			try:
+				# Start from a copy of a pre-warmed profile
+				if "profile_template" in config and config["profile_template"]:
+					self._profile_dir = tempfile.mkdtemp(prefix="maximo_profile_")
+					profile_path = os.path.join(self._profile_dir, "profile")
+
+					shutil.copytree(config["profile_template"], profile_path)
+					chrome_options.add_argument(f"--user-data-dir={profile_path}")
+
+				# Create the actual WebDriver instance
+				self.driver = webdriver.Chrome( driver_path, options=chrome_options )
+
+			except Exception:
+				# Nobody will call `close()` on a half-built instance
+				if self._profile_dir:
+					shutil.rmtree(self._profile_dir, ignore_errors=True)
+					self._profile_dir = None
+
+				raise
 
 		else:
 			logger.debug("Using custom WebDriver instance")
 
 			self.driver = config["driver"]
+
+			# The script timeout of a driver passed by the caller is never changed (see `waitUntilReadyEvent()`)
+			self._script_timeout = self.__readScriptTimeout()
 		
+		if self.instrumentation:
+			self.instrumentation.wrapDriver(self.driver)
+
 		if window_size:
 			self.driver.set_window_size(*window_size)
 
+		# Headless Chrome (and custom drivers) ignore the download preferences
+		if self.download_dir:
+			self.setDownloadDirectory(self.download_dir)
+
+		block_resources = config["block_resources"] if "block_resources" in config else False
+		if block_resources:
+			self.blockResources(
+				list(self.BLOCKED_RESOURCE_PATTERNS.keys()) if block_resources is True else block_resources,
+				config["block_resources_patterns"] if "block_resources_patterns" in config else [],
+				config["block_resources_allow"] if "block_resources_allow" in config else [],
+			)
+
 		self.driver.get(login_url)
 
+		self.startup_time = time.time() - startup_begin
+		logger.debug(f"Login page loaded {self.startup_time:.2f} sec. after startup")
 
 		# Sub-class
 		self.routeWorkflowDialog = RouteWorkflowInterface(self)
@@ -136,6 +391,76 @@ class MaximoAutomation(object):
 
 
 	
+	def blockResources (self, resource_types: list, extra_patterns: list = [], allow: list = []):
+		"""Makes the browser drop the requests for resources that automation never looks at (images, fonts...), so that pages load faster.
+		Works only with Chromium based browsers, since it uses the Chrome DevTools Protocol.
+
+		Args:
+			resource_types (list): Types to block (keys of `BLOCKED_RESOURCE_PATTERNS`)
+			extra_patterns (list, optional): Additional URL patterns to block (wildcard `*` allowed). Defaults to [].
+			allow (list, optional): Glob patterns: every blocked PATTERN matching one of them is removed from the list (ex. "*.png*" unblocks all the PNG images). Defaults to [].
+
+		Note:
+			DevTools can only block URL patterns, it has no allow-list: `allow` is matched against the patterns, not against the URLs, 
+			so a single resource (ex. one script needed by the page) can't be let through while its type is blocked. 
+			In that case block only the types that are not needed and add narrower `extra_patterns`.
+
+		Returns:
+			list: The URL patterns that are being blocked
+		"""
+		if not hasattr(self.driver, "execute_cdp_cmd"):
+			logger.warning("Resource blocking is supported only by Chromium based browsers. Ignoring it")
+			return []
+
+		patterns = []
+		for resource_type in resource_types:
+			if resource_type not in self.BLOCKED_RESOURCE_PATTERNS:
+				raise MaximoError(f"Unknown resource type '{resource_type}'. Available types: {list(self.BLOCKED_RESOURCE_PATTERNS.keys())}")
+
+			for pattern in self.BLOCKED_RESOURCE_PATTERNS[resource_type]:
+				patterns.append(pattern)
+
+				# File extensions must match even when followed by a query string
+				if pattern.startswith("*."): patterns.append(pattern + "?*")
+
+		patterns += extra_patterns
+
+		# DevTools has no concept of exceptions: allowed patterns are simply left out of the blocked ones
+		patterns = [pattern for pattern in dict.fromkeys(patterns) if not any(fnmatch.fnmatchcase(pattern, allowed) for allowed in allow)]
+
+		self.driver.execute_cdp_cmd("Network.enable", {})
+		self.driver.execute_cdp_cmd("Network.setBlockedURLs", { "urls": patterns })
+
+		if self.debug: logger.debug(f"Blocking requests matching: {patterns}")
+
+		return patterns
+
+
+	def setDownloadDirectory (self, path: str):
+		"""Makes the browser save the downloaded files into `path`, without asking for confirmation.
+		Works only with Chromium based browsers, since it uses the Chrome DevTools Protocol.
+
+		Args:
+			path (str): The directory (created if it doesn't exist)
+		"""
+		path = os.path.abspath(path)
+		os.makedirs(path, exist_ok=True)
+
+		self.download_dir = path
+
+		if not hasattr(self.driver, "execute_cdp_cmd"):
+			logger.warning("Setting the download directory is supported only by Chromium based browsers. Ignoring it")
+			return
+
+		try:
+			self.driver.execute_cdp_cmd("Browser.setDownloadBehavior", { "behavior": "allow", "downloadPath": path, "eventsEnabled": True })
+		except WebDriverException as e:
+			# `Page.setDownloadBehavior` is deprecated, but it is the only one available in old Chrome versions
+			if self.debug: logger.debug(f"Browser.setDownloadBehavior is not supported ({e.msg}). Using Page.setDownloadBehavior")
+			self.driver.execute_cdp_cmd("Page.setDownloadBehavior", { "behavior": "allow", "downloadPath": path })
+
+
+	@_operation
 	def login (self, username: str, password: str):
 		"""Logs the user into Maximo, using the provided credentials
 
@@ -148,6 +473,16 @@ class MaximoAutomation(object):
 			MaximoLoginFailed: Exception raised if the login phase fails with a description of the error
 		"""
 		logger.info("Trying to log in...")
+		self.username = username
+		self._credentials = (username, password)
+
+		if self._session_store and self.restoreSession():
+			if self.keepalive_interval: 
+				self.startKeepalive(self.keepalive_interval)
+
+			logger.info("User successfully logged in (restored previous session)")
+			return
+
 		WebDriverWait(self.driver, 30).until(EC.presence_of_element_located((By.ID, "j_username")))
 
 		# Send data to the Login form
@@ -185,13 +520,228 @@ class MaximoAutomation(object):
 
 		self.waitUntilReady()
 
+		if self._session_store: 
+			self.saveSession()
+
+		if self.keepalive_interval: 
+			self.startKeepalive(self.keepalive_interval)
+
 		logger.info("User successfully logged in")
 
 
+	def isSessionExpired (self):
+		"""Checks whether Maximo has bounced the browser back to the login page (without logging out explicitly)
+
+		Returns:
+			bool: True if the login form is shown
+		"""
+		try:
+			return bool(self.driver.execute_script("return !!document.getElementById('j_username');"))
+		except WebDriverException:
+			# The browser itself is not responding: that's not something a new login can fix
+			return False
+
+
+	def relogin (self):
+		"""Logs in again with the credentials of the last `login()`, then goes back to the section, filters and record 
+		that were open (only the ones set through `goto_section()`, `setFilters()` and `quickSearch()`)
+
+		Raises:
+			MaximoLoginFailed: If `login()` was never called or the login fails
+		"""
+		if self._credentials is None:
+			raise MaximoLoginFailed("Cannot log in again: no credentials available (login() was never called)")
+
+		section, filters, record = self._current_section, dict(self._current_filters), self._current_record
+
+		# The saved session is the one that just expired
+		if self._session_store: 
+			self._session_store.invalidate(self.getCacheKey())
+
+		if not self.driver.find_elements_by_id("j_username"):
+			self.driver.get(self.login_url)
+
+		self.login(*self._credentials)
+
+		if section:
+			if self.debug: logger.debug(f"Restoring section '{section}' after login")
+			self.goto_section(section)
+
+		if filters:
+			if self.debug: logger.debug(f"Restoring filters {filters} after login")
+			self.setFilters(filters)
+
+		if record:
+			if self.debug: logger.debug(f"Restoring record '{record}' after login")
+			self.quickSearch(record)
+
+
+	def ping (self):
+		"""Sends a cheap request to the server (HEAD of `config.ping_url`), to keep the session alive. 
+		The query string of the current page is never sent, since it contains the last event and the UI session id.
+
+		Returns:
+			bool: False if the server didn't answer, redirected (to the login page) or refused the request
+		"""
+		result = self.driver.execute_async_script("""
+			var done = arguments[arguments.length - 1];
+			var url = arguments[0] || (window.location.origin + window.location.pathname);
+
+			fetch(url, { method: "HEAD", credentials: "same-origin", cache: "no-store", redirect: "manual" })
+				.then(response => done({ status: response.status, redirected: response.type === "opaqueredirect" }))
+				.catch(error => done(null));
+		""", self.ping_url)
+
+		if result is None:
+			logger.warning("Ping: the server did not answer")
+			return False
+
+		# With `redirect: "manual"` a redirect is an opaque response (status 0): Maximo redirects to the login page once the session has expired
+		if result["redirected"]:
+			if self.debug: logger.debug("Ping: redirected (to the login page)")
+			return False
+
+		if self.debug: logger.debug(f"Ping: HTTP {result['status']}")
+
+		return 200 <= result["status"] < 300
+
+
+	def startKeepalive (self, interval: float):
+		"""Starts a background thread that calls `ping()` whenever no operation has been run for `interval` seconds.
+		It never uses the browser while an operation is running. If the session turns out to be expired and 
+		`config.auto_relogin` is enabled, the user is logged in again right away.
+
+		Note:
+			It is safe only if the browser is used exclusively through the operations of the library: the thread can't know 
+			about commands sent to `self.driver` directly, and may run a script (or a re-login) in the middle of them.
+
+		Args:
+			interval (float): Seconds of inactivity between two pings (should be lower than the Maximo session timeout)
+		"""
+		self.stopKeepalive()
+
+		self._keepalive_stop = threading.Event()
+		self._keepalive_thread = threading.Thread(target=self.__keepaliveLoop, args=(interval, self._keepalive_stop), name="MaximoKeepalive", daemon=True)
+		self._keepalive_thread.start()
+
+		if self.debug: logger.debug(f"Keepalive started (every {interval} sec. of inactivity)")
+
+
+	def stopKeepalive (self):
+		""" Stops the keepalive thread, if running """
+		if self._keepalive_thread is None:
+			return
+
+		self._keepalive_stop.set()
+		if self._keepalive_thread is not threading.current_thread():
+			self._keepalive_thread.join()
+
+		self._keepalive_thread = None
+
+
+	def __keepaliveLoop (self, interval: float, stop: threading.Event):
+		while True:
+			idle = time.time() - self._last_activity
+			if stop.wait(max(1.0, interval - idle)): 
+				break
+
+			if time.time() - self._last_activity < interval:
+				continue
+
+			# An operation is running: it keeps the session alive by itself
+			if not self._operation_lock.acquire(blocking=False):
+				continue
+
+			try:
+				if not self.ping():
+					logger.warning("Keepalive: the session seems to be expired")
+
+					if self.auto_relogin and self._credentials is not None:
+						self.relogin()
+
+			except Exception as e:
+				logger.warning(f"Keepalive: error while pinging the server: {e}")
+
+			finally:
+				self._last_activity = time.time()
+				self._operation_lock.release()
+
+
+	def saveSession (self):
+		""" Saves the cookies of the current (logged in) session into the session store """
+		parsed_url = urlparse(self.driver.current_url)
+
+		self._session_store.set(self.getCacheKey(), {
+			# The query string contains the id of the UI session, which must not be reused
+			"url": parsed_url._replace(query="", fragment="").geturl(),
+			"cookies": self.driver.get_cookies()
+		})
+
+		if self.debug: logger.debug(f"Session saved to '{self._session_store.path}'")
+
+
+	def restoreSession (self, timeout: int = 10):
+		"""Tries to log in using the cookies saved by a previous successful login
+
+		Args:
+			timeout (int, optional): Max seconds to wait for Maximo to show either the main page or the login form. Defaults to 10.
+
+		Returns:
+			bool: True if the saved session was still valid and is now in use
+		"""
+		saved_session = self._session_store.get(self.getCacheKey())
+		if not saved_session: 
+			return False
+
+		logger.debug("Restoring saved session...")
+		
+		# Cookies can be added only for the domain currently open (the login page)
+		for cookie in saved_session["cookies"]:
+			cookie = { key: value for key, value in cookie.items() if key in ("name", "value", "path", "domain", "secure", "httpOnly", "expiry") }
+			if "expiry" in cookie: cookie["expiry"] = int(cookie["expiry"])
+
+			try:
+				self.driver.add_cookie(cookie)
+			except WebDriverException as e:
+				logger.debug(f"Could not restore cookie '{cookie['name']}': {e}")
+
+		self.driver.get(saved_session["url"])
+
+		try:
+			WebDriverWait(self.driver, timeout).until(
+				lambda driver: driver.find_elements_by_id("titlebar_hyperlink_9-lbsignout") or driver.find_elements_by_id("j_username")
+			)
+		except TimeoutException:
+			pass
+
+		if self.driver.find_elements_by_id("titlebar_hyperlink_9-lbsignout"):
+			self.waitUntilReady()
+			return True
+
+		logger.info("Saved session has expired. Logging in again...")
+		self._session_store.invalidate(self.getCacheKey())
+		
+		self.driver.delete_all_cookies()
+		self.driver.get(self.login_url)
+
+		return False
+
+
+	@_operation
 	def logout (self):
 		"""
 		Performs the logout
 		"""
+		self.stopKeepalive()
+
+		# Explicitly closed sessions must not be reopened
+		self._credentials = None
+		self._current_section, self._current_filters, self._current_record = None, {}, None
+
+		# The saved session is not valid anymore
+		if self._session_store: 
+			self._session_store.invalidate(self.getCacheKey())
+
 		# Maximo has a special constant (LOGOUTURL) containing the direct url that can be used to logout
 		self.driver.execute_script("window.location = LOGOUTURL")
 		
@@ -208,8 +758,55 @@ class MaximoAutomation(object):
 
 	def close (self):
 		""" Closes the Browser instance """
+		self.stopKeepalive()
 		self.driver.quit()
 
+		if self._profile_dir:
+			shutil.rmtree(self._profile_dir, ignore_errors=True)
+			self._profile_dir = None
+
+
+	def sleep (self, seconds: float):
+		""" Fixed pause, accounted by the instrumentation (prefer waiting for a condition whenever possible) """
+		if self.instrumentation: 
+			self.instrumentation.recordSleep(seconds)
+
+		time.sleep(seconds)
+
+
+	def snapshot (self, refresh: bool = False):
+		"""Returns a copy of the current page, parsed locally: it is taken (with a single script, after `waitUntilReady()`) 
+		the first time and reused until an operation that changes the page runs. 
+		Call `invalidateSnapshot()` after interacting with `self.driver` directly.
+
+		Args:
+			refresh (bool, optional): Take a new snapshot even if there is a valid one. Defaults to False.
+
+		Returns:
+			DomSnapshot: The parsed page
+		"""
+		if self._snapshot is not None and not refresh and self._write_depth == 0:
+			return self._snapshot
+
+		self.waitUntilReady()
+		snapshot = DomSnapshot(self.driver.execute_script(JS_DOM_SNAPSHOT))
+
+		# While an operation is changing the page the snapshot is good only for the caller
+		if self._write_depth == 0:
+			self._snapshot = snapshot
+
+		return snapshot
+
+
+	def invalidateSnapshot (self):
+		""" Discards the current page snapshot """
+		self._snapshot = None
+
+
+	def useSnapshot (self):
+		""" Whether read-only queries are answered from the page snapshot right now """
+		return self.snapshot_mode and self._write_depth == 0
+
 
 	def isReady(self):
 		""" Returns whether or not Maximo is ready to be automated. """
@@ -221,9 +818,20 @@ class MaximoAutomation(object):
 
 		return bool(js_result)
 
+	@_operation(idempotent=True)
 	def waitUntilReady (self, max_timeout: int = 30):
 		""" Stops the execution of the script until Maximo is ready or no 'Long operation' dialog is present """
-		WebDriverWait(self.driver, 30).until(lambda driver: self.isReady(), "Timeout reached while trying to wait for Maximo to load some resource")
+		if self.wait_mode == "event":
+			try:
+				if self.waitUntilReadyEvent(max_timeout): 
+					return self
+			except TimeoutException:
+				raise
+			except WebDriverException as e:
+				# For example when the page navigates away while the script is waiting
+				if self.debug: logger.debug(f"Event based wait failed, falling back to polling: {e}")
+
+		WebDriverWait(self.driver, max_timeout).until(lambda driver: self.isReady(), "Timeout reached while trying to wait for Maximo to load some resource")
 		# WebDriverWait(self.driver, 30).until(EC.invisibility_of_element((By.ID, "wait")))
 		
 		# if self.driver.find_elements_by_id("query_longopwait-dialog_inner_dialogwait"): 
@@ -235,8 +843,107 @@ class MaximoAutomation(object):
 		return self
 
 
+	def waitUntilReadyEvent (self, max_timeout: int = 30):
+		"""Waits until Maximo is ready with a single asynchronous script, which resolves inside the browser 
+		the moment the page settles (instead of polling `isReady()` from Python every 0.5 sec.)
+
+		Args:
+			max_timeout (int, optional): The timeout after which an error is thrown. Defaults to 30.
+
+		Raises:
+			TimeoutException: If Maximo is not ready within `max_timeout` seconds
+
+		Returns:
+			bool: True if Maximo is ready, False if the page doesn't support it (ex. `waitOn` is not defined) and polling should be used instead
+		"""
+		if self._owns_driver:
+			# The driver-side timeout must be longer than the one inside the script, so that the latter is the one to fire
+			if self._script_timeout != max_timeout + 5:
+				self.driver.set_script_timeout(max_timeout + 5)
+				self._script_timeout = max_timeout + 5
+
+			chunk = max_timeout
+		else:
+			# Drivers passed by the caller keep their script timeout: wait in chunks shorter than it
+			chunk = max(1, min(max_timeout, self._script_timeout - 5))
+
+		deadline = time.time() + max_timeout
+
+		while True:
+			js_result = self.__waitUntilReadyScript(min(chunk, max(0, deadline - time.time())))
+
+			if js_result == "unsupported":
+				return False
+
+			if js_result:
+				return True
+
+			if time.time() >= deadline:
+				raise TimeoutException("Timeout reached while trying to wait for Maximo to load some resource")
+
+
+	def __waitUntilReadyScript (self, timeout: float):
+		return self.driver.execute_async_script("""
+			var done = arguments[arguments.length - 1];
+			var timeout_ms = arguments[0];
+
+			function isReady () {
+				try {
+					return waitOn == false && !document.getElementById('m935819a1-longop_message');
+				} catch (e) {
+					return null;
+				}
+			}
+
+			var ready = isReady();
+			if (ready === null) return done("unsupported");
+			if (ready) return done(true);
+
+			var finished = false;
+			var observer = new MutationObserver(check);
+			// 'waitOn' is a plain global variable, which cannot be hooked and is not always followed by a DOM change. 
+			// Check it on a short in-browser timer too (no WebDriver round trip involved)
+			var timer = setInterval(check, 20);
+			var deadline = setTimeout(function () { finish(false); }, timeout_ms);
+
+			function finish (result) {
+				if (finished) return;
+				finished = true;
+
+				observer.disconnect();
+				clearInterval(timer);
+				clearTimeout(deadline);
+				done(result);
+			}
+
+			function check () {
+				if (isReady()) finish(true);
+			}
+
+			observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+		""", int(timeout * 1000))
+
+
+	def __readScriptTimeout (self):
+		""" Script timeout (in seconds) of the driver, or the W3C default (30) if it can't be read (ex. with Selenium 3) """
+		try:
+			return float(self.driver.timeouts.script)
+		except (AttributeError, TypeError, WebDriverException):
+			return 30
+
+
+	def getCacheKey(self):
+		"""Returns the key identifying this Maximo instance and user inside the persistent caches
+
+		Returns:
+			str: The key in the form "host|username"
+		"""
+		return f"{urlparse(self.login_url).netloc}|{(self.username or '').lower()}"
+
+	@_operation(idempotent=True)
 	def get_sections (self, force_rescan: bool = False):
-		"""Populate the cache ONLY the first time, so that it speeds up on the next calls
+		"""Populate the cache ONLY the first time, so that it speeds up on the next calls. 
+		With `config.cache_dir` the sections are also saved on disk, so that the next processes don't need to scan the menu at all.
 
 		Args:
 			force_rescan (bool, optional): Wether to force the population of the cache even though it is already there. Defaults to False.
@@ -248,7 +955,17 @@ class MaximoAutomation(object):
 			return self.sections_cache
 
 		# Reset sections cache in case we are forcing a rescan
-		if force_rescan: self.sections_cache = []
+		if force_rescan: 
+			self.invalidate_sections_cache()
+
+		elif self._sections_store:
+			stored_sections = self._sections_store.get(self.getCacheKey())
+
+			if stored_sections:
+				if self.debug: logger.debug(f"Sections loaded from disk cache ({self._sections_store.path})")
+				self.sections_cache = stored_sections
+
+				return self.sections_cache
 		
 		if self.debug: logger.debug("Sections cache is empty. Analyzing DOM...")
 		
@@ -256,30 +973,50 @@ class MaximoAutomation(object):
 		self.driver.find_element_by_id("titlebar-tb_gotoButton").click()
 		WebDriverWait(self.driver, 30).until(EC.presence_of_element_located((By.CSS_SELECTOR, "#menu0_changeapp_startcntr_a")))
 
-		# Loop through every section and save it into the `self.sections_cache` property
-		for section in self.driver.find_elements_by_css_selector("#menu0 li:not(.submenu) > a"): 
-			originalText = section.get_attribute("innerText")
+		# Harvest every section in a single round trip
+		sections = self.driver.execute_script("""
+			return Array.from(document.querySelectorAll("#menu0 li:not(.submenu) > a")).map(section => {
+				return {
+					id: section.id,
+					href: section.getAttribute("href") || "",
+					text: section.innerText
+				};
+			});
+		""")
+
+		sections_found = {}
+		for section in sections: 
+			originalText = section["text"]
 			
 			# Strip useless strings
 			text = re.sub(r'\(MP\)', '', originalText)
 			text = re.sub(r'\s+', ' ', text).strip().lower()
 
-			# Get HTML_Element data
-			s_id = section.get_attribute("id") 
-			s_href = re.sub(r'javascript:\s+', '', section.get_attribute("href"))
-
-			self.sections_cache[text] = {
-				"id": f"#{s_id}",
-				"href": s_href,
+			sections_found[text] = {
+				"id": f"#{section['id']}",
+				"href": re.sub(r'javascript:\s+', '', section["href"]),
 				"name": originalText
 			}
 
+		self.sections_cache = sections_found
+
+		if self._sections_store:
+			self._sections_store.set(self.getCacheKey(), self.sections_cache)
+
 		if self.debug:
 			logger.debug("Sections have been successfully cached. Next calls will be faster")
 
 		return self.sections_cache
 
+	def invalidate_sections_cache (self):
+		""" Empties the sections cache, both in memory and on disk """
+		self.sections_cache = {}
 
+		if self._sections_store:
+			self._sections_store.invalidate(self.getCacheKey())
+
+
+	@_operation(idempotent=True)
 	def goto_section (self, section_name: str):
 		""" 
 			Goes to the one of the sections you can find under the GoTo Menu in Maximo (Ex. changes, problems...) 
@@ -292,6 +1029,11 @@ class MaximoAutomation(object):
 		
 		# Loop through all the available sections and check if there is one that matches with the one provided to this method
 		section_name_parsed = section_name.lower().replace("(MP)", "")
+
+		# The cache may have been saved before the section was available to the user
+		if section_name_parsed not in sections:
+			sections = self.get_sections(force_rescan=True)
+
 		if section_name_parsed in sections:
 			self.driver.execute_script(sections[section_name_parsed]["href"])
 			if self.debug: logger.debug(f"Clicked on section '{sections[section_name_parsed]['name']}'")
@@ -301,10 +1043,15 @@ class MaximoAutomation(object):
 
 		self.waitUntilReady()
 
+		self._current_section = section_name
+		self._current_filters = {}
+		self._current_record = None
+
 		# Removed for compatibility in case a section doesn't have a quicksearch field
 		# self.waitForInputEditable("#quicksearch")
 
 
+	@_operation(idempotent=True)
 	def goto_tab (self, tab_name: str):
 		"""Goes to a specific tab inside an Incident/Change/Task detail page
 
@@ -361,37 +1108,108 @@ class MaximoAutomation(object):
 			"app_label":	self.getMaximoInternalVariable("APP_KEY_LABEL")
 		}
 
-	def getAvailableFiltersInListView (self):
-		WebDriverWait(self.driver, 30).until(EC.presence_of_element_located((By.ID, "m6a7dfd2f_tbod_ttrow-tr")))
-		
-		filters_found = {}
-		
-		for label in self.driver.find_elements_by_css_selector('#m6a7dfd2f_tbod_ttrow-tr th > [id$="_ttitle-lb"]'):
-			filter_label = label.get_attribute("innerText").strip().lower()
+	@_operation(readonly=True)
+	def getAvailableFiltersInListView (self, force_rescan: bool = False):
+		"""Returns the columns of the current list view, with their filter input and sorting.
+
+		The metadata is cached per section (`getCurrentSection()["target_id"]`): a single script checks the 
+		signature of the table header (column ids, names and filter inputs) and the full scan is performed 
+		only if it changed since last time. See `config.persist_columns_cache` to keep it on disk too.
+		In snapshot mode (see `config.snapshot_mode`) the columns are read from the page snapshot instead.
+
+		Args:
+			force_rescan (bool, optional): Ignore the cached metadata for the current section. Defaults to False.
+
+		Returns:
+			dict: The columns in the form "column name" (lowercase): { "element_id", "sorting", "column_number" }
+		"""
+		if self.useSnapshot() and not force_rescan:
+			filters = self.snapshot().listFilters()
+			# No list table in the snapshot: it may still be loading, so the live page is waited for
+			if filters:
+				return filters
+
+		if self._columns_cache is None:
+			self._columns_cache = (self._columns_store.get(self.getCacheKey()) if self._columns_store else None) or {}
+
+		known_signatures = {} if force_rescan else { target: cached["signature"] for target, cached in self._columns_cache.items() }
+
+		js_script = """
+			let known_signatures = arguments[0];
+			let header = document.getElementById("m6a7dfd2f_tbod_ttrow-tr");
+			if (!header) return null;
+
+			let target = (typeof APPTARGET !== "undefined" ? APPTARGET : "").toLowerCase();
+
+			// Filter inputs, by the id of the column they belong to. The filter row comes first: 
+			// inputs in the data cells (checkboxes, editable cells) have the same "headers" and must not replace them
+			let inputs = {};
+			document.querySelectorAll("[headers] > input").forEach(input => {
+				let header = input.parentElement.getAttribute("headers");
+				if (!(header in inputs)) inputs[header] = input.id;
+			});
+
+			let columns = Array.from(header.querySelectorAll('th > [id$="_ttitle-lb"]')).map(label => {
+				let cell = label.parentElement;
+				return { label: label.innerText.trim(), cell: cell, input_id: inputs[cell.id] || "" };
+			});
+
+			let signature = columns.map(c => `${c.cell.id}=${c.label}=${c.input_id}`).join("|");
+			if (known_signatures[target] === signature) return { target: target, signature: signature, filters: null };
 
-			if filter_label == "": continue
+			let filters = {};
+			columns.forEach(column => {
+				if (column.label === "") return;
+
+				let img = column.cell.querySelector("img");
+				filters[column.label.toLowerCase()] = { 
+					"element_id": column.input_id, 
+					"sorting": img ? img.getAttribute("alt") : null, 
+					"label_id": column.cell.id 
+				};
+			});
 
-			cell = label.find_element_by_xpath('..')
+			return { target: target, signature: signature, filters: filters };
+		"""
 
-			filter_sort = cell.find_element_by_css_selector("img").get_attribute("alt")
+		js_result = self.driver.execute_script(js_script, known_signatures)
+		if js_result is None:
+			WebDriverWait(self.driver, 30).until(EC.presence_of_element_located((By.ID, "m6a7dfd2f_tbod_ttrow-tr")))
+			js_result = self.driver.execute_script(js_script, known_signatures)
 
-			filter_label_id = cell.get_attribute("id")
-			filter_id = ""
-			filter_column_number = self.getColumnNumberFromId(filter_label_id)
+		target = js_result["target"]
 
-			input_selector = "[headers='" + filter_label_id + "'] > input"
-			try:
-				filter_id = self.driver.find_element_by_css_selector(input_selector).get_attribute("id")
-			except Exception:
-				if self.debug: logger.debug(f"Couldn't find filter input for column '{filter_label}' ({input_selector})")
+		if js_result["filters"] is None:
+			if self.debug: logger.debug(f"Using cached list view columns for section '{target}'")
+			return self._columns_cache[target]["filters"]
 
-			filters_found[filter_label] = { "element_id": filter_id, "sorting": filter_sort, "column_number": filter_column_number }
+		filters_found = {}
+		for filter_label, column in js_result["filters"].items():
+			if self.debug and not column["element_id"]: 
+				logger.debug(f"Couldn't find filter input for column '{filter_label}' ([headers='{column['label_id']}'] > input)")
+
+			filters_found[filter_label] = { 
+				"element_id": column["element_id"], 
+				"sorting": column["sorting"], 
+				"column_number": self.getColumnNumberFromId(column["label_id"]) 
+			}
 
+		self._columns_cache[target] = { "signature": js_result["signature"], "filters": filters_found }
+		if self._columns_store:
+			self._columns_store.set(self.getCacheKey(), self._columns_cache)
 
 		# if self.debug: logger.debug("Pretty printing filters found:\n" + json.dumps(filters_found, sort_keys=True, indent=4))
 
 		return filters_found
 
+	def invalidate_columns_cache (self):
+		""" Empties the list view columns cache, both in memory and on disk """
+		self._columns_cache = {}
+
+		if self._columns_store:
+			self._columns_store.invalidate(self.getCacheKey())
+
+	@_operation(idempotent=True)
 	def setFilters (self, filter_config: dict):
 		""" 
 			Change filters for the change list
@@ -400,36 +1218,71 @@ class MaximoAutomation(object):
 			filter_config (dict): A key-value pair dictionary containing the filters to set in the form of "Filter Name" (key) / "Filter Value" (value)
 		"""
 		self.waitUntilReady()
-		WebDriverWait(self.driver, 30).until(EC.presence_of_element_located((By.ID, "m6a7dfd2f_tbod_ttrow-tr")))
-		
-		filters_cache = self.getAvailableFiltersInListView()
 
+		# Show the filter row if it is hidden (showing it requires a round trip to the server)
+		filters_enabled = self.driver.execute_script("""
+			let element = document.getElementById('m6a7dfd2f-ti_img');
+			if (!element || !element.getAttribute("src").endsWith("tablebtn_filter_off.gif")) return true;
 
-		element = self.driver.find_element_by_id('m6a7dfd2f-ti_img')
-		filters_enabled = element.get_attribute("src") != "tablebtn_filter_off.gif"
+			document.getElementById("m6a7dfd2f-lb2").click();
+			return false;
+		""")
 
 		if not filters_enabled:
-			apri_filters = self.driver.find_element_by_id("m6a7dfd2f-lb2")
-			ActionChains(self.driver).move_to_element(apri_filters).click(apri_filters).perform()
+			if self.debug: logger.debug("Filter row was hidden. Showing it...")
+			self.waitUntilReady()
 
+		values = { str(name): str(value) for name, value in filter_config.items() }
 
-		for filter_name, filter_value in filter_config.items():
-			if not filter_name.lower() in filters_cache:
-				logger.warning(f"Filter name '{filter_name}' does not exist. The following filters were found:\n" + json.dumps(filters_cache, sort_keys=True, indent=4))
-				continue
-			if filters_cache[filter_name.lower()]["element_id"].strip() == "":
-				logger.warning(f"Filter name '{filter_name}' is not editable:")
-				continue
+		for force_rescan in (False, True):
+			filters_cache = self.getAvailableFiltersInListView(force_rescan=force_rescan)
 
+			# Fill every filter in a single round trip
+			js_result = self.driver.execute_script(JS_SET_INPUT_VALUE + """
+				let values = arguments[0];
+				let input_ids = arguments[1];
 
-			self.driver.find_element_by_css_selector("[id='" + filters_cache[filter_name.lower()]["element_id"] + "']").send_keys(filter_value)
-			self.driver.find_element_by_css_selector("[id='" + filters_cache[filter_name.lower()]["element_id"] + "']").send_keys(Keys.TAB)
-			if self.debug: logger.debug(f"Filter '{filter_name}' was set with value '{filter_value}'")
-			time.sleep(0.25)
-			
-		time.sleep(0.5)
+				// Check every input first, so that nothing is set if the cached ids are outdated
+				for (let name of Object.keys(values)) {
+					let input_id = input_ids[name];
+					if (input_id && !document.getElementById(input_id)) return null;
+				}
+
+				let result = {};
+				for (let [name, value] of Object.entries(values)) {
+					let input_id = input_ids[name];
 
-		logger.info(f"Filters successfully set")
+					if (input_id === undefined) {
+						result[name] = "missing";
+					} else if (input_id === "") {
+						result[name] = "readonly";
+					} else {
+						setMaximoInputValue(document.getElementById(input_id), value);
+						result[name] = "set";
+					}
+				}
+
+				return result;
+			""", values, { name: filters_cache[name.lower()]["element_id"] for name in values if name.lower() in filters_cache })
+
+			if js_result is not None: break
+			if self.debug: logger.debug("Cached filter inputs are outdated. Scanning the list view again...")
+
+		else:
+			raise MaximoError("Could not find the filter inputs of the list view")
+
+		for filter_name, status in js_result.items():
+			if status == "missing":
+				logger.warning(f"Filter name '{filter_name}' does not exist. The following filters were found:\n" + json.dumps(filters_cache, sort_keys=True, indent=4))
+			elif status == "readonly":
+				logger.warning(f"Filter name '{filter_name}' is not editable")
+			elif self.debug: 
+				logger.debug(f"Filter '{filter_name}' was set with value '{values[filter_name]}'")
+
+		# Let Maximo process the change events before applying the filters
+		self.waitUntilReady()
+
+		logger.info("Filters successfully set")
 		self.driver.find_element_by_id("m6a7dfd2f-ti2_img").click()
 		self.waitUntilReady()
 
@@ -438,7 +1291,56 @@ class MaximoAutomation(object):
 			WebDriverWait(self.driver, 30).until(EC.invisibility_of_element_located((By.ID, "m4b77cc6f-pb")))
 			self.waitUntilReady()
 
+		# Filters not in `filter_config` keep their previous value
+		self._current_filters.update(filter_config)
+		self._current_record = None
+
+
+	@_operation(idempotent=True)
+	def sortListView (self, column: str, descending: bool = False):
+		"""Sorts the current list view by a column, clicking its title until the wanted order is shown 
+		(Maximo cycles between ascending and descending order). Nothing is clicked if the list is already sorted that way.
+
+		Args:
+			column (str): Name of the column (Case Insensitive)
+			descending (bool, optional): Sort from the greatest value to the lowest. Defaults to False.
+
+		Raises:
+			MaximoError: If the column doesn't exist or its order can't be changed
+		"""
+		wanted = "descending" if descending else "ascending"
+
+		# Ascending -> descending -> ascending...: the wanted order is shown after two clicks at most
+		for attempt in range(3):
+			self.waitUntilReady()
+
+			js_result = self.driver.execute_script("""
+				let [column, wanted, click] = arguments;
+
+				let label = Array.from(document.querySelectorAll('#m6a7dfd2f_tbod_ttrow-tr th > [id$="_ttitle-lb"]')).find(label => {
+					return label.innerText.trim().toLowerCase() === column;
+				});
+				if (!label) return "missing";
+
+				let img = label.parentElement.querySelector("img");
+				let description = img ? `${img.getAttribute("alt") || ""} ${img.getAttribute("src") || ""}` : "";
+				let sorting = /desc/i.test(description) ? "descending" : (/asc/i.test(description) ? "ascending" : null);
+
+				if (sorting !== wanted && click) label.click();
+				return sorting;
+			""", column.strip().lower(), wanted, attempt < 2)
+
+			if js_result == "missing":
+				raise MaximoError(f"Column '{column}' not found in the list view")
 
+			if js_result == wanted:
+				if self.debug: logger.debug(f"List view sorted by '{column}' ({wanted})")
+				return
+
+		raise MaximoError(f"Could not sort the list view by '{column}' ({wanted})")
+
+
+	@_operation(idempotent=True)
 	def quickSearch(self, resource_id: str):
 		"""Performs a Quick Search using the field at the top left corner of the view
 
@@ -448,6 +1350,9 @@ class MaximoAutomation(object):
 		Returns:
 			bool: True if at least one record was found
 		"""
+		# Whatever the result, the record shown before is not the current one anymore
+		self._current_record = None
+
 		self.waitUntilReady()
 		self.waitForInputEditable("#quicksearch")
 		self.driver.find_element_by_id("quicksearch").clear()
@@ -464,7 +1369,143 @@ class MaximoAutomation(object):
 		
 		WebDriverWait(self.driver, 30).until(EC.presence_of_element_located((By.ID, "m397b0593-tabs_middle")))
 
+		self._current_record = resource_id.strip()
+
+
+	@_operation(idempotent=True)
+	def getRecordFields(self, record_id: str, labels: list):
+		"""Reads the value of some fields of a record, opening it with `quickSearch()` only if it is not the current one. 
+		With `config.detail_cache_ttl`, fields read recently are returned from the cache without touching the browser.
+
+		The current record is the one opened by the last `quickSearch()`, and it is forgotten by every operation of the 
+		library that leaves it (sections, filters, searches). Call `forgetCurrentRecord()` after opening another record 
+		through `self.driver` directly, otherwise its fields would be read (and cached) as the ones of `record_id`.
+
+		Args:
+			record_id (str): The ID of the record (ex. CHxxxxxxx)
+			labels (list): The EXACT label texts of the fields (ex. ["Status:", "Owner Group:"])
+
+		Raises:
+			MaximoError: If the record cannot be found
+
+		Returns:
+			dict: The value of every field by label (None if no field has that label)
+		"""
+		record_id = record_id.strip()
+		result = {}
+
+		missing = []
+		for label in labels:
+			found, value = self.detail_cache.get(record_id, label) if self.detail_cache is not None else (False, None)
+
+			if found:
+				result[label] = value
+			else:
+				missing.append(label)
+
+		if not missing:
+			if self.debug: logger.debug(f"Fields of '{record_id}' read from the cache: {labels}")
+			return result
+
+		if self._current_record != record_id:
+			if self.quickSearch(record_id) is False:
+				raise MaximoError(f"Record '{record_id}' was not found")
+
+		if self.useSnapshot():
+			values = self.snapshot().inputValues([label.strip() for label in missing])
+		else:
+			values = self.driver.execute_script("""
+				let targets = new Set(arguments[0]);
+				let values = {};
+
+				document.querySelectorAll('label.text.label[for]').forEach(label => {
+					if (label.classList.length != 2) return;
+
+					let text = label.innerText.trim();
+					if (!targets.has(text) || text in values) return;
+
+					let field = document.getElementById(label.getAttribute("for").trim());
+					if (field) values[text] = "value" in field ? field.value : field.innerText.trim();
+				});
+
+				return values;
+			""", [label.strip() for label in missing])
+
+		for label in missing:
+			value = values.get(label.strip())
+			result[label] = value
+
+			if self.detail_cache is not None and value is not None:
+				self.detail_cache.set(record_id, label, value)
+
+		return result
+
+	def forgetCurrentRecord(self):
+		""" Makes the next `getRecordFields()` open the record with `quickSearch()`, even if it is the last one searched """
+		self._current_record = None
+
+	def invalidateRecordDetails(self, record_id: str = None):
+		"""Removes from the detail cache the fields of a record (by default the current one, or all the records if it is not known)
+
+		Args:
+			record_id (str, optional): The record ID. Defaults to None (the current record).
+		"""
+		if self.detail_cache is not None:
+			self.detail_cache.invalidate(record_id or self._current_record)
+
+	@_operation(idempotent=True)
+	def bulkLookup(self, ids: list, id_column: str, fields: list = None, chunk_size: int = 50):
+		"""Looks up many records at once from the current List View, instead of calling `quickSearch()` for each one of them.
+
+		The IDs are set as a single filter on `id_column` (ex. "=CH001,=CH002,...") and the matching rows are harvested 
+		from the list, without opening any record.
+
+		Args:
+			ids (list): The IDs of the records to look up (ex. INxxxxxx or CHxxxxxxx)
+			id_column (str): Name of the list view column containing the IDs (Case Insensitive)
+			fields (list, optional): Names of the columns to return (Case Insensitive). Defaults to None (all the columns).
+			chunk_size (int, optional): Max number of IDs sent in a single filter, since the filter input has a limited length. Defaults to 50.
+
+		Raises:
+			MaximoError: If `id_column` or one of `fields` is not a column of the list (the filter would be ignored and the whole list read for every chunk)
 
+		Returns:
+			dict: { "found": { ID: row }, "missing": [ID, ...] }, where each row has the same structure returned by `getAllRecordsFromTable()`
+		"""
+		wanted_ids = list(dict.fromkeys(str(record_id).strip() for record_id in ids if str(record_id).strip()))
+		fields_lower = [field.lower() for field in fields] if fields else None
+
+		columns = self.getAvailableFiltersInListView()
+		unknown_columns = [column for column in [id_column] + list(fields or []) if column.strip().lower() not in columns]
+		if unknown_columns:
+			raise MaximoError(f"Column/s {unknown_columns} not found in the list view. Available columns: {list(columns.keys())}")
+
+		found = {}
+		for start in range(0, len(wanted_ids), chunk_size):
+			chunk = { record_id.upper(): record_id for record_id in wanted_ids[start:start + chunk_size] }
+
+			logger.info(f"Looking up {len(chunk)} record/s ({start + len(chunk)} of {len(wanted_ids)})")
+			self.setFilters({ id_column: ",".join(f"={record_id}" for record_id in chunk.values()) })
+
+			for row in self.iterRecordsFromTable(columns=[id_column] + list(fields) if fields else None):
+				row_id = next((value for column, value in row["data"].items() if column.lower() == id_column.lower()), None)
+				if row_id is None or row_id.strip().upper() not in chunk: 
+					continue
+
+				# The ID column is always harvested, but returned only if requested
+				if fields_lower is not None and id_column.lower() not in fields_lower:
+					row = dict(row, data={ column: value for column, value in row["data"].items() if column.lower() in fields_lower })
+
+				found[chunk[row_id.strip().upper()]] = row
+
+		missing = [record_id for record_id in wanted_ids if record_id not in found]
+		if missing: 
+			logger.warning(f"Cannot find {len(missing)} of {len(wanted_ids)} requested id/s: {missing}")
+
+		return { "found": found, "missing": missing }
+
+
+	@_operation(idempotent=True)
 	def advancedSearch(self, params: dict, submitForm: bool = True):
 		"""Performs an Advanced Search
 
@@ -474,6 +1515,7 @@ class MaximoAutomation(object):
 
 		"""
 		self.waitUntilReady()
+		self._current_record = None
 
 		logger.debug(f"Performing advanced search with params: '{params}'")
 
@@ -499,6 +1541,62 @@ class MaximoAutomation(object):
 			self.waitUntilReady()
 
 
+	@_operation(idempotent=True)
+	def whereClauseSearch(self, where, submitForm: bool = True):
+		"""Performs a search using the "Where Clause" dialog of the Advanced Search menu, so that complex 
+		selections (IN lists, date ranges, OR conditions...) run as a single query on the server
+
+		Args:
+			where (str|dict): The SQL where clause, or a filter specification for `buildWhereClause()`
+			submitForm (bool, optional): Whether to click on 'Find' after the clause has been written. Defaults to True.
+
+		Raises:
+			MaximoError: If the Where Clause dialog cannot be found
+		"""
+		where_clause = where if isinstance(where, str) else buildWhereClause(where)
+
+		self.waitUntilReady()
+		self._current_record = None
+
+		logger.debug(f"Performing where clause search: '{where_clause}'")
+
+		WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located((By.ID, "quicksearchQSMenuImage")))
+		self.driver.find_element_by_id("quicksearchQSMenuImage").click()
+		self.waitUntilReady()
+
+		# Popup content is generated dynamically. Wait for it to open
+		WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located((By.ID, "menu0_SEARCHWHER_OPTION_a")))
+		self.driver.find_element_by_id("menu0_SEARCHWHER_OPTION_a").click()
+		self.waitUntilReady()
+
+		# Write the clause in the textarea of the foreground dialog
+		textarea_id = self.driver.execute_script(JS_SET_INPUT_VALUE + """
+			let dialog = Array.from(document.querySelectorAll("[id$='-dialog_inner']")).find(e => {
+				let wait_elem = document.getElementById(`${e.id}_dialogwait`);
+				return wait_elem && wait_elem.classList.contains("wait_modal");
+			});
+
+			let textarea = dialog ? dialog.querySelector("textarea") : null;
+			if (!textarea) return null;
+
+			setMaximoInputValue(textarea, arguments[0]);
+			return textarea.id;
+		""", where_clause)
+
+		if not textarea_id:
+			raise MaximoError("Cannot find the 'Where Clause' dialog")
+
+		self.waitUntilReady()
+
+		if submitForm:
+			foregroundDialog = self.getForegroundDialog()
+			if not foregroundDialog or "Find" not in foregroundDialog["buttons"]:
+				raise MaximoError("Cannot find the 'Find' button of the 'Where Clause' dialog")
+
+			foregroundDialog["buttons"]["Find"].click()
+			self.waitUntilReady()
+
+
 	def getBrowserInstance(self):
 		"""
 			Returns the Selenium Webdriver instance needed to perform operations in the current 
@@ -515,7 +1613,7 @@ class MaximoAutomation(object):
 		Returns:
 			int: The column number
 		"""
-		regex_result = re.search("\[C:([0-9]+)\]", row_id)
+		regex_result = re.search(r"\[C:([0-9]+)\]", row_id)
 		if regex_result: 
 			return regex_result.groups(1)[0].strip()
 		else:
@@ -530,7 +1628,11 @@ class MaximoAutomation(object):
 
 
 	# Table Methods
+	@_operation(readonly=True)
 	def getTableHeaders (self): 
+		if self.useSnapshot():
+			return self.snapshot().tableHeaders()
+
 		return self.driver.execute_script("""
 			let columns = document.querySelectorAll("#m6a7dfd2f_tbod_ttrow-tr th");
 			let headers = Array.from(columns).reduce((accum, curr) => {
@@ -543,110 +1645,233 @@ class MaximoAutomation(object):
 			return headers;
 		""")
 
-	def getTableRowsAll (self):
-		return self.driver.execute_script("""
-			function getTableHeaders () {
-				let columns = document.querySelectorAll("#m6a7dfd2f_tbod_ttrow-tr th");
-				let headers = Array.from(columns).reduce((accum, curr) => {
-					let text = curr.innerText.trim();
-					if (text) accum.push({ id: curr.cellIndex, text: text });
-			
-					return accum;
-				}, [])
-				return headers;
-			}
+	@_operation(readonly=True)
+	def getTableRowsAll (self, columns: list = None, columnar: bool = False):
+		"""Returns all the rows of the current page of the list table
 
-			function getTableRowsDetails () {
-				let data = [];
-				
-				// Prendo gli header
-				let headers = getTableHeaders();
-				console.log("Headers: %o", headers)
-
-				// Prendo i dati per ogni riga
-				document.querySelectorAll("#m6a7dfd2f_tbod-tbd tr.tablerow[id^='m6a7dfd2f_tbod_tdrow-tr[']").forEach(r => {
-					columns = Array.from(r.querySelectorAll("td")).map(c => {
-						return {
-							"id": c.cellIndex,
-							"text": c.innerText.trim()
-						}
-					}).filter(column => { 
-						// Prendo solo i dati che hanno un rispettivo header
-						return headers.some(header => column.id === header.id)
-					}).reduce((final, column) => {
-						// Associo ad ogni colonna il rispettivo nome
-						let header_text = headers.find(h => column.id === h.id).text;
-						final[header_text] = column.text
-						
-						return final;
-					}, {});
+		Args:
+			columns (list, optional): Names of the columns to return (Case Insensitive). Only these cells are read and sent back by the browser. Defaults to None (all the columns).
+			columnar (bool, optional): Return a `ColumnarTable` (headers sent and stored once) instead of a list of dictionaries. Defaults to False.
+
+		Returns:
+			list|ColumnarTable: List of { "data": { header: value }, "element_id": id }, or the same rows as a `ColumnarTable`
+		"""
+		if self.useSnapshot():
+			headers, rows = self.snapshot().tableRows(columns)
+
+			if not columnar:
+				return [{ "data": { header: value for header, value in zip(headers, values) if value is not None }, "element_id": element_id } for values, element_id in rows]
+
+			table = ColumnarTable(headers)
+			for values, element_id in rows:
+				table.append([value if value is not None else "" for value in values], element_id)
+
+			return table
+
+		js_result = self.driver.execute_script("""
+			let wanted = arguments[0] ? new Set(arguments[0].map(c => c.trim().toLowerCase())) : null;
+			let columnar = arguments[1];
+
+			// Build the header index once: every cell is then read directly by its position
+			let headers = [];
+			document.querySelectorAll("#m6a7dfd2f_tbod_ttrow-tr th").forEach(th => {
+				let text = th.innerText.trim();
+				if (!text) return;
+				if (wanted && !wanted.has(text.toLowerCase())) return;
 
-					data.push({
-						"data": columns,
-						"element_id": r.id
+				headers.push({ index: th.cellIndex, text: text });
+			});
+
+			let rows = [];
+			let ids = [];
+			document.querySelectorAll("#m6a7dfd2f_tbod-tbd tr.tablerow[id^='m6a7dfd2f_tbod_tdrow-tr[']").forEach(r => {
+				let cells = r.cells;
+
+				if (columnar) {
+					rows.push(headers.map(h => cells[h.index] ? cells[h.index].innerText.trim() : ""));
+				} else {
+					let data = {};
+					headers.forEach(h => {
+						if (cells[h.index]) data[h.text] = cells[h.index].innerText.trim();
 					});
-				});
-				
-				return data;
-			}
-			
-			
-			return getTableRowsDetails ();
-		""")
 
+					rows.push(data);
+				}
+
+				ids.push(r.id);
+			});
+
+			return { headers: headers.map(h => h.text), rows: rows, ids: ids };
+		""", columns, columnar)
+
+		if not columnar:
+			return [{ "data": data, "element_id": element_id } for data, element_id in zip(js_result["rows"], js_result["ids"])]
+
+		table = ColumnarTable(js_result["headers"])
+		for values, element_id in zip(js_result["rows"], js_result["ids"]):
+			table.append(values, element_id)
+
+		return table
+
+	@_operation(readonly=True)
 	def getRecordDetailsFromTable (self, record: selenium.webdriver.remote.webelement.WebElement, filters, required_fields: list = []):
 		"""When inside a Section with a Table list (ex. when inside the list of Changes open owned by my groups)
 
 		Args:
 			record (selenium.webdriver.remote.webelement.WebElement): The Selenium element of the current row
-			required_fields (list): A list containing the fields to return. Defaults to [].
+			filters (dict): The columns of the list view, as returned by `getAvailableFiltersInListView()`
+			required_fields (list): A list containing the fields to return. Defaults to [] (all the fields).
 
 		Returns:
-			[type]: [description]
+			dict: The fields of the row in the form "column name": { "element_id", "value", "column_number", "column_name" }
 		"""
-		
-		current_row = {}
-		for column in record.find_elements_by_tag_name("td"):
-			field = {
-				"element_id": column.get_attribute("id").strip(),
-				"value": column.text.replace("\n", "").strip(),
-				"column_number": self.getColumnNumberFromId(column.get_attribute("id")),
-				"column_name": ""
-			}
+		return self.getRecordDetailsFromTableBatch([record], filters, required_fields)[0]
 
+	@_operation(readonly=True)
+	def getRecordDetailsFromTableBatch (self, records: list = None, filters: dict = None, required_fields: list = []):
+		"""Same as `getRecordDetailsFromTable()`, but for many rows at once: every cell is read with a single script
 
+		Args:
+			records (list, optional): The Selenium elements of the rows. Defaults to None (all the rows of the current page).
+			filters (dict, optional): The columns of the list view, as returned by `getAvailableFiltersInListView()`. Defaults to None (retrieved automatically).
+			required_fields (list, optional): A list containing the fields to return (Case Insensitive). Defaults to [] (all the fields).
 
-			# Find the filter column name associated to the current field
-			for key, values in filters.items():
-				if values["column_number"] == field['column_number']:
-					field['column_name'] = key.strip()
-					break
+		Returns:
+			list: The fields of each row (see `getRecordDetailsFromTable()`), in the same order of `records`
+		"""
+		if filters is None:
+			filters = self.getAvailableFiltersInListView()
 
-			# Add the current field to the list of fields ONLY if it has both a valid column name and a valid value
-			if field['column_name'] != "" and field['value'] != "":
-				current_row[field['column_name']] = field
-			
-		return current_row
+		# Column number -> column name (the first one wins, as the filters are scanned in order)
+		column_names = {}
+		for key, values in filters.items():
+			column_names.setdefault(values["column_number"], key.strip())
+
+		required_fields = [field.lower() for field in required_fields]
 
-	def getAllRecordsFromTable (self):
+		rows_cells = self.driver.execute_script("""
+			let rows = arguments[0] || document.querySelectorAll("#m6a7dfd2f_tbod-tbd tr.tablerow[id^='m6a7dfd2f_tbod_tdrow-tr[']");
+
+			return Array.from(rows).map(row => Array.from(row.querySelectorAll("td")).map(column => [column.id, column.innerText]));
+		""", records)
+
+		result = []
+		for cells in rows_cells:
+			current_row = {}
+
+			for element_id, text in cells:
+				field = {
+					"element_id": element_id.strip(),
+					"value": text.replace("\n", "").strip(),
+					"column_number": self.getColumnNumberFromId(element_id),
+					"column_name": ""
+				}
+				field["column_name"] = column_names.get(field["column_number"], "")
+
+				if required_fields and field["column_name"].lower() not in required_fields:
+					continue
+
+				# Add the current field to the list of fields ONLY if it has both a valid column name and a valid value
+				if field['column_name'] != "" and field['value'] != "":
+					current_row[field['column_name']] = field
+
+			result.append(current_row)
+
+		return result
+
+	@_operation(idempotent=True)
+	def getAllRecordsFromTable (self, columns: list = None, columnar: bool = False, export: bool = False):
 		"""
 		In a List View (for example 'Changes open owned by my groups') analyzes the current table and returns all the rows details. 
 		If there are more pages, goes through all them
 
+		Args:
+			columns (list, optional): Names of the columns to return (Case Insensitive). Defaults to None (all the columns).
+			columnar (bool, optional): Return a single `ColumnarTable`, which takes a fraction of the memory for big lists. Defaults to False.
+			export (bool, optional): Read the whole list with a single download (see `exportTable()`) instead of going through the pages. Rows have an empty "element_id". Defaults to False.
+
 		Returns:
-			list: List of Dictionaries of all the table rows 
+			list|ColumnarTable: List of Dictionaries of all the table rows (or the `ColumnarTable` containing them)
+		"""
+		if export:
+			return self.exportTable(columns=columns, columnar=columnar)
+
+		if not columnar:
+			return list(self.iterRecordsFromTable(columns=columns))
+
+		table = None
+		for page in self.iterRecordsFromTable(by_page=True, columns=columns, columnar=True):
+			if table is None:
+				table = page
+			else:
+				table.extend(page)
+
+		return table if table is not None else ColumnarTable([])
+
+	def iterRecordsFromTable (self, max_records: int = None, max_pages: int = None, stop_when = None, by_page: bool = False, columns: list = None, columnar: bool = False):
 		"""
-		start = time.time()
+		Same as `getAllRecordsFromTable()`, but yields the rows as soon as each page has been read,
+		so that the caller can process them while paging and memory stays flat for big lists
 
-		record_list = []
+		The generator is not an operation: it doesn't hold the instance lock between the pages, nor logs in again 
+		when the session expires. The instance must not be used for operations changing the page (navigation, 
+		filters, searches...) until the iteration ends, otherwise the next page would be read from another list.
+		This is detected, and the generator raises `MaximoError` instead of yielding the wrong rows.
+
+		Args:
+			max_records (int, optional): Stop after this many rows have been yielded. Defaults to None (no limit).
+			max_pages (int, optional): Stop after this many pages have been read. Defaults to None (no limit).
+			stop_when (callable, optional): Predicate called with each row. If it returns True, that row is NOT yielded and paging stops. Defaults to None.
+			by_page (bool, optional): Yield a list of rows per page instead of single rows. Defaults to False.
+			columns (list, optional): Names of the columns to return (Case Insensitive). Defaults to None (all the columns).
+			columnar (bool, optional): Rows are `RowView`s and pages are `ColumnarTable`s instead of dictionaries and lists. Defaults to False.
+
+		Raises:
+			MaximoError: If an operation changed the page while the caller was processing the rows
+
+		Yields:
+			dict|list|RowView|ColumnarTable: A table row (or the rows of a page, if `by_page` is True)
+		"""
+		records_count = 0
+		pages_count = 0
 
 		while True:
 			counter = self.driver.find_element_by_id("m6a7dfd2f-lb3").get_attribute("innerText").strip()
 
 			logger.info(f"[Paging] Analyzing records for page: {counter}")
 
-			table_rows = self.getTableRowsAll()
-			record_list.extend(table_rows)
+			table_rows = self.getTableRowsAll(columns=columns, columnar=columnar)
+			pages_count += 1
+
+			write_count = self._write_count
+
+			stop = False
+			page = []
+			for row in table_rows:
+				if stop_when is not None and stop_when(row):
+					if self.debug: logger.debug("[Paging] Stop condition met")
+					stop = True
+					break
+
+				if max_records is not None and records_count >= max_records:
+					stop = True
+					break
+
+				records_count += 1
+				page.append(row)
+
+			if by_page:
+				# Rows are always consumed from the top, so the page is a prefix of the table
+				if page: yield table_rows.head(len(page)) if columnar else page
+			else:
+				yield from page
+
+			if stop: break
+			if max_records is not None and records_count >= max_records: break
+			if max_pages is not None and pages_count >= max_pages: break
+
+			if self._write_count != write_count:
+				raise MaximoError("The page was changed by another operation while iterating over the rows of the list. Don't use the instance until the iteration ends")
 
 			# If more pages are found, continue with the next cycle
 			next_page_available = self.driver.find_element_by_id("m6a7dfd2f-ti7_img").get_attribute("source") == "tablebtn_next_on.gif"
@@ -656,9 +1881,103 @@ class MaximoAutomation(object):
 
 			# Click on the Arrow icon to change page
 			self.driver.find_element_by_id("m6a7dfd2f-ti7_img").click()
+			self.invalidateSnapshot()
 			self.waitUntilReady()
 
-		return record_list
+	@_operation(idempotent=True)
+	def exportTable (self, columns: list = None, columnar: bool = False, timeout: int = 300, keep_file: bool = False):
+		"""Downloads the whole result set of the current list view with the "Download" button of the table, 
+		and parses the file. A single export on the server replaces one page turn (and DOM harvest) every ~20 rows.
+
+		Requires `config.download_dir` (or a previous `setDownloadDirectory()` call).
+
+		Args:
+			columns (list, optional): Names of the columns to return (Case Insensitive). Defaults to None (all the columns).
+			columnar (bool, optional): Return a `ColumnarTable` instead of a list of dictionaries. Defaults to False.
+			timeout (int, optional): Max seconds to wait for the download to complete. Defaults to 300.
+			keep_file (bool, optional): Don't delete the downloaded file after parsing it. Defaults to False.
+
+		Raises:
+			MaximoError: If no download directory is set, the table has no "Download" button or the file is not downloaded within `timeout` seconds
+
+		Returns:
+			list|ColumnarTable: Same as `getAllRecordsFromTable()` (with an empty "element_id", as the rows are not read from the page)
+		"""
+		if not self.download_dir:
+			raise MaximoError("A download directory is needed to export the table. Set 'download_dir' in the configuration")
+
+		self.waitUntilReady()
+
+		existing_files = set(os.listdir(self.download_dir))
+
+		clicked = self.driver.execute_script("""
+			let button = Array.from(document.querySelectorAll("img[id^='m6a7dfd2f-ti']")).find(img => {
+				return /download/i.test(img.getAttribute("src") || "") || /download/i.test(img.getAttribute("alt") || "");
+			});
+			if (!button) return false;
+
+			(button.closest("a") || button).click();
+			return true;
+		""")
+		if not clicked:
+			raise MaximoError("Could not find the 'Download' button of the list table")
+
+		logger.info(f"[Export] Waiting for the download into '{self.download_dir}'...")
+
+		deadline = time.time() + timeout
+		path = None
+		last_size = None
+
+		# Poll often at first (small exports take less than a second), then back off up to 2 seconds between checks
+		delay = 0.1
+
+		while path is None:
+			remaining = deadline - time.time()
+			if remaining <= 0:
+				raise MaximoError(f"Timeout reached ({timeout} sec.) while waiting for the table download")
+
+			self.sleep(min(delay, remaining))
+			delay = min(delay * 2, 2.0)
+
+			new_files = [name for name in os.listdir(self.download_dir) if name not in existing_files]
+			if not new_files or any(name.endswith(PARTIAL_DOWNLOAD_SUFFIXES) for name in new_files):
+				continue
+
+			# The file must not be growing anymore
+			candidate = os.path.join(self.download_dir, sorted(new_files)[0])
+			size = os.path.getsize(candidate)
+			if size != last_size:
+				last_size = size
+				continue
+
+			path = candidate
+
+		if self.debug: logger.debug(f"[Export] Table downloaded into '{path}' ({last_size} bytes)")
+
+		try:
+			return parseExport(path, columns=columns, columnar=columnar)
+		finally:
+			if not keep_file:
+				os.remove(path)
+
+	def watch (self, section: str, filters: dict = {}, interval: float = 60, max_polls: int = None, **kwargs):
+		"""Polls a filtered list view every `interval` seconds and yields only what changed since the previous poll
+
+			for events in maximo.watch("changes", { "owner group": "MYGROUP" }, interval=60, date_column="Changed Date"):
+				for event in events:
+					print(event["type"], event["id"], event["row"])
+
+		Args:
+			section (str): The section containing the list view
+			filters (dict, optional): Filters identifying the list (see `setFilters()`). Defaults to {}.
+			interval (float, optional): Seconds between the start of two polls. Defaults to 60.
+			max_polls (int, optional): Stop after this many polls. Defaults to None (forever).
+			kwargs: Other options of `ListWatcher` (ex. `id_column`, `date_column`, `full_every`, `columns`)
+
+		Yields:
+			list: The "added", "changed" and "removed" events of each poll (see `ListWatcher.poll()`)
+		"""
+		return ListWatcher(self, section, filters, **kwargs).watch(interval, max_polls)
 
 	def getRowNumberFromFieldId(self, row_id: str):
 		"""Given a field from a table row (ex. Changes) or even a row, returns the row number
@@ -718,7 +2037,10 @@ class MaximoAutomation(object):
 
 		return "fld_ro" not in self.driver.find_element_by_css_selector(element_selector).get_attribute('class').split()
 
+	@_operation
 	def clickRouteWorkflow(self):
+		self.invalidateRecordDetails()
+
 		self.driver.find_element_by_id("ROUTEWF__-tbb_anchor").click()
 		self.waitUntilReady()
 
@@ -742,6 +2064,7 @@ class MaximoAutomation(object):
 
 
 
+	@_operation(readonly=True)
 	def detectDialogs(self):
 		"""
 		Checks if there is any dialog on foreground
@@ -805,70 +2128,102 @@ class MaximoAutomation(object):
 		"""
 		return next((item for item in self.detectDialogs() if item["is_foreground"] == True), None)
 
+	def __foregroundDialogMayContain(self, text: str):
+		""" In snapshot mode, checks on the snapshot whether the foreground dialog contains `text` (so that the live dialog is looked up only when needed). Always True otherwise """
+		if not self.useSnapshot():
+			return True
+
+		return any(dialog["is_foreground"] and text in dialog["text"] for dialog in self.snapshot().dialogs())
 
-	def setNamedInput(self, targets: dict):
+
+	@_operation
+	def setNamedInput(self, targets: dict, timeout: int = 30):
 		"""Sets the value of a named input in the current view
 		
+		The label -> input index is built and all the editable targets are set in a single script. 
+		When more inputs share the same label (ex. "Status:"), only the first one in the page is set. 
+		Inputs that are still read-only (ex. because they depend on another field of `targets`) are retried 
+		once Maximo has processed the previous changes.
 
 		Args:
-			targets (dict): The EXACT label text you want to search
-		"""
-		MAX_RETRY_TIMES = 5
+			targets (dict): The EXACT label text you want to search (key) and the value to set (value)
+			timeout (int, optional): Max seconds to wait for read-only inputs to become editable. Defaults to 30.
 
-		retries = 1
-		while retries <= MAX_RETRY_TIMES:
-			retries += 1
+		Raises:
+			MaximoError: If some input is still not editable after `timeout` seconds
+		"""
+		pending = { str(label): str(value) for label, value in targets.items() }
+		deadline = time.time() + timeout
 
-			try:
-				for label in self.driver.find_elements_by_css_selector("label.text.label"):
-					if not label.get_attribute("innerText") or label.get_attribute("innerText").strip() == "": 
-						continue
+		# Only the record being edited can change. Without one (ex. in the Advanced Search dialog) the cache is still valid
+		if self._current_record is not None:
+			self.invalidateRecordDetails(self._current_record)
 
-					if len(label.get_attribute("class").split()) != 2: 
-						continue
+		while pending:
+			self.waitUntilReady()
 
-					if not label.get_attribute("for") or label.get_attribute("for").strip() == "": 
-						continue
+			js_result = self.driver.execute_script(JS_SET_INPUT_VALUE + """
+				let targets = arguments[0];
+				let labels = {};
 
-					label_text = label.get_attribute("innerText").strip()
-					if label_text in targets:
-						input_id = label.get_attribute("for")
+				document.querySelectorAll('label.text.label[for]').forEach(label => {
+					if (label.classList.length != 2) return;
 
-						if not self.driver.find_elements_by_id(input_id):
-							logger.error(f"No named input '{label_text}' was found on the current page")
-							
-							continue
-						
-						logger.debug(f"Waiting for named input '{label_text}' to be editable")
+					let text = label.innerText.trim();
+					let input_id = label.getAttribute("for").trim();
+					if (!text || !input_id) return;
 
-						self.waitForInputEditable(f"#{input_id}")
+					(labels[text] = labels[text] || []).push(input_id);
+				});
 
-						self.driver.find_element_by_id(input_id).clear()
-						self.driver.find_element_by_id(input_id).send_keys(targets[label_text])
-						self.driver.find_element_by_id(input_id).send_keys(Keys.TAB)
+				let result = {};
+				for (let [text, value] of Object.entries(targets)) {
+					// Like a manual lookup, only the first input bound to the label (and present in the page) is used
+					let input_id = (labels[text] || []).find(id => document.getElementById(id));
+					if (!input_id) {
+						result[text] = "missing";
+						continue;
+					}
+
+					let input = document.getElementById(input_id);
+					if (input.classList.contains("fld_ro") || input.offsetParent === null) {
+						result[text] = "readonly";
+						continue;
+					}
+
+					setMaximoInputValue(input, value);
+					result[text] = "set";
+				}
+
+				return result;
+			""", pending)
+
+			for label_text, status in js_result.items():
+				if status == "set":
+					if self.debug: logger.debug(f"Value '{pending[label_text]}' was set for named input '{label_text}'")
+					del pending[label_text]
+
+				elif status == "missing":
+					logger.error(f"No named input '{label_text}' was found on the current page")
+					del pending[label_text]
+
+			if not pending: 
+				break
 
-						self.waitUntilReady()
-						time.sleep(0.5)
-						if self.debug: logger.debug(f"Value '{targets[label_text]}' was set for named input '{label_text}'")
+			if time.time() > deadline:
+				msg = f"Timeout reached ({timeout} sec.) while waiting for named input/s {list(pending.keys())} to be editable"
+				logger.error(msg)
 
-						del targets[label_text]
-				
-					if not targets:
-						if self.debug: logger.debug("No more targets. Finished my job")
-						break
+				raise MaximoError(msg)
 
-				self.waitUntilReady()
-				break
-			except StaleElementReferenceException:
-				if self.debug: logger.debug(f"Page changed while trying to access input element ({retries} attempt of {MAX_RETRY_TIMES} MAX)")
-				time.sleep(0.5)
-		else:
-			msg = f"Reached maximum retries number ({MAX_RETRY_TIMES}) while trying to set input value"
-			logger.error(msg)
+			logger.debug(f"Waiting for named input/s {list(pending.keys())} to be editable")
+			self.sleep(0.25)
 
-			raise MaximoError(msg)
+		if self.debug: logger.debug("No more targets. Finished my job")
+		self.waitUntilReady()
 
 
+	@_operation(readonly=True)
 	def getNamedInput(self, target: str, context: selenium.webdriver.remote.webelement.WebElement = None):
 		"""Gets the element of a named input in the current view
 		
@@ -896,6 +2251,7 @@ class MaximoAutomation(object):
 		raise Exception(f"Found '{len(inputs_found)}' labels. Expected 1.")
 
 		
+	@_operation(readonly=True)
 	def getNamedLabel(self, target: str, context: selenium.webdriver.remote.webelement.WebElement = None):
 		"""Gets the element of a named input in the current view
 
@@ -919,7 +2275,14 @@ class MaximoAutomation(object):
 		raise Exception(f"Found '{len(labels_found)}' labels. Expected 1.")
 
 
-	def handleIfComingFromDetail(self):		
+	@_operation(readonly=True)
+	def handleIfComingFromDetail(self):
+		# Checked before anything on the page changes, since a change discards the snapshot
+		if self.__foregroundDialogMayContain("Do you want to save your changes before continuing?"):
+			self._dismissSaveChangesDialog()
+
+	@_operation(idempotent=True)
+	def _dismissSaveChangesDialog(self):
 		foregroundDialog = self.getForegroundDialog()
 
 		if foregroundDialog and "Do you want to save your changes before continuing?" in foregroundDialog["text"]:
@@ -928,16 +2291,31 @@ class MaximoAutomation(object):
 			foregroundDialog["buttons"]["No"].click()
 			if self.debug: logger.debug("Clicked on 'No'")
 
+			# The record is being left
+			self._current_record = None
+
 			self.waitUntilReady()
 
 
+	@_operation(readonly=True, idempotent=False)
 	def checkUpdateError(self):
+		# Checked before anything on the page changes, since a change discards the snapshot
+		if not self.__foregroundDialogMayContain("has been updated by another user"):
+			return False
+
+		return self._dismissUpdateErrorDialog()
+
+	@_operation
+	def _dismissUpdateErrorDialog(self):
 		foregroundDialog = self.getForegroundDialog()
 
 		if foregroundDialog and "has been updated by another user. Your changes have not been saved. Refresh the record and try again" in foregroundDialog["text"]:
 			foregroundDialog["buttons"]["OK"].click()
 			self.waitUntilReady()
 
+			# What was read before is outdated
+			self.invalidateRecordDetails()
+
 			return True
 
 		return False
@@ -952,6 +2330,15 @@ class RouteWorkflowInterface():
 	def __init__(self, maximo):
 		self.__maximo = maximo
 
+	@property
+	def maximo(self):
+		return self.__maximo
+
+	@property
+	def instrumentation(self):
+		return self.__maximo.instrumentation
+
+	@_operation
 	def openDialog(self):
 		"""Click on the "Change Status" button
 
@@ -969,10 +2356,11 @@ class RouteWorkflowInterface():
 		# Wait until button "Route WorkFlow" shows up
 		WebDriverWait(self.__maximo.driver, 20).until(EC.visibility_of_element_located((By.ID, "m24bf0ed1-pb")))
 
-		logger.info(f"Opened 'Change Status' dialog")
+		logger.info("Opened 'Change Status' dialog")
 
 		return self
 
+	@_operation
 	def closeDialog(self):
 		"""Click on "Close Window" button to close the dialog"""
 		button = WebDriverWait(self.__maximo.driver, 20).until(EC.element_to_be_clickable((By.ID, "mbdb65f6b-pb")))
@@ -980,11 +2368,19 @@ class RouteWorkflowInterface():
 
 		self.__maximo.waitUntilReady()
 
+	@_operation(readonly=True)
 	def getStatus(self):
-		"""Get the current Status"""
+		"""Get the current Status (from the detail cache, if enabled and the current record is known)"""
+		record_id = self.__maximo._current_record
+		if self.__maximo.detail_cache is not None and record_id:
+			return self.__maximo.getRecordFields(record_id, ["Status:"])["Status:"]
+
+		if self.__maximo.useSnapshot():
+			return self.__maximo.snapshot().inputValue("Status:")
 		
 		return self.__maximo.getNamedInput("Status:").get_attribute("value")
 		
+	@_operation
 	def setStatus(self, new_status: str):
 		"""Sets a new status for the current record
 
@@ -996,6 +2392,7 @@ class RouteWorkflowInterface():
 
 		return self
 
+	@_operation
 	def clickRouteWorkflow(self):
 		"""Clicks on the 'Route Workflow' button, and checks if there are any errors
 
@@ -1005,6 +2402,8 @@ class RouteWorkflowInterface():
 		Returns:
 			[type]: [description]
 		"""
+		self.__maximo.invalidateRecordDetails()
+
 		button = WebDriverWait(self.__maximo.driver, 20).until(EC.element_to_be_clickable((By.ID, "m24bf0ed1-pb")))
 		button.click()
 
@@ -1018,13 +2417,13 @@ class RouteWorkflowInterface():
 			additional_error_text = ""
 
 			if "Errors exist in the application that prevent this action from being performed" in msg_box_text:
-				additional_error_text = f"Errors exist in the application. Your changes have not been saved\n"
+				additional_error_text = "Errors exist in the application. Your changes have not been saved\n"
 				
 			elif "has been updated by another user. Your changes have not been saved" in msg_box_text:
-				additional_error_text = f"Record have been changed by another user/instance. Your changes have not been saved\n"
+				additional_error_text = "Record have been changed by another user/instance. Your changes have not been saved\n"
 				
 			elif "mp2# The transition of status from INPROG to CLOSE is not permitted." in msg_box_text:
-				additional_error_text = f"Record have been changed by another user/instance. Your changes have not been saved\n"
+				additional_error_text = "Record have been changed by another user/instance. Your changes have not been saved\n"
 			else:
 				additional_error_text = ""
 				logger.warning("Error not handled by this script")
@@ -1069,3 +2468,12 @@ class MaximoLoginFailed(MaximoError):
 	def __init__(self, *args, **kwargs):
 		super().__init__(*args)
 		self.foo = kwargs.get('foo')
+
+class MaximoBudgetExceeded(MaximoError):
+	"""Exception raised when an operation sends more WebDriver commands than its budget (see `maximo_gui_connector.budget`)"""
+
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args)
+		self.operation = kwargs.get('operation')
+		self.used = kwargs.get('used')
+		self.limit = kwargs.get('limit')
@@ -0,0 +1,262 @@
+"""
+	Pool of logged-in MaximoAutomation instances, used to process records in parallel
+"""
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from maximo_gui_connector.main import MaximoAutomation, MaximoError
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class MaximoSessionPool(object):
+	"""
+		Keeps N browsers (each one with its own Maximo session) warm and hands them out to the caller
+	"""
+
+	def __init__(self, size: int, username: str, password: str, config: dict = {}, login_url: str = None, task_retries: int = 1):
+		"""Starts `size` browsers and logs each one of them into Maximo
+
+		Args:
+			size (int): Number of sessions (and worker threads) to keep open
+			username (str): Username used to log in every session
+			password (str): Password used to log in every session
+			config (dict, optional): Configuration passed to every `MaximoAutomation` instance. Defaults to {}.
+			login_url (str, optional): URL to the login page. Defaults to the `MaximoAutomation` default.
+			task_retries (int, optional): How many times a task submitted with `submit()` is retried on a fresh session if its session died while running it. Defaults to 1.
+
+		Raises:
+			MaximoError: If a custom WebDriver is passed via `config["driver"]` (one browser can't be shared between sessions)
+		"""
+		if size < 1:
+			raise MaximoError(f"Pool size must be at least 1 (got {size})")
+
+		if "driver" in config:
+			raise MaximoError("A custom WebDriver instance cannot be shared between the sessions of a pool")
+
+		self.size = size
+		self.config = config
+		self.login_url = login_url
+		self.task_retries = task_retries
+
+		self.__username = username
+		self.__password = password
+
+		self.__lock = threading.Lock()
+		self.__sessions = []
+		self.__idle = queue.Queue()
+		self.__executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="MaximoSessionPool")
+		self.__closed = False
+
+		# Start all the browsers in parallel, since each login is mostly spent waiting
+		logger.info(f"Starting {size} Maximo session/s...")
+		futures = [self.__executor.submit(self.__createSession) for _ in range(size)]
+
+		errors = []
+		for future in futures:
+			try:
+				self.__idle.put(future.result())
+			except Exception as e:
+				errors.append(e)
+
+		if errors:
+			self.close()
+			raise MaximoError(f"Could not start {len(errors)} of {size} session/s: {errors[0]}")
+
+		logger.info(f"Session pool ready ({size} session/s)")
+
+
+	def __createSession(self):
+		"""Creates a new browser instance and logs it in
+
+		Returns:
+			MaximoAutomation: The logged-in instance
+		"""
+		kwargs = { "login_url": self.login_url } if self.login_url else {}
+
+		# Every browser needs its own Maximo session: restoring the same saved cookies would make them share one
+		config = dict(self.config, session_store=False)
+		maximo = MaximoAutomation(config, **kwargs)
+
+		try:
+			maximo.login(self.__username, self.__password)
+		except Exception:
+			self.__closeSession(maximo)
+			raise
+
+		with self.__lock:
+			self.__sessions.append(maximo)
+
+		return maximo
+
+
+	def __closeSession(self, maximo: MaximoAutomation):
+		""" Closes the browser of a session, ignoring errors (the browser may already be dead) """
+		with self.__lock:
+			if maximo in self.__sessions:
+				self.__sessions.remove(maximo)
+
+		try:
+			maximo.close()
+		except Exception as e:
+			logger.debug(f"Error while closing session (ignored): {e}")
+
+
+	@staticmethod
+	def isAlive(maximo: MaximoAutomation):
+		"""Checks whether the browser of a session is still responding and logged in
+
+		Args:
+			maximo (MaximoAutomation): The session to check
+
+		Returns:
+			bool: True if the session can still be used
+		"""
+		try:
+			return bool(maximo.driver.execute_script("return !!document.getElementById('titlebar_hyperlink_9-lbsignout');"))
+		except Exception:
+			return False
+
+
+	def __recover(self, maximo: MaximoAutomation):
+		"""Replaces a dead session with a new one. If the new session can't be started, `None` is
+		returned and creation is retried the next time the slot is handed out.
+
+		Returns:
+			MaximoAutomation: The new session, or None
+		"""
+		if maximo is not None:
+			logger.warning("Session is not responding anymore. Replacing it with a new one...")
+			self.__closeSession(maximo)
+
+		try:
+			return self.__createSession()
+		except Exception as e:
+			logger.error(f"Could not replace dead session: {e}")
+			return None
+
+
+	@contextmanager
+	def session(self, timeout: float = None):
+		"""Borrows an idle session for the duration of the `with` block
+
+		Args:
+			timeout (float, optional): Max seconds to wait for a session to be free. Defaults to None (wait forever).
+
+		Raises:
+			MaximoError: If the pool is closed, no session is free before `timeout` or a session can't be started
+
+		Yields:
+			MaximoAutomation: A logged-in instance, for exclusive use inside the block
+		"""
+		if self.__closed:
+			raise MaximoError("Session pool is closed")
+
+		try:
+			maximo = self.__idle.get(timeout=timeout)
+		except queue.Empty:
+			raise MaximoError(f"No session became available within {timeout} seconds")
+
+		try:
+			if maximo is None:
+				maximo = self.__recover(None)
+
+				if maximo is None:
+					raise MaximoError("Could not start a new session")
+
+			yield maximo
+
+		except Exception:
+			# The task failed: if the browser died with it, the slot gets a new one
+			if maximo is not None and not self.isAlive(maximo):
+				maximo = self.__recover(maximo)
+
+			raise
+
+		finally:
+			self.__idle.put(maximo)
+
+
+	def __runTask(self, fn, args, kwargs):
+		attempt = 0
+		while True:
+			attempt += 1
+			session_died = False
+
+			try:
+				with self.session() as maximo:
+					try:
+						return fn(maximo, *args, **kwargs)
+					except Exception:
+						session_died = not self.isAlive(maximo)
+						raise
+
+			except Exception as e:
+				if not session_died or attempt > self.task_retries:
+					raise
+
+				logger.warning(f"Session died while running task (attempt {attempt} of {self.task_retries + 1}): {e}. Retrying...")
+
+
+	def submit(self, fn, *args, **kwargs):
+		"""Schedules `fn(maximo, *args, **kwargs)` to be run on the first free session
+
+		Args:
+			fn (callable): Function to execute. Receives the `MaximoAutomation` instance as first argument.
+
+		Returns:
+			concurrent.futures.Future: The future holding the result of `fn`
+		"""
+		if self.__closed:
+			raise MaximoError("Session pool is closed")
+
+		return self.__executor.submit(self.__runTask, fn, args, kwargs)
+
+
+	def map(self, fn, *iterables):
+		"""Same as `submit()`, but for every item of the iterables (like the built-in `map`)
+
+		Returns:
+			generator: The results of `fn`, in the same order of the input
+		"""
+		futures = [self.submit(fn, *items) for items in zip(*iterables)]
+
+		return (future.result() for future in futures)
+
+
+	def close(self, logout: bool = True):
+		"""Waits for the running tasks and closes every browser of the pool
+
+		Args:
+			logout (bool, optional): Whether to logout each session before closing it (recommended, to avoid running out of available sessions in Maximo). Defaults to True.
+		"""
+		if self.__closed:
+			return
+
+		self.__closed = True
+		self.__executor.shutdown(wait=True)
+
+		with self.__lock:
+			sessions = list(self.__sessions)
+
+		for maximo in sessions:
+			if logout:
+				try:
+					maximo.logout()
+				except Exception as e:
+					logger.debug(f"Error while logging out session (ignored): {e}")
+
+			self.__closeSession(maximo)
+
+		logger.info("Session pool closed")
+
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
@@ -0,0 +1,150 @@
+"""
+	Builds Maximo "Where Clause" queries (SQL conditions) from a Python filter specification
+"""
+import datetime
+import re
+
+
+class Raw(object):
+	"""
+		SQL fragment inserted into the query as it is (ex. `Raw("sysdate - 1")`). Never wrap user input with it!
+	"""
+
+	def __init__(self, sql: str):
+		self.sql = sql
+
+	def __repr__(self):
+		return f"Raw({self.sql!r})"
+
+
+# Operators accepted as keys of a condition dictionary (ex. { "reportdate": { ">=": "2021-01-01" } })
+OPERATORS = {
+	"=": "=",
+	"!=": "!=",
+	"<>": "!=",
+	"<": "<",
+	"<=": "<=",
+	">": ">",
+	">=": ">=",
+	"like": "LIKE",
+	"not like": "NOT LIKE",
+	"in": "IN",
+	"not in": "NOT IN",
+}
+
+COLUMN_NAME_REGEX = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+
+
+def quoteValue(value):
+	"""Converts a Python value into a SQL literal
+
+	Args:
+		value (any): A string, number, boolean, date/datetime or `Raw` fragment
+
+	Returns:
+		str: The SQL literal (strings are quoted and escaped)
+	"""
+	if isinstance(value, Raw):
+		return value.sql
+
+	if isinstance(value, bool):
+		return "1" if value else "0"
+
+	if isinstance(value, (int, float)):
+		return repr(value)
+
+	if isinstance(value, datetime.datetime):
+		value = value.strftime("%Y-%m-%d %H:%M:%S")
+
+	elif isinstance(value, datetime.date):
+		value = value.strftime("%Y-%m-%d")
+
+	return "'" + str(value).replace("'", "''") + "'"
+
+
+def _buildCondition(column: str, operator: str, value):
+	if operator not in OPERATORS:
+		raise ValueError(f"Unknown operator '{operator}'. Available operators: {list(OPERATORS.keys())}")
+
+	sql_operator = OPERATORS[operator]
+
+	if value is None:
+		if sql_operator == "=": return f"{column} IS NULL"
+		if sql_operator == "!=": return f"{column} IS NOT NULL"
+
+		raise ValueError(f"Operator '{operator}' cannot be used with None (column '{column}')")
+
+	if sql_operator in ("IN", "NOT IN"):
+		# A string is iterable too, but `list("APPR")` would be its characters
+		if isinstance(value, (str, bytes, Raw)) or not hasattr(value, "__iter__"):
+			raise ValueError(f"Operator '{operator}' needs a list of values (column '{column}'), got {value!r}")
+
+		values = list(value)
+		if not values:
+			# An empty list matches nothing (or everything, if negated)
+			return "1=0" if sql_operator == "IN" else "1=1"
+
+		return f"{column} {sql_operator} (" + ", ".join(quoteValue(item) for item in values) + ")"
+
+	return f"{column} {sql_operator} {quoteValue(value)}"
+
+
+def buildWhereClause(spec: dict):
+	"""Converts a filter specification into a Maximo "Where Clause".
+
+	Every key of `spec` is a column name and every value a condition, all joined with AND:
+		- scalar:		{ "status": "APPR" }						->	status = 'APPR'
+		- None:			{ "ownergroup": None }						->	ownergroup IS NULL
+		- list/tuple/set:	{ "status": ["APPR", "INPRG"] }				->	status IN ('APPR', 'INPRG')
+		- dict:			{ "reportdate": { ">=": d1, "<": d2 } }	->	reportdate >= '...' AND reportdate < '...'
+
+	The special keys "$or", "$and" (list of specifications) and "$not" (a specification) combine conditions:
+		{ "$or": [{ "status": "APPR" }, { "priority": { "<=": 2 } }] }	->	((status = 'APPR') OR (priority <= 2))
+
+	Dates are written as 'YYYY-MM-DD[ HH:MM:SS]' strings: use `Raw` if your database needs a function around them.
+
+	Args:
+		spec (dict): The filter specification
+
+	Raises:
+		ValueError: If a column name, an operator or a condition is not valid
+
+	Returns:
+		str: The where clause
+	"""
+	conditions = []
+
+	for key, value in spec.items():
+		if key in ("$or", "$and"):
+			sub_clauses = [buildWhereClause(sub_spec) for sub_spec in value]
+			if not sub_clauses:
+				raise ValueError(f"'{key}' needs at least one specification")
+
+			joiner = " OR " if key == "$or" else " AND "
+			conditions.append("(" + joiner.join(f"({clause})" for clause in sub_clauses) + ")")
+			continue
+
+		if key == "$not":
+			conditions.append(f"NOT ({buildWhereClause(value)})")
+			continue
+
+		if not COLUMN_NAME_REGEX.match(key):
+			raise ValueError(f"Invalid column name '{key}'")
+
+		if isinstance(value, dict):
+			if not value:
+				raise ValueError(f"Empty condition for column '{key}'")
+
+			for operator, operand in value.items():
+				conditions.append(_buildCondition(key, operator.lower(), operand))
+
+		elif isinstance(value, (list, tuple, set, frozenset)):
+			conditions.append(_buildCondition(key, "in", value))
+
+		else:
+			conditions.append(_buildCondition(key, "=", value))
+
+	if not conditions:
+		raise ValueError("The specification is empty")
+
+	return " AND ".join(conditions)
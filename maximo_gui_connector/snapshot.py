@@ -0,0 +1,314 @@
+"""
+	Snapshot of the rendered Maximo page, parsed locally so that many read-only queries cost a single WebDriver round trip
+"""
+import re
+from html.parser import HTMLParser
+
+
+# Returns the HTML of the page, with the current value of the inputs (a property, which `page_source` doesn't include) copied into their attributes
+JS_DOM_SNAPSHOT = """
+	let clone = document.documentElement.cloneNode(true);
+	let originals = document.querySelectorAll("input, textarea, select");
+	let copies = clone.querySelectorAll("input, textarea, select");
+
+	originals.forEach((original, index) => {
+		let copy = copies[index];
+		if (!copy) return;
+
+		if (original.type === "checkbox" || original.type === "radio") {
+			if (original.checked) copy.setAttribute("checked", ""); else copy.removeAttribute("checked");
+			return;
+		}
+
+		copy.setAttribute("value", original.value);
+
+		// The chosen option (the "selected" attribute marks only the initial one)
+		if (original.tagName === "SELECT") {
+			Array.from(original.options).forEach((option, option_index) => {
+				if (option.selected) copy.options[option_index].setAttribute("selected", ""); else copy.options[option_index].removeAttribute("selected");
+			});
+		}
+	});
+
+	return clone.outerHTML;
+"""
+
+# Elements that never have children nor an end tag
+VOID_ELEMENTS = ("area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr")
+
+# Elements whose content is not visible text
+HIDDEN_ELEMENTS = ("script", "style", "template", "noscript")
+
+
+class Node(object):
+	__slots__ = ("tag", "attrs", "children", "parent")
+
+	def __init__(self, tag: str, attrs: dict, parent = None):
+		self.tag = tag
+		self.attrs = attrs
+		self.children = []
+		self.parent = parent
+
+	@property
+	def id(self):
+		return self.attrs.get("id", "")
+
+	@property
+	def classes(self):
+		return (self.attrs.get("class") or "").split()
+
+	def elements(self):
+		""" The child elements (without the text nodes) """
+		return [child for child in self.children if isinstance(child, Node)]
+
+	def iter(self):
+		""" Every descendant element, in document order """
+		stack = list(reversed(self.elements()))
+		while stack:
+			node = stack.pop()
+			yield node
+			stack.extend(reversed(node.elements()))
+
+	def find(self, predicate):
+		return [node for node in self.iter() if predicate(node)]
+
+	def findFirst(self, predicate):
+		return next((node for node in self.iter() if predicate(node)), None)
+
+	def text(self):
+		""" Approximation of `innerText`: the text of the visible descendants, with collapsed whitespace """
+		parts = []
+		stack = [self]
+		while stack:
+			node = stack.pop()
+			if isinstance(node, str):
+				parts.append(node)
+				continue
+
+			if node.tag in HIDDEN_ELEMENTS:
+				continue
+			if node.tag == "br":
+				parts.append("\n")
+
+			stack.extend(reversed(node.children))
+
+		return re.sub(r"[ \t\r\f\v]+", " ", re.sub(r"\s*\n\s*", "\n", "".join(parts))).strip()
+
+
+class _TreeBuilder(HTMLParser):
+	def __init__(self):
+		super().__init__(convert_charrefs=True)
+
+		self.root = Node("#document", {})
+		self.ids = {}
+		self.__current = self.root
+
+	def handle_starttag(self, tag, attrs):
+		node = Node(tag, { name: value if value is not None else "" for name, value in attrs }, self.__current)
+		self.__current.children.append(node)
+
+		if "id" in node.attrs:
+			self.ids.setdefault(node.attrs["id"], node)
+
+		if tag not in VOID_ELEMENTS:
+			self.__current = node
+
+	def handle_startendtag(self, tag, attrs):
+		self.handle_starttag(tag, attrs)
+
+		if tag not in VOID_ELEMENTS:
+			self.__current = self.__current.parent
+
+	def handle_endtag(self, tag):
+		# Close up to the matching element (browsers always serialize the end tags, but be tolerant)
+		node = self.__current
+		while node is not self.root and node.tag != tag:
+			node = node.parent
+
+		if node is not self.root:
+			self.__current = node.parent
+
+	def handle_data(self, data):
+		self.__current.children.append(data)
+
+
+class DomSnapshot(object):
+	"""
+		Parsed copy of the page, answering the same read-only queries of `MaximoAutomation` (labels, inputs,
+		table headers and rows, dialogs, list filters) without going back to the browser
+	"""
+
+	def __init__(self, html: str):
+		"""
+		Args:
+			html (str): The HTML of the page (see `JS_DOM_SNAPSHOT`)
+		"""
+		builder = _TreeBuilder()
+		builder.feed(html)
+		builder.close()
+
+		self.root = builder.root
+		self.__ids = builder.ids
+		self.__labels = None
+
+	def getElementById(self, element_id: str):
+		return self.__ids.get(element_id)
+
+	def labels(self):
+		"""
+		Returns:
+			dict: The ids of the fields bound to every label (`label.text.label[for]`), by label text
+		"""
+		if self.__labels is None:
+			self.__labels = {}
+
+			for label in self.root.find(lambda node: node.tag == "label" and "for" in node.attrs):
+				classes = label.classes
+				if len(classes) != 2 or "text" not in classes or "label" not in classes:
+					continue
+
+				text = label.text()
+				input_id = label.attrs["for"].strip()
+				if text and input_id:
+					self.__labels.setdefault(text, []).append(input_id)
+
+		return self.__labels
+
+	def inputValue(self, label: str):
+		"""Returns the value of the first field bound to a label
+
+		Args:
+			label (str): The EXACT label text (ex. "Status:")
+
+		Returns:
+			str: The value, or None if no field has that label
+		"""
+		for input_id in self.labels().get(label.strip(), []):
+			field = self.getElementById(input_id)
+			if field is None:
+				continue
+
+			# `JS_DOM_SNAPSHOT` copies the current value into the attribute (the content of a textarea is its initial value)
+			if field.tag in ("input", "textarea", "select") and "value" in field.attrs:
+				return field.attrs["value"]
+
+			if field.tag == "select":
+				option = field.findFirst(lambda node: node.tag == "option" and "selected" in node.attrs)
+				return option.attrs.get("value", option.text()) if option else ""
+
+			if field.tag == "input":
+				return ""
+
+			return field.text()
+
+		return None
+
+	def inputValues(self, labels: list):
+		"""
+		Returns:
+			dict: The value of every label (see `inputValue()`)
+		"""
+		return { label: self.inputValue(label) for label in labels }
+
+	def __headerRow(self):
+		return self.getElementById("m6a7dfd2f_tbod_ttrow-tr")
+
+	def tableHeaders(self):
+		"""
+		Returns:
+			list: Same as `MaximoAutomation.getTableHeaders()`: [{ "id": cell index, "text": header }]
+		"""
+		header = self.__headerRow()
+		if header is None:
+			return []
+
+		headers = []
+		for index, cell in enumerate(cell for cell in header.elements() if cell.tag in ("th", "td")):
+			text = cell.text()
+			if cell.tag == "th" and text:
+				headers.append({ "id": index, "text": text })
+
+		return headers
+
+	def tableRows(self, columns: list = None):
+		"""
+		Args:
+			columns (list, optional): Names of the columns to return (Case Insensitive). Defaults to None (all the columns).
+
+		Returns:
+			tuple: The headers (list) and the rows (list of (cell values, row element id))
+		"""
+		wanted = set(column.strip().lower() for column in columns) if columns else None
+		headers = [header for header in self.tableHeaders() if wanted is None or header["text"].lower() in wanted]
+
+		body = self.getElementById("m6a7dfd2f_tbod-tbd")
+		if body is None:
+			return [header["text"] for header in headers], []
+
+		rows = []
+		for row in body.find(lambda node: node.tag == "tr" and "tablerow" in node.classes and node.id.startswith("m6a7dfd2f_tbod_tdrow-tr[")):
+			cells = [cell for cell in row.elements() if cell.tag in ("td", "th")]
+			rows.append(([cells[header["id"]].text() if header["id"] < len(cells) else None for header in headers], row.id))
+
+		return [header["text"] for header in headers], rows
+
+	def dialogs(self):
+		"""
+		Returns:
+			list: Same as `MaximoAutomation.detectDialogs()`, but "buttons" is the list of the button texts and "html" is None
+		"""
+		dialogs = []
+
+		for dialog in self.root.find(lambda node: node.id.endswith("-dialog_inner")):
+			wait_element = self.getElementById(f"{dialog.id}_dialogwait")
+
+			head = dialog.findFirst(lambda node: node.id.endswith("-dialog_content0"))
+			content = dialog.findFirst(lambda node: node.id.endswith("-dialog_content1"))
+			body = content.findFirst(lambda node: "_bodydiv" in node.id) if content else None
+
+			buttons = content.find(lambda node: node.tag == "button" and "pb" in node.classes and node.attrs.get("type") == "button" and node.attrs.get("ctype") == "pushbutton") if content else []
+
+			dialogs.append({
+				"is_foreground": wait_element is not None and "wait_modal" in wait_element.classes,
+				"title": head.text() if head else "",
+				"text": re.sub(r"\r?\n", " ", body.text(), count=1).strip() if body else "",
+				"type": dialog.attrs.get("role"),
+				"buttons": [button.text() for button in buttons],
+				"html": None,
+			})
+
+		return dialogs
+
+	def listFilters(self):
+		"""
+		Returns:
+			dict: Same as `MaximoAutomation.getAvailableFiltersInListView()`: "column name" (lowercase): { "element_id", "sorting", "column_number" }
+		"""
+		header = self.__headerRow()
+		if header is None:
+			return {}
+
+		# Filter inputs, by the id of the column they belong to (the filter row comes before the inputs of the data cells)
+		inputs = {}
+		for input_element in self.root.find(lambda node: node.tag == "input" and node.parent is not None and "headers" in node.parent.attrs):
+			inputs.setdefault(input_element.parent.attrs["headers"], input_element.id)
+
+		filters = {}
+		for cell in header.elements():
+			if cell.tag != "th":
+				continue
+
+			label = next((child for child in cell.elements() if child.id.endswith("_ttitle-lb")), None)
+			if label is None or not label.text():
+				continue
+
+			image = cell.findFirst(lambda node: node.tag == "img")
+			regex_result = re.search(r"\[C:([0-9]+)\]", cell.id)
+
+			filters[label.text().lower()] = {
+				"element_id": inputs.get(cell.id, ""),
+				"sorting": image.attrs.get("alt") if image else None,
+				"column_number": regex_result.group(1).strip() if regex_result else None,
+			}
+
+		return filters
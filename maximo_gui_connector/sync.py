@@ -0,0 +1,267 @@
+"""
+	Incremental synchronization of a Maximo list view into a local SQLite database
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+from maximo_gui_connector.main import MaximoError
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Format of the dates saved in the store (sortable as text)
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+class RecordStore(object):
+	"""
+		SQLite database holding the rows of one or more list views (keyed by sync name and record ID),
+		together with the high-watermark of every sync. It can be queried directly by downstream consumers:
+
+			SELECT json_extract(data, '$.Status') FROM records WHERE sync = 'my_changes'
+	"""
+
+	def __init__(self, path: str):
+		"""
+		Args:
+			path (str): Path of the SQLite database (created if it doesn't exist). Use ":memory:" for a temporary one.
+		"""
+		self.path = path
+
+		self.__lock = threading.Lock()
+		self.__connection = sqlite3.connect(path, check_same_thread=False)
+
+		with self.__connection:
+			self.__connection.executescript("""
+				CREATE TABLE IF NOT EXISTS records (
+					sync		TEXT NOT NULL,
+					record_id	TEXT NOT NULL,
+					data		TEXT NOT NULL,
+					changed_at	TEXT,
+					synced_at	REAL NOT NULL,
+					PRIMARY KEY (sync, record_id)
+				);
+				CREATE INDEX IF NOT EXISTS records_changed_at ON records (sync, changed_at);
+
+				CREATE TABLE IF NOT EXISTS watermarks (
+					sync		TEXT PRIMARY KEY,
+					watermark	TEXT NOT NULL,
+					updated_at	REAL NOT NULL
+				);
+			""")
+
+	def upsert(self, sync: str, records: dict, changed_at: dict = {}):
+		"""Inserts or updates the rows of a sync
+
+		Args:
+			sync (str): Name of the sync
+			records (dict): The rows' data by record ID
+			changed_at (dict, optional): Change date (in `DATE_FORMAT`) by record ID. Defaults to {}.
+
+		Returns:
+			dict: Number of rows "inserted", "updated" and "unchanged"
+		"""
+		result = { "inserted": 0, "updated": 0, "unchanged": 0 }
+		now = time.time()
+
+		with self.__lock, self.__connection:
+			for record_id, data in records.items():
+				serialized = json.dumps(data, sort_keys=True)
+
+				row = self.__connection.execute("SELECT data FROM records WHERE sync = ? AND record_id = ?", (sync, record_id)).fetchone()
+				if row is None:
+					result["inserted"] += 1
+				elif row[0] != serialized:
+					result["updated"] += 1
+				else:
+					result["unchanged"] += 1
+
+				self.__connection.execute("""
+					INSERT OR REPLACE INTO records (sync, record_id, data, changed_at, synced_at) VALUES (?, ?, ?, ?, ?)
+				""", (sync, record_id, serialized, changed_at.get(record_id), now))
+
+		return result
+
+	def get(self, sync: str, record_id: str):
+		"""
+		Returns:
+			dict: The data of the row, or None if it is not in the store
+		"""
+		with self.__lock:
+			row = self.__connection.execute("SELECT data FROM records WHERE sync = ? AND record_id = ?", (sync, record_id)).fetchone()
+
+		return json.loads(row[0]) if row else None
+
+	def records(self, sync: str, changed_since: datetime = None):
+		"""Returns the rows of a sync
+
+		Args:
+			sync (str): Name of the sync
+			changed_since (datetime, optional): Only the rows changed at or after this date. Defaults to None (all the rows).
+
+		Returns:
+			dict: The rows' data by record ID, most recently changed first
+		"""
+		query = "SELECT record_id, data FROM records WHERE sync = ?"
+		params = [sync]
+
+		if changed_since is not None:
+			query += " AND changed_at >= ?"
+			params.append(changed_since.strftime(DATE_FORMAT))
+
+		with self.__lock:
+			rows = self.__connection.execute(query + " ORDER BY changed_at DESC", params).fetchall()
+
+		return { record_id: json.loads(data) for record_id, data in rows }
+
+	def getWatermark(self, sync: str):
+		"""
+		Returns:
+			datetime: The most recent change date synchronized so far, or None if the sync never ran
+		"""
+		with self.__lock:
+			row = self.__connection.execute("SELECT watermark FROM watermarks WHERE sync = ?", (sync,)).fetchone()
+
+		return datetime.strptime(row[0], DATE_FORMAT) if row else None
+
+	def setWatermark(self, sync: str, watermark: datetime):
+		with self.__lock, self.__connection:
+			self.__connection.execute("""
+				INSERT OR REPLACE INTO watermarks (sync, watermark, updated_at) VALUES (?, ?, ?)
+			""", (sync, watermark.strftime(DATE_FORMAT), time.time()))
+
+	def reset(self, sync: str):
+		""" Deletes the rows and the watermark of a sync, so that the next run is a full one """
+		with self.__lock, self.__connection:
+			self.__connection.execute("DELETE FROM records WHERE sync = ?", (sync,))
+			self.__connection.execute("DELETE FROM watermarks WHERE sync = ?", (sync,))
+
+	def close(self):
+		self.__connection.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+
+class IncrementalSync(object):
+	"""
+		Fetches from a list view only the rows changed since the previous run (using a filter on a change date column)
+		and upserts them into a `RecordStore`:
+
+			store = RecordStore("changes.db")
+			sync = IncrementalSync(maximo, store, "changes", id_column="Change", date_column="Changed Date", filters={ "owner group": "MYGROUP" })
+
+			sync.run()	# The first run fetches everything, the next ones only what changed
+	"""
+
+	def __init__(self, maximo, store: RecordStore, section: str, id_column: str, date_column: str, filters: dict = {}, date_format: str = "%m/%d/%y %I:%M %p", overlap: timedelta = timedelta(minutes=5), name: str = None):
+		"""
+		Args:
+			maximo (MaximoAutomation): A logged in instance
+			store (RecordStore): Where the rows are saved
+			section (str): The section containing the list view (see `MaximoAutomation.goto_section()`)
+			id_column (str): Column holding the record ID (ex. "Change")
+			date_column (str): Column holding the last change date of the record (ex. "Changed Date")
+			filters (dict, optional): Filters identifying the list (see `MaximoAutomation.setFilters()`). Defaults to {}.
+			date_format (str, optional): `strptime` format of the dates shown by Maximo (and accepted by its filters). Defaults to "%m/%d/%y %I:%M %p".
+			overlap (timedelta, optional): How far before the watermark the next run starts, to cover the rounding of the displayed dates and late commits. Defaults to 5 minutes.
+			name (str, optional): Name of the sync inside the store. Defaults to `section`.
+		"""
+		self.maximo = maximo
+		self.store = store
+		self.section = section
+		self.id_column = id_column
+		self.date_column = date_column
+		self.filters = dict(filters)
+		self.date_format = date_format
+		self.overlap = overlap
+		self.name = name or section
+
+	def parseDate(self, value: str):
+		"""
+		Returns:
+			datetime: The parsed date, or None if `value` is empty or not in `date_format`
+		"""
+		try:
+			return datetime.strptime(value.strip(), self.date_format)
+		except (AttributeError, ValueError):
+			return None
+
+	def run(self, full: bool = False):
+		"""Fetches the rows changed since the last run and saves them into the store
+
+		Args:
+			full (bool, optional): Ignore the watermark and fetch the whole list. Defaults to False.
+
+		Raises:
+			MaximoError: If `id_column`, `date_column` or one of the filters is not a column of the list (the rows couldn't be identified or the date filter would be ignored)
+
+		Returns:
+			dict: Summary of the run: rows "fetched", "inserted", "updated", "unchanged" and the new "watermark"
+		"""
+		self.maximo.goto_section(self.section)
+
+		columns = self.maximo.getAvailableFiltersInListView()
+		# The rows are keyed by the header text as shown in the table, whatever the case used in the configuration
+		headers = { header["text"].strip().lower(): header["text"] for header in self.maximo.getTableHeaders() }
+
+		unknown_columns = [column for column in [self.id_column, self.date_column] if str(column).strip().lower() not in headers]
+		unknown_columns += [column for column in self.filters if str(column).strip().lower() not in columns]
+		if unknown_columns:
+			raise MaximoError(f"[Sync '{self.name}'] Column/s {unknown_columns} not found in the list view. Available columns: {list(columns.keys())}")
+
+		id_header = headers[self.id_column.strip().lower()]
+		date_header = headers[self.date_column.strip().lower()]
+
+		watermark = None if full else self.store.getWatermark(self.name)
+
+		filters = dict(self.filters)
+		# Always set the date filter, so that a value left there by a previous run doesn't hide rows
+		filters[self.date_column] = (">=" + (watermark - self.overlap).strftime(self.date_format)) if watermark else ""
+
+		if watermark:
+			logger.info(f"[Sync '{self.name}'] Fetching rows changed since {watermark}")
+		else:
+			logger.info(f"[Sync '{self.name}'] No watermark found. Fetching the whole list")
+
+		self.maximo.setFilters(filters)
+
+		records = {}
+		changed_at = {}
+		new_watermark = watermark
+
+		for row in self.maximo.iterRecordsFromTable():
+			data = row["data"]
+
+			record_id = data.get(id_header, "").strip()
+			if not record_id:
+				logger.warning(f"[Sync '{self.name}'] Skipping row without '{self.id_column}': {data}")
+				continue
+
+			records[record_id] = data
+
+			changed = self.parseDate(data.get(date_header, ""))
+			if changed is None:
+				continue
+
+			changed_at[record_id] = changed.strftime(DATE_FORMAT)
+			if new_watermark is None or changed > new_watermark:
+				new_watermark = changed
+
+		result = self.store.upsert(self.name, records, changed_at)
+		if new_watermark is not None:
+			self.store.setWatermark(self.name, new_watermark)
+
+		result["fetched"] = len(records)
+		result["watermark"] = new_watermark
+
+		logger.info(f"[Sync '{self.name}'] {result['fetched']} rows fetched ({result['inserted']} new, {result['updated']} updated)")
+
+		return result
@@ -0,0 +1,264 @@
+"""
+	Compact, columnar representation of the rows harvested from a Maximo list table
+"""
+import re
+from array import array
+
+
+def attributeName(header: str):
+	"""Converts a column header into the name used for attribute access (ex. "Owner Group" -> "owner_group")
+
+	Args:
+		header (str): The column header
+
+	Returns:
+		str: The attribute name
+	"""
+	return re.sub(r"\W+", "_", header).strip("_").lower()
+
+
+class _Column(object):
+	"""
+		Dictionary encoded column: every distinct value is stored once, and each row holds a 4-byte code
+	"""
+	__slots__ = ("values", "codes", "lookup")
+
+	def __init__(self):
+		self.values = []
+		self.codes = array("I")
+		self.lookup = {}
+
+	def append(self, value: str):
+		code = self.lookup.get(value)
+
+		if code is None:
+			code = len(self.values)
+			self.lookup[value] = code
+			self.values.append(value)
+
+		self.codes.append(code)
+
+	def __getitem__(self, index: int):
+		return self.values[self.codes[index]]
+
+	def __len__(self):
+		return len(self.codes)
+
+	def tolist(self):
+		values = self.values
+		return [values[code] for code in self.codes]
+
+
+class RowView(object):
+	"""
+		Read-only view over a single row of a `ColumnarTable`. Columns are accessible both as
+		items (`row["Owner Group"]`) and as attributes (`row.owner_group`).
+
+		The names of the members (`data`, `element_id`, `get`, `asdict`) are reserved: a column with one of
+		those attribute names (ex. "Data") is reachable only as an item (`row["Data"]`)
+	"""
+	__slots__ = ("_table", "_index")
+
+	def __init__(self, table, index: int):
+		self._table = table
+		self._index = index
+
+	@property
+	def element_id(self):
+		""" The id of the row element in the page """
+		return self._table._element_ids[self._index]
+
+	@property
+	def data(self):
+		""" The row as a dictionary (same as the "data" key of `MaximoAutomation.getTableRowsAll()` rows) """
+		return { header: column[self._index] for header, column in zip(self._table.headers, self._table._columns) }
+
+	def __getitem__(self, header: str):
+		return self._table._columns[self._table._header_index[header]][self._index]
+
+	def __getattr__(self, name: str):
+		# Attribute names of the columns never start with "_". Private names are looked up here only when the slots 
+		# are not set yet (ex. by `copy` and `pickle`, which create the object without calling `__init__()`)
+		if name.startswith("_"):
+			raise AttributeError(name)
+
+		try:
+			column = self._table._columns[self._table._attribute_index[name]]
+		except KeyError:
+			raise AttributeError(f"Row has no column named '{name}'") from None
+
+		return column[self._index]
+
+	def get(self, header: str, default = None):
+		return self[header] if header in self._table._header_index else default
+
+	def asdict(self):
+		"""Returns the row in the same structure of `MaximoAutomation.getTableRowsAll()`
+
+		Returns:
+			dict: { "data": { header: value }, "element_id": id }
+		"""
+		return { "data": self.data, "element_id": self.element_id }
+
+	def __repr__(self):
+		return f"RowView({self.data!r})"
+
+
+class ColumnarTable(object):
+	"""
+		Rows of a list table stored by column: the headers are kept once and every column is dictionary
+		encoded, so that big harvests (where values like status or owner group repeat a lot) stay small in memory
+	"""
+
+	def __init__(self, headers: list):
+		"""
+		Args:
+			headers (list): The column headers, in order
+		"""
+		self.headers = list(headers)
+
+		self._columns = [_Column() for _ in self.headers]
+		self._element_ids = _Column()
+
+		self._header_index = { header: index for index, header in enumerate(self.headers) }
+		self._attribute_index = { attributeName(header): index for index, header in enumerate(self.headers) }
+
+	@classmethod
+	def fromRecords(cls, records: list):
+		"""Builds the table from rows in the structure returned by `MaximoAutomation.getTableRowsAll()`
+
+		Args:
+			records (list): List of { "data": { header: value }, "element_id": id }
+
+		Returns:
+			ColumnarTable: The new table
+		"""
+		headers = list(dict.fromkeys(header for record in records for header in record["data"]))
+		table = cls(headers)
+
+		for record in records:
+			table.append([record["data"].get(header, "") for header in headers], record["element_id"])
+
+		return table
+
+	def append(self, values: list, element_id: str = ""):
+		"""Adds a row
+
+		Args:
+			values (list): The values of the row, in the same order of `headers`
+			element_id (str, optional): The id of the row element in the page. Defaults to "".
+		"""
+		if len(values) != len(self.headers):
+			raise ValueError(f"Expected {len(self.headers)} values, got {len(values)}")
+
+		for column, value in zip(self._columns, values):
+			column.append(value)
+
+		self._element_ids.append(element_id)
+
+	def extend(self, other):
+		"""Appends all the rows of another table with the same headers
+
+		Args:
+			other (ColumnarTable): The table to append
+		"""
+		if other.headers != self.headers:
+			raise ValueError(f"Cannot merge tables with different headers: {self.headers} != {other.headers}")
+
+		for index in range(len(other)):
+			self.append([column[index] for column in other._columns], other._element_ids[index])
+
+	def head(self, count: int):
+		"""Returns a new table containing only the first `count` rows
+
+		Args:
+			count (int): Number of rows to keep
+
+		Returns:
+			ColumnarTable: The new table
+		"""
+		if count >= len(self):
+			return self
+
+		table = ColumnarTable(self.headers)
+		for index in range(count):
+			table.append([column[index] for column in self._columns], self._element_ids[index])
+
+		return table
+
+	def column(self, header: str):
+		"""Returns all the values of a column
+
+		Args:
+			header (str): The column header
+
+		Returns:
+			list: The values, one for each row
+		"""
+		return self._columns[self._header_index[header]].tolist()
+
+	@property
+	def element_ids(self):
+		return self._element_ids.tolist()
+
+	def toRecords(self):
+		"""Converts the table back to the structure returned by `MaximoAutomation.getTableRowsAll()`
+
+		Returns:
+			list: List of { "data": { header: value }, "element_id": id }
+		"""
+		return [row.asdict() for row in self]
+
+	def to_pandas(self, include_element_id: bool = False):
+		"""Exports the table as a pandas DataFrame (requires `pandas`)
+
+		Args:
+			include_element_id (bool, optional): Add the row element ids as a column named "element_id". Defaults to False.
+
+		Returns:
+			pandas.DataFrame: The table
+		"""
+		try:
+			import pandas
+		except ImportError:
+			raise ImportError("pandas is required to use `to_pandas()`. Install it with `pip install pandas`") from None
+
+		data = { header: pandas.Categorical.from_codes(column.codes, column.values) if column.values else [] for header, column in zip(self.headers, self._columns) }
+		if include_element_id:
+			data["element_id"] = self.element_ids
+
+		return pandas.DataFrame(data, columns=list(data.keys()))
+
+	def to_numpy(self):
+		"""Exports the values as a 2D NumPy array of objects, with shape (rows, columns) (requires `numpy`)
+
+		Returns:
+			numpy.ndarray: The values
+		"""
+		try:
+			import numpy
+		except ImportError:
+			raise ImportError("numpy is required to use `to_numpy()`. Install it with `pip install numpy`") from None
+
+		result = numpy.empty((len(self), len(self.headers)), dtype=object)
+		for index, column in enumerate(self._columns):
+			result[:, index] = numpy.asarray(column.values, dtype=object)[numpy.frombuffer(column.codes, dtype=numpy.uint32)] if len(column) else []
+
+		return result
+
+	def __len__(self):
+		return len(self._element_ids)
+
+	def __getitem__(self, index: int):
+		if index < 0: index += len(self)
+		if not 0 <= index < len(self):
+			raise IndexError("Row index out of range")
+
+		return RowView(self, index)
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield RowView(self, index)
+
+	def __repr__(self):
+		return f"ColumnarTable(headers={self.headers!r}, rows={len(self)})"
@@ -0,0 +1,196 @@
+"""
+	Change detection on Maximo list views: only the rows added, changed or removed since the previous poll are reported
+"""
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def rowHash(data: dict):
+	"""
+	Returns:
+		bytes: Digest of the row values (independent from the order of the columns)
+	"""
+	return hashlib.blake2b(json.dumps(data, sort_keys=True).encode("utf-8"), digest_size=16).digest()
+
+
+class ListWatcher(object):
+	"""
+		Polls a filtered list view and compares every row (by hash) with the previous snapshot, keyed by record ID:
+
+			watcher = ListWatcher(maximo, "changes", { "owner group": "MYGROUP", "status": "!=CLOSE" }, date_column="Changed Date")
+
+			for events in watcher.watch(interval=60):
+				for event in events:
+					print(event["type"], event["id"])
+
+		With a `date_column`, every poll sorts the list by it (most recent first, see `MaximoAutomation.sortListView()`) and
+		paging stops at the first row older than the previous poll: such a pass can't see the removed rows, which are 
+		reported on the full passes (see `full_every`).
+	"""
+
+	def __init__(self, maximo, section: str, filters: dict = {}, id_column: str = None, date_column: str = None, date_format: str = "%m/%d/%y %I:%M %p", overlap: timedelta = timedelta(minutes=5), full_every: int = 10, columns: list = None, emit_initial: bool = False):
+		"""
+		Args:
+			maximo (MaximoAutomation): A logged in instance
+			section (str): The section containing the list view (see `MaximoAutomation.goto_section()`)
+			filters (dict, optional): Filters identifying the list (see `MaximoAutomation.setFilters()`). Defaults to {}.
+			id_column (str, optional): Column holding the record ID. Defaults to None (the first column of the list).
+			date_column (str, optional): Change date column to sort the list by (descending), enabling the early stop of paging. Defaults to None (every poll reads the whole list).
+			date_format (str, optional): `strptime` format of the dates shown by Maximo. Defaults to "%m/%d/%y %I:%M %p".
+			overlap (timedelta, optional): How far before the previous poll the early stop happens, to cover the rounding of the displayed dates and late commits. Defaults to 5 minutes.
+			full_every (int, optional): Read the whole list (and report removals) once every this many polls. Defaults to 10.
+			columns (list, optional): Columns to read and compare (Case Insensitive). Defaults to None (all the columns).
+			emit_initial (bool, optional): Report every row of the first poll as "added". Defaults to False (the first poll only takes the snapshot).
+		"""
+		self.maximo = maximo
+		self.section = section
+		self.filters = dict(filters)
+		self.id_column = id_column
+		self.date_column = date_column
+		self.date_format = date_format
+		self.overlap = overlap
+		self.full_every = max(1, full_every)
+		self.columns = columns
+		self.emit_initial = emit_initial
+
+		# Record ID -> (hash, row data)
+		self.snapshot = None
+		self.polls = 0
+
+		self.__watermark = None
+		self.__sorted = date_column is not None
+
+		# `id_column` and `date_column` as written in the table header (the rows are keyed by it)
+		self.__id_header = None
+		self.__date_header = None
+
+	def parseDate(self, value: str):
+		try:
+			return datetime.strptime(value.strip(), self.date_format)
+		except (AttributeError, ValueError):
+			return None
+
+	def __resolveHeaders(self):
+		"""
+		Raises:
+			MaximoError: If `id_column` or `date_column` is not a column of the list
+		"""
+		# Imported here since `main` imports this module
+		from maximo_gui_connector.main import MaximoError
+
+		headers = { header["text"].strip().lower(): header["text"] for header in self.maximo.getTableHeaders() }
+
+		unknown_columns = [column for column in [self.id_column, self.date_column] if column is not None and column.strip().lower() not in headers]
+		if unknown_columns:
+			raise MaximoError(f"[Watch] Column/s {unknown_columns} not found in the list view. Available columns: {list(headers.values())}")
+
+		self.__id_header = headers[self.id_column.strip().lower()] if self.id_column else None
+		self.__date_header = headers[self.date_column.strip().lower()] if self.date_column else None
+
+	def poll(self):
+		"""Reads the list and compares it with the previous snapshot
+
+		Raises:
+			MaximoError: If `id_column` or `date_column` is not a column of the list
+
+		Returns:
+			list: The events, each one in the form { "type": "added"|"changed"|"removed", "id": record ID, "row": current data (None if removed), "previous": previous data (None if added) }
+		"""
+		first_poll = self.snapshot is None
+		full_pass = first_poll or not self.__sorted or self.polls % self.full_every == 0
+		cutoff = None if full_pass or self.__watermark is None else self.__watermark - self.overlap
+
+		if first_poll:
+			self.maximo.goto_section(self.section)
+			self.__resolveHeaders()
+
+		# Applying the filters again also refreshes the list
+		self.maximo.setFilters(self.filters)
+		self.polls += 1
+
+		# Clicks only when the order was lost (ex. on the first poll or after a re-login)
+		if self.__sorted:
+			self.maximo.sortListView(self.date_column, descending=True)
+
+		last_date = [None]
+
+		def isOlderThanCutoff(row):
+			changed = self.parseDate(row["data"].get(self.__date_header, ""))
+			if changed is None:
+				return False
+
+			if self.__sorted and last_date[0] is not None and changed > last_date[0]:
+				logger.warning(f"[Watch] The list is not sorted by '{self.date_column}' (descending). Paging will not stop early anymore")
+				self.__sorted = False
+
+			last_date[0] = changed
+
+			return self.__sorted and cutoff is not None and changed < cutoff
+
+		seen = {}
+		for row in self.maximo.iterRecordsFromTable(columns=self.columns, stop_when=isOlderThanCutoff if self.date_column else None):
+			data = row["data"]
+
+			if self.__id_header is None:
+				self.__id_header = next(iter(data), None)
+
+			record_id = data.get(self.__id_header, "").strip()
+			if record_id:
+				seen[record_id] = (rowHash(data), data)
+
+		# The early stop may have been disabled while paging: in that case the list was read completely
+		full_pass = full_pass or not self.__sorted
+
+		if self.date_column:
+			dates = [date for date in (self.parseDate(data.get(self.__date_header, "")) for _, data in seen.values()) if date is not None]
+			if dates and (self.__watermark is None or max(dates) > self.__watermark):
+				self.__watermark = max(dates)
+
+		events = []
+		previous = self.snapshot or {}
+
+		if not first_poll or self.emit_initial:
+			for record_id, (digest, data) in seen.items():
+				if record_id not in previous:
+					events.append({ "type": "added", "id": record_id, "row": data, "previous": None })
+				elif previous[record_id][0] != digest:
+					events.append({ "type": "changed", "id": record_id, "row": data, "previous": previous[record_id][1] })
+
+		if full_pass and not first_poll:
+			for record_id, (digest, data) in previous.items():
+				if record_id not in seen:
+					events.append({ "type": "removed", "id": record_id, "row": None, "previous": data })
+
+			self.snapshot = seen
+		else:
+			# Rows not read in this pass keep their last known state
+			self.snapshot = { **previous, **seen }
+
+		logger.info(f"[Watch] Poll {self.polls} ({'full' if full_pass else 'partial'}, {len(seen)} rows read): {len(events)} event/s")
+
+		return events
+
+	def watch(self, interval: float = 60, max_polls: int = None):
+		"""Polls the list every `interval` seconds
+
+		Args:
+			interval (float, optional): Seconds between the start of two polls. Defaults to 60.
+			max_polls (int, optional): Stop after this many polls. Defaults to None (forever).
+
+		Yields:
+			list: The events of each poll (see `poll()`). Empty lists are yielded too, so that the caller can stop the loop.
+		"""
+		while max_polls is None or self.polls < max_polls:
+			start = time.time()
+			yield self.poll()
+
+			if max_polls is not None and self.polls >= max_polls:
+				break
+
+			self.maximo.sleep(max(0, interval - (time.time() - start)))
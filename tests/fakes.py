@@ -0,0 +1,443 @@
+"""
+	Recording stand-in for a Selenium WebDriver showing a Maximo list view. It answers the scripts of the library
+	by recognizing them, and records every command, so that the tests can count the round trips of the operations.
+"""
+import html
+import os
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from maximo_gui_connector.snapshot import JS_DOM_SNAPSHOT
+
+
+LOGIN_URL = "http://maximo.test/maximo/webclient/login/login.jsp"
+UI_URL = "http://maximo.test/maximo/ui/"
+
+# Elements of the login page, by id
+LOGIN_ELEMENTS = ("j_username", "j_password", "loginbutton")
+
+# Elements always present in the page, by id
+STATIC_ELEMENTS = (
+	"titlebar-tb_gotoButton",
+	"titlebar_hyperlink_9-lbsignout",
+	"m6a7dfd2f-lb3",
+	"m6a7dfd2f-ti2_img",
+	"m6a7dfd2f-ti7_img",
+	"quicksearch",
+	"quicksearchQSImage",
+	"m397b0593-tabs_middle",
+)
+
+
+class FakeElement(object):
+	def __init__(self, driver, element_id: str):
+		self.driver = driver
+		self.id = element_id
+
+	def click(self):
+		self.driver.execute("clickElement", { "id": self.id })
+
+	def clear(self):
+		self.driver.execute("clearElement", { "id": self.id })
+
+	def send_keys(self, *value):
+		self.driver.execute("sendKeysToElement", { "id": self.id, "text": "".join(value) })
+
+	def get_attribute(self, name: str):
+		return self.driver.execute("getElementAttribute", { "id": self.id, "name": name })["value"]
+
+	def is_displayed(self):
+		return self.driver.execute("isElementDisplayed", { "id": self.id })["value"]
+
+
+class FakeMaximoServer(object):
+	"""
+		Sessions of a Maximo server, shared by the browsers logging into it. Any username is accepted with `password`.
+	"""
+
+	def __init__(self, password: str = "password"):
+		self.password = password
+		self.sessions = set()
+		self.logins = 0
+
+	def login(self, username: str, password: str):
+		"""
+		Returns:
+			str: The id of the new session, or None if the credentials are wrong
+		"""
+		if not username or password != self.password:
+			return None
+
+		self.logins += 1
+		session = f"session-{self.logins}"
+		self.sessions.add(session)
+
+		return session
+
+	def expire(self):
+		""" Every session times out """
+		self.sessions.clear()
+
+
+class FakeMaximoDriver(object):
+	"""
+		Shows a list view of `rows` changes (`page_size` rows per page) and a detail view with the fields in `fields`.
+		With a `server`, the browser starts on the login page and the session is kept in a cookie (otherwise it is 
+		always logged in).
+	"""
+
+	def __init__(self, rows: int = 45, page_size: int = 20, fields: dict = None, server: FakeMaximoServer = None):
+		self.headers = ["Change", "Summary", "Status"]
+		self.rows = [[f"CH{index + 1:07}", f"Summary of record {index + 1}", "APPR"] for index in range(rows)]
+		self.page_size = page_size
+		self.page = 0
+
+		self.fields = dict(fields or { "Status:": "APPR", "Summary:": "Summary of record 1" })
+		self.dialogs = []
+		# Values of the last `setFilters()`
+		self.filters = {}
+		# Column the list is sorted by, and its order ("ascending" or "descending")
+		self.sorting = None
+
+		# Record opened by the quick search, and the fields shown for each record (`fields` when not listed)
+		self.record = None
+		self.record_fields = {}
+		self.__search = ""
+
+		self.server = server
+		self.logged_in = server is None
+		self.cookies = []
+		self.__credentials = {}
+		self.__logout_page = False
+
+		# The browser crashed: every command fails
+		self.dead = False
+
+		self.current_url = None
+		# Every command sent, in order, and the scripts run
+		self.commands = []
+		self.scripts = []
+
+		# DevTools commands sent, and the ones answered with an error (ex. not available in an old Chrome)
+		self.cdp_commands = []
+		self.unsupported_cdp = set()
+		self.download_path = None
+
+		# Answer of the server to `ping()`, and the URLs requested
+		self.ping_response = { "status": 200, "redirected": False }
+		self.pinged_urls = []
+
+	@property
+	def pages(self):
+		return max(1, -(-len(self.rows) // self.page_size))
+
+	def pageRows(self):
+		start = self.page * self.page_size
+		return [(row, f"m6a7dfd2f_tbod_tdrow-tr[R:{start + index}]") for index, row in enumerate(self.rows[start:start + self.page_size])]
+
+	# ------------------------------------------------------------------------------------------------
+	# WebDriver API (Selenium 3 names, as used by the library)
+	# ------------------------------------------------------------------------------------------------
+	def execute(self, driver_command: str, params: dict = None):
+		self.commands.append(driver_command)
+		if self.dead and driver_command != "quit":
+			raise WebDriverException("chrome not reachable")
+
+		return { "value": getattr(self, "_" + driver_command)(params or {}) }
+
+	def quit(self):
+		self.execute("quit")
+
+	def get_cookies(self):
+		return self.execute("getAllCookies")["value"]
+
+	def add_cookie(self, cookie: dict):
+		self.execute("addCookie", { "cookie": cookie })
+
+	def delete_all_cookies(self):
+		self.execute("deleteAllCookies")
+
+	def get(self, url: str):
+		self.execute("get", { "url": url })
+
+	def set_script_timeout(self, seconds: float):
+		self.execute("setTimeouts", { "script": int(seconds * 1000) })
+
+	def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+		self.execute("executeCdpCommand", { "cmd": cmd, "params": cmd_args })
+		return {}
+
+	def execute_script(self, script: str, *args):
+		return self.execute("executeScript", { "script": script, "args": list(args) })["value"]
+
+	def execute_async_script(self, script: str, *args):
+		return self.execute("executeAsyncScript", { "script": script, "args": list(args) })["value"]
+
+	def find_element(self, by: str = "id", value: str = None):
+		return self.execute("findElement", { "using": by, "value": value })["value"]
+
+	def find_elements(self, by: str = "id", value: str = None):
+		return self.execute("findElements", { "using": by, "value": value })["value"]
+
+	def find_element_by_id(self, element_id: str):
+		return self.find_element("id", element_id)
+
+	def find_elements_by_id(self, element_id: str):
+		return self.find_elements("id", element_id)
+
+	def find_element_by_css_selector(self, selector: str):
+		return self.find_element("css selector", selector)
+
+	def find_elements_by_css_selector(self, selector: str):
+		return self.find_elements("css selector", selector)
+
+	# ------------------------------------------------------------------------------------------------
+	# Command handlers
+	# ------------------------------------------------------------------------------------------------
+	def __elementId(self, params: dict):
+		value = params["value"]
+		# Only "#id" and "tag#id" selectors (ex. "button#loginbutton") are used by the library
+		return value.rsplit("#", 1)[-1] if params["using"] == "css selector" else value
+
+	def __exists(self, element_id: str):
+		if self.__logout_page:
+			return element_id == "submit"
+
+		if not self.logged_in:
+			return element_id in LOGIN_ELEMENTS
+
+		return element_id in STATIC_ELEMENTS or element_id == "menu0_changeapp_startcntr_a"
+
+	def __hasValidSession(self):
+		return any(cookie["name"] == "JSESSIONID" and cookie["value"] in self.server.sessions for cookie in self.cookies)
+
+	def _quit(self, params):
+		return None
+
+	def _getAllCookies(self, params):
+		return [dict(cookie) for cookie in self.cookies]
+
+	def _addCookie(self, params):
+		self.cookies = [cookie for cookie in self.cookies if cookie["name"] != params["cookie"]["name"]] + [dict(params["cookie"])]
+
+	def _deleteAllCookies(self, params):
+		self.cookies = []
+
+	def _get(self, params):
+		self.current_url = params["url"]
+		self.__logout_page = False
+
+		if self.server is not None:
+			# The login page is always shown, the other pages only with a valid session
+			self.logged_in = params["url"] != LOGIN_URL and self.__hasValidSession()
+
+	def _setTimeouts(self, params):
+		return None
+
+	def _findElement(self, params):
+		element_id = self.__elementId(params)
+		if not self.__exists(element_id):
+			raise NoSuchElementException(f"No element '{params['value']}'")
+
+		return FakeElement(self, element_id)
+
+	def _findElements(self, params):
+		element_id = self.__elementId(params)
+		return [FakeElement(self, element_id)] if self.__exists(element_id) else []
+
+	def openRecord(self, record_id: str):
+		""" Shows the detail view of a record, as if the user opened it """
+		self.record = record_id
+		self.fields = dict(self.record_fields.get(record_id, self.fields))
+
+	def _clickElement(self, params):
+		if params["id"] == "loginbutton":
+			session = self.server.login(self.__credentials.get("j_username"), self.__credentials.get("j_password"))
+			if session is not None:
+				self.cookies = [{ "name": "JSESSIONID", "value": session, "path": "/maximo", "domain": "maximo.test" }]
+				self.current_url = UI_URL + "?event=loadapp&value=startcntr&uisessionid=1"
+				self.logged_in = True
+
+		elif params["id"].startswith("dialog-"):
+			# A button of a dialog closes it
+			self.dialogs = []
+
+		elif params["id"] == "submit":
+			# Confirmation of the logout: back to the login page
+			self.__logout_page = False
+			self.logged_in = False
+
+		elif params["id"] == "m6a7dfd2f-ti7_img" and self.page < self.pages - 1:
+			self.page += 1
+		elif params["id"] == "quicksearchQSImage":
+			self.openRecord(self.__search)
+
+	def _clearElement(self, params):
+		return None
+
+	def _sendKeysToElement(self, params):
+		if params["id"] == "quicksearch":
+			self.__search = params["text"]
+		elif params["id"] in LOGIN_ELEMENTS:
+			self.__credentials[params["id"]] = params["text"]
+
+	def _isElementDisplayed(self, params):
+		return True
+
+	def _getElementAttribute(self, params):
+		element_id, name = params["id"], params["name"]
+
+		if element_id == "m6a7dfd2f-lb3" and name == "innerText":
+			start = self.page * self.page_size
+			return f"{start + 1} - {min(start + self.page_size, len(self.rows))} of {len(self.rows)}"
+
+		if element_id == "m6a7dfd2f-ti7_img" and name == "source":
+			return "tablebtn_next_on.gif" if self.page < self.pages - 1 else "tablebtn_next_off.gif"
+
+		if name == "class":
+			return "fld"
+
+		return ""
+
+	def _executeCdpCommand(self, params):
+		if params["cmd"] in self.unsupported_cdp:
+			raise WebDriverException(f"'{params['cmd']}' wasn't found")
+
+		self.cdp_commands.append(params["cmd"])
+		if params["cmd"].endswith(".setDownloadBehavior"):
+			self.download_path = params["params"]["downloadPath"]
+
+	def _executeAsyncScript(self, params):
+		if "fetch(url" in params["script"]:
+			# `ping()`
+			self.pinged_urls.append(params["args"][0])
+			return self.ping_response
+
+		# `waitUntilReady()`: the page is always ready
+		return True
+
+	def _executeScript(self, params):
+		script, args = params["script"], params["args"]
+		self.scripts.append(script)
+
+		if script == JS_DOM_SNAPSHOT:
+			return self.renderPage()
+
+		if "getElementById('j_username')" in script:
+			# `isSessionExpired()`
+			return not self.logged_in
+
+		if "getElementById('titlebar_hyperlink_9-lbsignout')" in script:
+			# `MaximoSessionPool.isAlive()`
+			return self.logged_in
+
+		if "LOGOUTURL" in script:
+			if self.server is not None:
+				self.server.sessions.difference_update(cookie["value"] for cookie in self.cookies)
+
+			self.__logout_page = True
+			return None
+
+		if "known_signatures" in script:
+			filters = { header.lower(): { "element_id": f"filter-{index}", "sorting": None, "label_id": f"m6a7dfd2f_ttrow_[C:{index}]-c" } for index, header in enumerate(self.headers) }
+			return { "target": "mp2change", "signature": "|".join(self.headers), "filters": filters }
+
+		if "tablebtn_filter_off.gif" in script:
+			return True
+
+		if "input_ids" in script:
+			self.page = 0
+			self.filters = dict(args[0])
+			return { name: "set" if name.lower() in [header.lower() for header in self.headers] else "missing" for name in args[0] }
+
+		if script.startswith("sendEvent("):
+			# `goto_section()`
+			self.page = 0
+			return None
+
+		if "let [column, wanted, click]" in script:
+			# `sortListView()`: clicking a title sorts ascending, then toggles the order
+			column, wanted, click = args
+			index = next((index for index, header in enumerate(self.headers) if header.lower() == column), None)
+			if index is None:
+				return "missing"
+
+			sorting = self.sorting[1] if self.sorting and self.sorting[0] == index else None
+			if sorting != wanted and click:
+				order = "descending" if sorting == "ascending" else "ascending"
+				self.sorting = (index, order)
+				self.rows.sort(key=lambda row: row[index], reverse=order == "descending")
+				self.page = 0
+
+			return sorting
+
+		if "#menu0 li" in script:
+			return [{ "id": "menu0_changeapp_mp2change_a", "href": "javascript: sendEvent('changeapp', 'startcntr', 'mp2change')", "text": "Changes (MP)" }]
+
+		if "/download/i" in script:
+			# `exportTable()`: the whole list is saved at once into the download directory
+			with open(os.path.join(self.download_path, "export.xls"), "w", encoding="utf-8") as f:
+				f.write(self.renderExport())
+
+			return True
+
+		if "detectMaximoDialogs" in script:
+			return self.dialogs
+
+		if "labels[text]" in script:
+			return { text: "set" if text in self.fields else "missing" for text in args[0] }
+
+		if "targets.has(text)" in script:
+			return { text: self.fields[text] for text in args[0] if text in self.fields }
+
+		if "let wanted" in script:
+			wanted = set(column.lower() for column in args[0]) if args[0] else None
+			indexes = [index for index, header in enumerate(self.headers) if wanted is None or header.lower() in wanted]
+
+			rows = self.pageRows()
+			if args[1]:
+				data = [[row[index] for index in indexes] for row, element_id in rows]
+			else:
+				data = [{ self.headers[index]: row[index] for index in indexes } for row, element_id in rows]
+
+			return { "headers": [self.headers[index] for index in indexes], "rows": data, "ids": [element_id for row, element_id in rows] }
+
+		if "m6a7dfd2f_tbod_ttrow-tr th" in script:
+			return [{ "id": index + 1, "text": header } for index, header in enumerate(self.headers)]
+
+		raise AssertionError(f"Unexpected script: {script.strip()[:200]}")
+
+	def renderPage(self):
+		""" The HTML of the page, as returned by `JS_DOM_SNAPSHOT` """
+		headers = "".join(f'<th id="m6a7dfd2f_ttrow_[C:{index}]-c"><span id="m6a7dfd2f_ttrow_[C:{index}]_ttitle-lb">{html.escape(header)}</span></th>' for index, header in enumerate(self.headers))
+		rows = "".join(
+			f'<tr class="tablerow" id="{element_id}"><td></td>' + "".join(f"<td>{html.escape(value)}</td>" for value in row) + "</tr>"
+			for row, element_id in self.pageRows()
+		)
+		filters = "".join(f'<td headers="m6a7dfd2f_ttrow_[C:{index}]-c"><input id="filter-{index}"></td>' for index in range(len(self.headers)))
+		dialogs = "".join(
+			f'<div id="d{index}-dialog_inner" role="{dialog["type"]}"><div id="d{index}-dialog_content0">{html.escape(dialog["title"])}</div>'
+			f'<div id="d{index}-dialog_content1"><div id="d{index}_bodydiv">{html.escape(dialog["text"])}</div>'
+			+ "".join(f'<button class="text pb" type="button" ctype="pushbutton">{html.escape(text)}</button>' for text in dialog["buttons"])
+			+ f'</div></div><div id="d{index}-dialog_inner_dialogwait" class="{"wait_modal" if dialog["is_foreground"] else ""}"></div>'
+			for index, dialog in enumerate(self.dialogs)
+		)
+		fields = "".join(
+			f'<label class="text label" for="field-{index}">{html.escape(label)}</label><input id="field-{index}" value="{html.escape(value)}">'
+			for index, (label, value) in enumerate(self.fields.items())
+		)
+
+		return (
+			'<html><head></head><body>'
+			f'<table><tbody><tr id="m6a7dfd2f_tbod_ttrow-tr"><th></th>{headers}</tr><tr><td></td>{filters}</tr></tbody>'
+			f'<tbody id="m6a7dfd2f_tbod-tbd">{rows}</tbody></table>'
+			f'{fields}{dialogs}'
+			'</body></html>'
+		)
+
+	def renderExport(self):
+		""" The file saved by the "Download" button of the table (an HTML table with the .xls extension) """
+		headers = "".join(f"<th>{html.escape(header)}</th>" for header in self.headers)
+		rows = "".join("<tr>" + "".join(f"<td>{html.escape(value)}</td>" for value in row) + "</tr>" for row in self.rows)
+
+		return f"<html><body><table><tr>{headers}</tr>{rows}</table></body></html>"
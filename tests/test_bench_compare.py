@@ -0,0 +1,21 @@
+from benchmarks.bench_operations import compare
+
+
+BASELINE = { "timings": { "login": 1.0, "paging MB": 10 }, "commands": { "setFilters": 9 } }
+
+
+def test_no_regressions_within_tolerance():
+	assert compare({ "login": 1.2, "new scenario": 5.0 }, { "setFilters": 9 }, BASELINE, 0.25) == []
+
+
+def test_regressions():
+	regressions = compare({ "login": 1.5, "paging MB": 50 }, { "setFilters": 10 }, BASELINE, 0.25)
+
+	# Memory figures are informative only
+	assert len(regressions) == 2
+	assert regressions[0].startswith("login: 1.500s")
+	assert regressions[1] == "setFilters: 10 WebDriver commands (baseline 9)"
+
+
+def test_empty_baseline_has_no_regressions():
+	assert compare({ "login": 1.5 }, { "setFilters": 10 }, { "settings": {}, "timings": {}, "commands": {} }, 0.25) == []
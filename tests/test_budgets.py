@@ -0,0 +1,92 @@
+import pytest
+
+from maximo_gui_connector.budget import COMMAND_BUDGETS, CommandBudget
+from maximo_gui_connector.main import MaximoAutomation, MaximoBudgetExceeded
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver
+
+
+def newMaximo(**kwargs):
+	return MaximoAutomation({ "driver": FakeMaximoDriver(**kwargs), "instrumentation": True }, login_url=LOGIN_URL)
+
+
+def test_every_budget_is_checked():
+	assert set(COMMAND_BUDGETS) == { "get_sections", "detectDialogs", "setNamedInput", "setFilters", "getAllRecordsFromTable" }
+
+
+def test_get_sections_budget():
+	maximo = newMaximo()
+
+	with CommandBudget(maximo.instrumentation, "get_sections"):
+		sections = maximo.get_sections(force_rescan=True)
+
+	assert "changes" in sections
+
+
+def test_detect_dialogs_budget():
+	maximo = newMaximo()
+
+	with CommandBudget(maximo.instrumentation, "detectDialogs"):
+		assert maximo.detectDialogs() == []
+
+
+def test_set_named_input_budget():
+	maximo = newMaximo()
+
+	with CommandBudget(maximo.instrumentation, "setNamedInput"):
+		maximo.setNamedInput({ "Status:": "INPRG", "Summary:": "New summary" })
+
+
+def test_set_filters_budget():
+	maximo = newMaximo()
+
+	with CommandBudget(maximo.instrumentation, "setFilters"):
+		maximo.setFilters({ "status": "APPR", "change": "CH%" })
+
+
+@pytest.mark.parametrize("rows, pages", [(5, 1), (45, 3), (200, 10)])
+def test_get_all_records_budget(rows, pages):
+	maximo = newMaximo(rows=rows, page_size=20)
+
+	with CommandBudget(maximo.instrumentation, "getAllRecordsFromTable", pages=pages):
+		records = maximo.getAllRecordsFromTable()
+
+	assert len(records) == rows
+	assert records[-1]["data"]["Change"] == f"CH{rows:07}"
+
+
+def test_budget_exceeded():
+	maximo = newMaximo()
+
+	with pytest.raises(MaximoBudgetExceeded) as error:
+		with CommandBudget(maximo.instrumentation, "setFilters", limit=2):
+			maximo.setFilters({ "status": "APPR" })
+
+	assert error.value.operation == "setFilters"
+	assert error.value.used > 2
+
+
+def test_budget_does_not_hide_errors():
+	maximo = newMaximo()
+
+	with pytest.raises(ZeroDivisionError):
+		with CommandBudget(maximo.instrumentation, "detectDialogs", limit=0):
+			maximo.detectDialogs()
+			1 / 0
+
+
+def test_budget_needs_instrumentation():
+	with pytest.raises(ValueError):
+		CommandBudget(None, "setFilters")
+
+	with pytest.raises(ValueError):
+		CommandBudget(newMaximo().instrumentation, "unknownOperation")
+
+
+def test_budget_matches_instrumentation():
+	maximo = newMaximo()
+
+	with CommandBudget(maximo.instrumentation, "setFilters") as budget:
+		maximo.setFilters({ "status": "APPR" })
+
+	assert budget.used == maximo.instrumentation.toDict()["setFilters"]["commands"]
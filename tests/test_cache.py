@@ -0,0 +1,73 @@
+import multiprocessing
+import os
+import time
+
+from maximo_gui_connector.cache import FileCache
+
+
+def _setMany(path: str, prefix: str, count: int):
+	cache = FileCache(path)
+	for index in range(count):
+		cache.set(f"{prefix}{index}", index)
+
+
+def test_file_cache_roundtrip(tmp_path):
+	cache = FileCache(str(tmp_path / "nested" / "cache.json"))
+
+	assert cache.get("missing", "default") == "default"
+
+	cache.set("key", { "a": [1, 2] })
+	assert cache.get("key") == { "a": [1, 2] }
+
+	# A new instance reads the same file
+	assert FileCache(cache.path).get("key") == { "a": [1, 2] }
+
+
+def test_file_cache_ttl(tmp_path):
+	cache = FileCache(str(tmp_path / "cache.json"), ttl=0.05)
+	cache.set("key", "value")
+
+	assert cache.get("key") == "value"
+	time.sleep(0.1)
+	assert cache.get("key") is None
+
+
+def test_file_cache_invalidate(tmp_path):
+	cache = FileCache(str(tmp_path / "cache.json"))
+	cache.set("a", 1)
+	cache.set("b", 2)
+
+	cache.invalidate("a")
+	assert cache.get("a") is None
+	assert cache.get("b") == 2
+
+	cache.invalidate()
+	assert cache.get("b") is None
+
+
+def test_file_cache_ignores_corrupted_file(tmp_path):
+	path = tmp_path / "cache.json"
+	path.write_text("{ not json")
+
+	cache = FileCache(str(path))
+	assert cache.get("key") is None
+
+	cache.set("key", "value")
+	assert cache.get("key") == "value"
+
+
+def test_file_cache_concurrent_processes_keep_every_update(tmp_path):
+	path = str(tmp_path / "cache.json")
+
+	processes = [multiprocessing.Process(target=_setMany, args=(path, f"p{index}-", 20)) for index in range(4)]
+	for process in processes: process.start()
+	for process in processes: process.join(30)
+
+	assert all(process.exitcode == 0 for process in processes)
+
+	cache = FileCache(path)
+	missing = [f"p{index}-{key}" for index in range(4) for key in range(20) if cache.get(f"p{index}-{key}") is None]
+	assert missing == []
+
+	# No temporary file is left behind
+	assert [name for name in os.listdir(tmp_path) if name.startswith(".tmp-")] == []
@@ -0,0 +1,131 @@
+import logging
+import os
+import stat
+from types import SimpleNamespace
+
+import pytest
+
+from maximo_gui_connector import daemon
+from maximo_gui_connector.daemon import DaemonRequestHandler, MaximoDaemon
+from maximo_gui_connector.main import MaximoError
+
+
+def newPool():
+	return SimpleNamespace(config={})
+
+
+def test_unix_socket_is_created_private(tmp_path):
+	path = str(tmp_path / "maximo.sock")
+
+	server = MaximoDaemon(newPool(), path)
+	try:
+		assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+	finally:
+		server.server_close()
+
+	# The umask of the process is restored
+	current = os.umask(0o022)
+	os.umask(current)
+	assert current != 0o177
+
+
+def test_stale_unix_socket_is_replaced(tmp_path):
+	path = str(tmp_path / "maximo.sock")
+
+	# A socket left by a previous run that was killed
+	MaximoDaemon(newPool(), path).server_close()
+	assert stat.S_ISSOCK(os.lstat(path).st_mode)
+
+	server = MaximoDaemon(newPool(), path)
+	server.server_close()
+
+
+def test_existing_file_is_never_removed(tmp_path):
+	path = tmp_path / "important.txt"
+	path.write_text("data")
+
+	with pytest.raises(MaximoError, match="is not a socket"):
+		MaximoDaemon(newPool(), str(path))
+
+	assert path.read_text() == "data"
+
+
+@pytest.mark.parametrize("header, authorized", [
+	("Bearer secret", True),
+	("Bearer wrong", False),
+	("secret", False),
+	(None, False),
+])
+def test_authorization_header(header, authorized):
+	handler = SimpleNamespace(server=SimpleNamespace(token="secret"), headers={ "Authorization": header } if header else {})
+	assert DaemonRequestHandler.isAuthorized(handler) is authorized
+
+
+def test_tcp_without_token_warns(caplog):
+	with caplog.at_level(logging.WARNING, logger="maximo_gui_connector.daemon"):
+		server = MaximoDaemon(newPool(), ("127.0.0.1", 0))
+		server.server_close()
+
+	assert "No token set" in caplog.text
+
+
+def test_tcp_with_token_does_not_warn(caplog):
+	with caplog.at_level(logging.WARNING, logger="maximo_gui_connector.daemon"):
+		server = MaximoDaemon(newPool(), ("127.0.0.1", 0), token="secret")
+		server.server_close()
+
+	assert caplog.text == ""
+
+
+def test_main_requires_a_token_on_tcp(monkeypatch, capsys):
+	monkeypatch.setenv("MAXIMO_USERNAME", "user")
+	monkeypatch.setenv("MAXIMO_PASSWORD", "password")
+	monkeypatch.delenv("MAXIMO_DAEMON_TOKEN", raising=False)
+
+	def unexpectedPool(*args, **kwargs):
+		raise AssertionError("No session must be started")
+
+	monkeypatch.setattr(daemon, "MaximoSessionPool", unexpectedPool)
+
+	with pytest.raises(SystemExit):
+		daemon.main(["--port", "0"])
+
+	assert "MAXIMO_DAEMON_TOKEN" in capsys.readouterr().err
+
+
+def test_main_refuses_a_socket_path_that_is_not_a_socket(tmp_path, monkeypatch, capsys):
+	monkeypatch.setenv("MAXIMO_USERNAME", "user")
+	monkeypatch.setenv("MAXIMO_PASSWORD", "password")
+
+	path = tmp_path / "important.txt"
+	path.write_text("data")
+
+	with pytest.raises(SystemExit):
+		daemon.main(["--socket", str(path)])
+
+	assert "is not a socket" in capsys.readouterr().err
+	assert path.read_text() == "data"
+
+
+@pytest.mark.parametrize("argv, keepalive", [
+	([], 300),
+	(["--keepalive", "60"], 60),
+	(["--keepalive", "0"], None),
+])
+def test_main_keeps_the_sessions_alive(monkeypatch, argv, keepalive):
+	monkeypatch.setenv("MAXIMO_USERNAME", "user")
+	monkeypatch.setenv("MAXIMO_PASSWORD", "password")
+	monkeypatch.setenv("MAXIMO_DAEMON_TOKEN", "secret")
+
+	configs = []
+	def failingPool(size, username, password, config, login_url):
+		configs.append(config)
+		raise MaximoError("Login failed")
+
+	monkeypatch.setattr(daemon, "MaximoSessionPool", failingPool)
+
+	with pytest.raises(SystemExit):
+		daemon.main(["--port", "0"] + argv)
+
+	assert configs[0]["keepalive_interval"] == keepalive
+	assert configs[0]["auto_relogin"] is True
@@ -0,0 +1,76 @@
+import os
+import tempfile
+
+import pytest
+
+from maximo_gui_connector import main
+from maximo_gui_connector.cache import FileCache
+from maximo_gui_connector.driver import resolveChromeDriver
+from maximo_gui_connector.main import MaximoAutomation, MaximoError
+
+
+def test_pinned_driver_is_used_as_it_is(tmp_path):
+	driver_path = tmp_path / "chromedriver"
+	driver_path.write_text("")
+
+	assert resolveChromeDriver(None, str(driver_path)) == str(driver_path)
+
+
+def test_missing_pinned_driver(tmp_path):
+	assert resolveChromeDriver(None, str(tmp_path / "missing")) is None
+
+
+def test_missing_pinned_driver_error_names_the_path(tmp_path):
+	with pytest.raises(MaximoError, match="chromedriver_path"):
+		MaximoAutomation({ "chromedriver_path": str(tmp_path / "missing") })
+
+
+def test_offline_without_driver_error(tmp_path, monkeypatch):
+	monkeypatch.setattr("maximo_gui_connector.driver.getChromeVersion", lambda: None)
+
+	with pytest.raises(MaximoError, match="offline"):
+		MaximoAutomation({ "offline": True })
+
+
+def test_profile_copy_is_removed_when_the_browser_cannot_start(tmp_path, monkeypatch):
+	driver_path = tmp_path / "chromedriver"
+	driver_path.write_text("")
+
+	template = tmp_path / "template"
+	template.mkdir()
+	(template / "Preferences").write_text("{}")
+
+	profiles = tmp_path / "profiles"
+	profiles.mkdir()
+	monkeypatch.setattr(tempfile, "tempdir", str(profiles))
+
+	def failingChrome(*args, **kwargs):
+		raise RuntimeError("Chrome could not start")
+
+	monkeypatch.setattr(main.webdriver, "Chrome", failingChrome)
+
+	with pytest.raises(RuntimeError):
+		MaximoAutomation({ "chromedriver_path": str(driver_path), "profile_template": str(template) })
+
+	assert os.listdir(profiles) == []
+
+
+def test_chrome_version_is_detected_only_with_a_cache(tmp_path, monkeypatch):
+	calls = []
+	monkeypatch.setattr("maximo_gui_connector.driver.getChromeVersion", lambda: calls.append(True) or "120.0.6099.109")
+
+	assert resolveChromeDriver(None, offline=True) is None
+	assert calls == []
+
+	assert resolveChromeDriver(str(tmp_path), offline=True) is None
+	assert calls == [True]
+
+
+def test_cached_driver_is_used_offline(tmp_path, monkeypatch):
+	monkeypatch.setattr("maximo_gui_connector.driver.getChromeVersion", lambda: "120.0.6099.109")
+
+	driver_path = tmp_path / "chromedriver"
+	driver_path.write_text("")
+	FileCache(str(tmp_path / "chromedriver.json")).set("120.0.6099.109", str(driver_path))
+
+	assert resolveChromeDriver(str(tmp_path), offline=True) == str(driver_path)
@@ -0,0 +1,131 @@
+from types import SimpleNamespace
+
+import pytest
+
+from maximo_gui_connector import export, main
+from maximo_gui_connector.export import iterExportRows, parseExport
+from maximo_gui_connector.main import MaximoAutomation, MaximoError
+from maximo_gui_connector.table import ColumnarTable
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver
+
+
+HTML_EXPORT = """<html><body><table>
+	<tr><th>Change</th><th>Summary</th><th>Status</th></tr>
+	<tr><td>CH001</td><td>First<br>line &amp; more</td><td>APPR</td></tr>
+	<tr><td>CH002</td><td>  Second   </td><td>INPRG</td></tr>
+</table></body></html>"""
+
+
+def test_html_rows_are_streamed_across_chunks(tmp_path, monkeypatch):
+	path = tmp_path / "export.xls"
+	path.write_text(HTML_EXPORT, encoding="utf-8")
+
+	# Tags and cells split between two reads
+	monkeypatch.setattr(export, "CHUNK_SIZE", 7)
+
+	assert list(iterExportRows(str(path))) == [
+		["Change", "Summary", "Status"],
+		["CH001", "First line & more", "APPR"],
+		["CH002", "Second", "INPRG"],
+	]
+
+
+def test_csv_dialect_is_detected(tmp_path):
+	path = tmp_path / "export.csv"
+	path.write_text("﻿Change;Summary\nCH001; First \n\nCH002;Second\n", encoding="utf-8")
+
+	assert list(iterExportRows(str(path))) == [["Change", "Summary"], ["CH001", "First"], ["CH002", "Second"]]
+
+
+def test_parse_export_selected_columns(tmp_path):
+	path = tmp_path / "export.xls"
+	path.write_text(HTML_EXPORT, encoding="utf-8")
+
+	assert parseExport(str(path), columns=["status", "CHANGE"]) == [
+		{ "data": { "Change": "CH001", "Status": "APPR" }, "element_id": "" },
+		{ "data": { "Change": "CH002", "Status": "INPRG" }, "element_id": "" },
+	]
+
+
+def test_parse_export_columnar_streams_rows(tmp_path, monkeypatch):
+	path = tmp_path / "export.csv"
+	path.write_text("Change,Summary\nCH001,First\nCH002\n", encoding="utf-8")
+
+	appended = []
+	monkeypatch.setattr(ColumnarTable, "append", lambda self, values, _append=ColumnarTable.append: appended.append(values) or _append(self, values))
+
+	table = parseExport(str(path), columnar=True)
+
+	# One row at a time, short rows padded
+	assert appended == [["CH001", "First"], ["CH002", ""]]
+	assert table.headers == ["Change", "Summary"]
+	assert len(table) == 2
+
+
+def test_parse_empty_export(tmp_path):
+	path = tmp_path / "export.csv"
+	path.write_text("", encoding="utf-8")
+
+	assert parseExport(str(path)) == []
+	assert len(parseExport(str(path), columnar=True)) == 0
+
+
+def newMaximo(tmp_path, driver):
+	return MaximoAutomation({ "driver": driver, "download_dir": str(tmp_path / "downloads") }, login_url=LOGIN_URL)
+
+
+def test_download_behavior_uses_the_browser_domain(tmp_path):
+	driver = FakeMaximoDriver()
+	newMaximo(tmp_path, driver)
+
+	assert driver.cdp_commands == ["Browser.setDownloadBehavior"]
+	assert driver.download_path == str(tmp_path / "downloads")
+
+
+def test_download_behavior_falls_back_on_old_browsers(tmp_path):
+	driver = FakeMaximoDriver()
+	driver.unsupported_cdp.add("Browser.setDownloadBehavior")
+	newMaximo(tmp_path, driver)
+
+	assert driver.cdp_commands == ["Page.setDownloadBehavior"]
+
+
+def test_export_table(tmp_path):
+	maximo = newMaximo(tmp_path, FakeMaximoDriver(rows=45))
+
+	sleeps = []
+	maximo.sleep = sleeps.append
+
+	records = maximo.getAllRecordsFromTable(export=True)
+
+	assert len(records) == 45
+	assert records[-1]["data"]["Change"] == "CH0000045"
+	# The file is checked until its size is stable, with a growing delay
+	assert sleeps == [0.1, 0.2]
+	assert list((tmp_path / "downloads").iterdir()) == []
+
+
+def test_export_table_wait_is_bounded(tmp_path, monkeypatch):
+	driver = FakeMaximoDriver()
+	maximo = newMaximo(tmp_path, driver)
+
+	# The file never shows up in the download directory
+	driver.download_path = str(tmp_path)
+
+	clock = [0.0]
+	monkeypatch.setattr(main, "time", SimpleNamespace(time=lambda: clock[0]))
+
+	sleeps = []
+	def sleep(seconds):
+		sleeps.append(seconds)
+		clock[0] += seconds
+
+	maximo.sleep = sleep
+
+	with pytest.raises(MaximoError, match="Timeout reached"):
+		maximo.exportTable(timeout=10)
+
+	assert sleeps[:6] == [0.1, 0.2, 0.4, 0.8, 1.6, 2.0]
+	assert max(sleeps) == 2.0
+	assert sum(sleeps) == pytest.approx(10)
@@ -0,0 +1,73 @@
+from maximo_gui_connector.instrumentation import Histogram, Instrumentation, isScriptCommand
+
+from tests.fakes import FakeMaximoDriver
+
+
+def test_is_script_command():
+	assert isScriptCommand("executeScript")
+	assert isScriptCommand("w3cExecuteScriptAsync")
+	assert not isScriptCommand("findElement")
+
+
+def test_histogram():
+	histogram = Histogram(buckets=(1, 2))
+	for value in (0.5, 1.5, 3):
+		histogram.observe(value)
+
+	result = histogram.toDict()
+	assert result["count"] == 3
+	assert result["min"] == 0.5 and result["max"] == 3
+	# Values above the last bucket are only counted in the total
+	assert result["buckets"] == { "1": 1, "2": 1 }
+
+
+def test_commands_are_accounted_to_every_running_operation():
+	instrumentation = Instrumentation()
+	driver = instrumentation.wrapDriver(FakeMaximoDriver())
+
+	# Wrapping twice must not count twice
+	assert instrumentation.wrapDriver(driver) is driver
+
+	with instrumentation.measure("outer"):
+		driver.execute_script("return 1 // detectMaximoDialogs")
+
+		with instrumentation.measure("waitUntilReady"):
+			driver.execute_async_script("return true")
+
+		instrumentation.recordSleep(0.25)
+
+	# Outside of any operation
+	driver.find_elements_by_id("quicksearch")
+
+	stats = instrumentation.toDict()
+	assert stats["outer"]["commands"] == 2
+	assert stats["outer"]["scripts"] == 2
+	assert stats["outer"]["sleep_time"] == 0.25
+	assert stats["outer"]["wait_time"] > 0
+	assert stats["waitUntilReady"]["commands_by_type"] == { "executeAsyncScript": 1 }
+
+
+def test_count_commands_records_no_statistic():
+	instrumentation = Instrumentation()
+	driver = instrumentation.wrapDriver(FakeMaximoDriver())
+
+	with instrumentation.countCommands() as commands:
+		driver.find_elements_by_id("quicksearch")
+		driver.find_elements_by_id("missing")
+
+	assert commands == { "findElements": 2 }
+	assert instrumentation.toDict() == {}
+
+
+def test_prometheus_format():
+	instrumentation = Instrumentation(buckets=(1,))
+	with instrumentation.measure("setFilters"):
+		instrumentation.recordCommand("executeScript")
+
+	text = instrumentation.toPrometheus()
+	assert 'maximo_operation_duration_seconds_bucket{operation="setFilters",le="+Inf"} 1' in text
+	assert 'maximo_webdriver_scripts_total{operation="setFilters"} 1' in text
+	assert text.endswith("\n")
+
+	instrumentation.reset()
+	assert instrumentation.toDict() == {}
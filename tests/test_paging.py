@@ -0,0 +1,86 @@
+import pytest
+
+from maximo_gui_connector.main import MaximoAutomation, MaximoError
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver
+
+
+def newMaximo(rows: int = 45, **config):
+	driver = FakeMaximoDriver(rows=rows, page_size=20)
+	return driver, MaximoAutomation(dict({ "driver": driver }, **config), login_url=LOGIN_URL)
+
+
+def ids(rows):
+	return [row["data"]["Change"] for row in rows]
+
+
+def test_every_page_is_read():
+	driver, maximo = newMaximo()
+
+	assert ids(maximo.iterRecordsFromTable()) == [f"CH{index:07}" for index in range(1, 46)]
+	assert driver.page == 2
+
+
+def test_max_records():
+	driver, maximo = newMaximo()
+
+	assert ids(maximo.iterRecordsFromTable(max_records=25)) == [f"CH{index:07}" for index in range(1, 26)]
+	# The page after the last record needed is not opened
+	assert driver.page == 1
+
+	driver.page = 0
+	assert ids(maximo.iterRecordsFromTable(max_records=20)) == [f"CH{index:07}" for index in range(1, 21)]
+	assert driver.page == 0
+
+
+def test_max_pages():
+	driver, maximo = newMaximo()
+
+	assert len(list(maximo.iterRecordsFromTable(max_pages=2))) == 40
+	assert driver.page == 1
+
+
+def test_stop_when():
+	driver, maximo = newMaximo()
+
+	rows = ids(maximo.iterRecordsFromTable(stop_when=lambda row: row["data"]["Change"] == "CH0000023"))
+
+	# The matching row is not yielded
+	assert rows == [f"CH{index:07}" for index in range(1, 23)]
+	assert driver.page == 1
+
+
+def test_by_page():
+	driver, maximo = newMaximo()
+
+	pages = list(maximo.iterRecordsFromTable(by_page=True, max_records=30))
+	assert [len(page) for page in pages] == [20, 10]
+
+	driver.page = 0
+	pages = list(maximo.iterRecordsFromTable(by_page=True, columnar=True, columns=["Change"]))
+	assert [len(page) for page in pages] == [20, 20, 5]
+	assert pages[2].headers == ["Change"]
+
+
+def test_using_the_instance_while_iterating_is_detected():
+	driver, maximo = newMaximo()
+
+	rows = maximo.iterRecordsFromTable()
+	next(rows)
+
+	# The filters change the list under the generator
+	maximo.setFilters({ "status": "INPRG" })
+
+	with pytest.raises(MaximoError, match="changed by another operation"):
+		list(rows)
+
+
+def test_read_only_queries_while_iterating_are_allowed():
+	driver, maximo = newMaximo()
+
+	count = 0
+	for row in maximo.iterRecordsFromTable():
+		maximo.getTableHeaders()
+		count += 1
+
+	assert count == 45
@@ -0,0 +1,174 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from maximo_gui_connector import pool
+from maximo_gui_connector.main import MaximoAutomation, MaximoError
+from maximo_gui_connector.pool import MaximoSessionPool
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver, FakeMaximoServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+	server = FakeMaximoServer()
+	server.drivers = []
+	server.unavailable = False
+
+	def newMaximo(config, **kwargs):
+		if server.unavailable:
+			raise WebDriverException("Chrome failed to start")
+
+		driver = FakeMaximoDriver(server=server)
+		server.drivers.append(driver)
+
+		return MaximoAutomation(dict(config, driver=driver), **kwargs)
+
+	# Every session of the pool gets a fake browser
+	monkeypatch.setattr(pool, "MaximoAutomation", newMaximo)
+
+	return server
+
+
+def newPool(size: int = 2, **kwargs):
+	return MaximoSessionPool(size, "user", "password", login_url=LOGIN_URL, **kwargs)
+
+
+def killBrowser(maximo):
+	maximo.driver.dead = True
+	maximo.driver.execute_script("return 1")
+
+
+def test_sessions_are_logged_in(server):
+	with newPool(size=3) as sessions:
+		assert server.logins == 3
+		assert list(sessions.map(lambda maximo, value: (MaximoSessionPool.isAlive(maximo), value), range(5))) == [(True, value) for value in range(5)]
+
+
+def test_a_custom_driver_cannot_be_shared(server):
+	with pytest.raises(MaximoError, match="cannot be shared"):
+		MaximoSessionPool(1, "user", "password", config={ "driver": FakeMaximoDriver() })
+
+
+def test_task_is_retried_on_a_fresh_session_when_its_browser_dies(server):
+	attempts = []
+
+	def task(maximo):
+		attempts.append(maximo)
+		if len(attempts) == 1:
+			killBrowser(maximo)
+
+		return maximo.username
+
+	with newPool(size=1) as sessions:
+		assert sessions.submit(task).result() == "user"
+
+		# The dead browser was closed and replaced by a new, logged in one
+		assert attempts[0] is not attempts[1]
+		assert attempts[0].driver.commands[-1] == "quit"
+		assert server.logins == 2
+
+
+def test_task_fails_when_the_retries_are_exhausted(server):
+	with newPool(size=1, task_retries=2) as sessions:
+		with pytest.raises(WebDriverException):
+			sessions.submit(killBrowser).result()
+
+		# One replacement for every attempt: the slot is usable again
+		assert server.logins == 4
+		assert sessions.submit(lambda maximo: MaximoSessionPool.isAlive(maximo)).result()
+
+
+def test_errors_of_live_sessions_are_not_retried(server):
+	calls = []
+
+	def task(maximo):
+		calls.append(maximo)
+		raise ValueError("Bad record")
+
+	with newPool(size=1) as sessions:
+		with pytest.raises(ValueError):
+			sessions.submit(task).result()
+
+		assert len(calls) == 1
+		assert server.logins == 1
+
+
+def test_dead_session_is_replaced_on_the_next_borrow(server):
+	with newPool(size=1) as sessions:
+		with pytest.raises(WebDriverException):
+			with sessions.session() as maximo:
+				# The replacement can't start right now
+				server.unavailable = True
+				killBrowser(maximo)
+
+		server.unavailable = False
+		with sessions.session() as maximo:
+			assert MaximoSessionPool.isAlive(maximo)
+
+		assert server.logins == 2
+
+
+def test_session_timeout(server):
+	with newPool(size=1) as sessions:
+		borrowed = threading.Event()
+		release = threading.Event()
+
+		def borrow():
+			with sessions.session():
+				borrowed.set()
+				release.wait(5)
+
+		thread = threading.Thread(target=borrow)
+		thread.start()
+		borrowed.wait(5)
+
+		try:
+			with pytest.raises(MaximoError, match="No session became available"):
+				with sessions.session(timeout=0.05):
+					pass
+		finally:
+			release.set()
+			thread.join()
+
+
+def test_close_logs_out_and_quits_every_browser(server):
+	sessions = newPool(size=2)
+	sessions.close()
+
+	assert server.sessions == set()
+	assert all(driver.commands[-1] == "quit" for driver in server.drivers)
+
+	with pytest.raises(MaximoError, match="closed"):
+		sessions.submit(lambda maximo: None)
+
+	with pytest.raises(MaximoError, match="closed"):
+		with sessions.session():
+			pass
+
+	# Closing again does nothing
+	sessions.close()
+
+
+def test_failed_startup_closes_the_started_sessions(server, monkeypatch):
+	newMaximo = pool.MaximoAutomation
+	lock = threading.Lock()
+	started = []
+
+	def secondFails(config, **kwargs):
+		# The browsers start in parallel: the first one starts, the second one doesn't
+		with lock:
+			started.append(True)
+			if len(started) == 2:
+				raise WebDriverException("Chrome failed to start")
+
+		return newMaximo(config, **kwargs)
+
+	monkeypatch.setattr(pool, "MaximoAutomation", secondFails)
+
+	with pytest.raises(MaximoError, match="Could not start 1 of 2"):
+		newPool(size=2)
+
+	assert len(server.drivers) == 1
+	assert server.drivers[0].commands[-1] == "quit"
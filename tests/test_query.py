@@ -0,0 +1,59 @@
+import datetime
+
+import pytest
+
+from maximo_gui_connector.query import Raw, buildWhereClause, quoteValue
+
+
+def test_quote_value():
+	assert quoteValue("O'Brien") == "'O''Brien'"
+	assert quoteValue(3) == "3"
+	assert quoteValue(True) == "1"
+	assert quoteValue(datetime.date(2021, 1, 2)) == "'2021-01-02'"
+	assert quoteValue(datetime.datetime(2021, 1, 2, 3, 4, 5)) == "'2021-01-02 03:04:05'"
+	assert quoteValue(Raw("sysdate")) == "sysdate"
+
+
+def test_scalar_list_and_none():
+	assert buildWhereClause({ "status": "APPR" }) == "status = 'APPR'"
+	assert buildWhereClause({ "status": ["APPR", "INPRG"] }) == "status IN ('APPR', 'INPRG')"
+	assert buildWhereClause({ "ownergroup": None }) == "ownergroup IS NULL"
+	assert buildWhereClause({ "ownergroup": { "!=": None } }) == "ownergroup IS NOT NULL"
+
+
+def test_operators():
+	clause = buildWhereClause({ "reportdate": { ">=": datetime.date(2021, 1, 1), "<": Raw("sysdate") } })
+	assert clause == "reportdate >= '2021-01-01' AND reportdate < sysdate"
+
+	assert buildWhereClause({ "status": { "not in": ("CLOSE", "CAN") } }) == "status NOT IN ('CLOSE', 'CAN')"
+	assert buildWhereClause({ "status": { "in": [] } }) == "1=0"
+	assert buildWhereClause({ "status": { "not in": [] } }) == "1=1"
+
+
+def test_in_rejects_a_string_operand():
+	with pytest.raises(ValueError, match="list of values"):
+		buildWhereClause({ "status": { "in": "APPR" } })
+
+	with pytest.raises(ValueError):
+		buildWhereClause({ "status": { "not in": b"APPR" } })
+
+	with pytest.raises(ValueError):
+		buildWhereClause({ "priority": { "in": 1 } })
+
+
+def test_combinators():
+	clause = buildWhereClause({ "$or": [{ "status": "APPR" }, { "priority": { "<=": 2 } }], "$not": { "ownergroup": "X" } })
+	assert clause == "((status = 'APPR') OR (priority <= 2)) AND NOT (ownergroup = 'X')"
+
+
+@pytest.mark.parametrize("spec", [
+	{},
+	{ "status; DROP TABLE": "x" },
+	{ "status": { "~": "x" } },
+	{ "status": {} },
+	{ "status": { ">": None } },
+	{ "$or": [] },
+])
+def test_invalid_specifications(spec):
+	with pytest.raises(ValueError):
+		buildWhereClause(spec)
@@ -0,0 +1,125 @@
+import time
+
+from maximo_gui_connector.cache import RecordDetailCache
+from maximo_gui_connector.main import MaximoAutomation
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver
+
+
+def test_get_and_set():
+	cache = RecordDetailCache()
+
+	assert cache.get("CH001", "Status:") == (False, None)
+
+	cache.set("CH001", "Status:", "APPR")
+	assert cache.get("CH001", "Status:") == (True, "APPR")
+	assert cache.get("CH002", "Status:") == (False, None)
+
+	# Empty values are values too
+	cache.set("CH001", "Summary:", "")
+	assert cache.get("CH001", "Summary:") == (True, "")
+
+	assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_entries_expire():
+	cache = RecordDetailCache(ttl=0.05)
+	cache.set("CH001", "Status:", "APPR")
+
+	time.sleep(0.1)
+	assert cache.get("CH001", "Status:") == (False, None)
+	assert len(cache) == 0
+
+
+def test_least_recently_used_are_evicted():
+	cache = RecordDetailCache(max_entries=2)
+	cache.set("CH001", "Status:", "APPR")
+	cache.set("CH002", "Status:", "INPRG")
+
+	# Now CH002 is the least recently used
+	cache.get("CH001", "Status:")
+	cache.set("CH003", "Status:", "CLOSE")
+
+	assert len(cache) == 2
+	assert cache.get("CH002", "Status:") == (False, None)
+	assert cache.get("CH001", "Status:") == (True, "APPR")
+
+
+def test_invalidate():
+	cache = RecordDetailCache()
+	cache.set("CH001", "Status:", "APPR")
+	cache.set("CH001", "Summary:", "First")
+	cache.set("CH002", "Status:", "INPRG")
+
+	cache.invalidate("CH001")
+	assert len(cache) == 1
+	assert cache.get("CH002", "Status:") == (True, "INPRG")
+
+	cache.invalidate()
+	assert len(cache) == 0
+
+
+def newMaximo():
+	driver = FakeMaximoDriver()
+	driver.record_fields = {
+		"CH001": { "Status:": "APPR", "Summary:": "First" },
+		"CH002": { "Status:": "INPRG", "Summary:": "Second" },
+	}
+
+	return driver, MaximoAutomation({ "driver": driver, "detail_cache_ttl": 60 }, login_url=LOGIN_URL)
+
+
+def test_record_fields_are_cached():
+	driver, maximo = newMaximo()
+
+	assert maximo.getRecordFields("CH001", ["Status:"]) == { "Status:": "APPR" }
+	assert driver.record == "CH001"
+
+	commands = len(driver.commands)
+	assert maximo.getRecordFields("CH001", ["Status:"]) == { "Status:": "APPR" }
+	assert len(driver.commands) == commands
+
+
+def test_current_record_is_forgotten_when_leaving_it():
+	driver, maximo = newMaximo()
+	maximo.getRecordFields("CH001", ["Summary:"])
+
+	maximo.setFilters({ "status": "APPR" })
+	driver.openRecord("CH002")
+
+	# CH001 is searched again, instead of reading the fields of the record on the page
+	assert maximo.getRecordFields("CH001", ["Status:"]) == { "Status:": "APPR" }
+	assert driver.record == "CH001"
+
+
+def test_forget_current_record_after_direct_navigation():
+	driver, maximo = newMaximo()
+	maximo.getRecordFields("CH001", ["Summary:"])
+
+	# Another record opened through the driver
+	driver.openRecord("CH002")
+	maximo.forgetCurrentRecord()
+
+	assert maximo.getRecordFields("CH001", ["Status:"]) == { "Status:": "APPR" }
+	assert driver.record == "CH001"
+
+
+def test_editing_invalidates_only_the_current_record():
+	driver, maximo = newMaximo()
+	maximo.getRecordFields("CH002", ["Status:"])
+	maximo.getRecordFields("CH001", ["Status:"])
+
+	maximo.setNamedInput({ "Summary:": "Changed" })
+	assert maximo.detail_cache.get("CH001", "Status:") == (False, None)
+	assert maximo.detail_cache.get("CH002", "Status:") == (True, "INPRG")
+
+
+def test_search_dialog_input_keeps_the_cache():
+	driver, maximo = newMaximo()
+	maximo.getRecordFields("CH001", ["Status:"])
+
+	# ex. the fields of the Advanced Search dialog, which belong to no record
+	maximo.forgetCurrentRecord()
+	maximo.setNamedInput({ "Summary:": "%" })
+
+	assert len(maximo.detail_cache) == 1
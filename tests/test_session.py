@@ -0,0 +1,101 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from maximo_gui_connector.main import MaximoAutomation, _operation
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver
+
+
+class SessionExpiringMaximo(MaximoAutomation):
+	"""
+		The session expires while the first operation is running
+	"""
+
+	def __init__(self, **config):
+		super().__init__(dict({ "driver": FakeMaximoDriver(), "auto_relogin": True }, **config), login_url=LOGIN_URL)
+
+		self._credentials = ("user", "password")
+		self.expired = False
+		self.relogins = 0
+		self.calls = []
+
+	def isSessionExpired(self):
+		return self.expired
+
+	def relogin(self):
+		self.relogins += 1
+		self.expired = False
+
+	def __run(self, name):
+		self.calls.append(name)
+		if len(self.calls) == 1:
+			self.expired = True
+			raise WebDriverException("Element is not attached to the page document")
+
+		return name
+
+	@_operation(readonly=True)
+	def readOperation(self):
+		return self.__run("read")
+
+	@_operation(idempotent=True)
+	def idempotentOperation(self):
+		return self.__run("idempotent")
+
+	@_operation
+	def writeOperation(self):
+		return self.__run("write")
+
+
+@pytest.mark.parametrize("operation", ["readOperation", "idempotentOperation"])
+def test_idempotent_operations_are_retried_after_relogin(operation):
+	maximo = SessionExpiringMaximo()
+
+	assert getattr(maximo, operation)() in ("read", "idempotent")
+	assert maximo.relogins == 1
+	assert len(maximo.calls) == 2
+
+
+def test_other_operations_are_not_retried_after_relogin():
+	maximo = SessionExpiringMaximo()
+
+	with pytest.raises(WebDriverException):
+		maximo.writeOperation()
+
+	# The session is restored for the next operations anyway
+	assert maximo.relogins == 1
+	assert maximo.calls == ["write"]
+
+
+def test_no_retry_without_auto_relogin():
+	maximo = SessionExpiringMaximo(auto_relogin=False)
+
+	with pytest.raises(WebDriverException):
+		maximo.readOperation()
+
+	assert maximo.relogins == 0
+
+
+def test_ping_does_not_send_the_query_string():
+	driver = FakeMaximoDriver()
+	maximo = MaximoAutomation({ "driver": driver }, login_url=LOGIN_URL)
+
+	assert maximo.ping()
+	# The script builds the URL from the path of the current page
+	assert driver.pinged_urls == [None]
+
+	maximo.ping_url = "/maximo/webclient/ping.txt"
+	maximo.ping()
+	assert driver.pinged_urls[-1] == "/maximo/webclient/ping.txt"
+
+
+@pytest.mark.parametrize("response", [
+	{ "status": 0, "redirected": True },
+	{ "status": 401, "redirected": False },
+	None,
+])
+def test_ping_detects_expired_sessions(response):
+	driver = FakeMaximoDriver()
+	driver.ping_response = response
+
+	assert not MaximoAutomation({ "driver": driver }, login_url=LOGIN_URL).ping()
@@ -0,0 +1,103 @@
+import json
+
+from maximo_gui_connector.main import MaximoAutomation
+
+from tests.fakes import LOGIN_URL, UI_URL, FakeMaximoDriver, FakeMaximoServer
+
+
+def newMaximo(server: FakeMaximoServer, store_path: str):
+	driver = FakeMaximoDriver(server=server)
+	maximo = MaximoAutomation({ "driver": driver, "session_store": store_path }, login_url=LOGIN_URL)
+
+	return driver, maximo
+
+
+def typedCredentials(driver: FakeMaximoDriver):
+	return driver.commands.count("sendKeysToElement")
+
+
+def test_login_saves_the_session(tmp_path):
+	server = FakeMaximoServer()
+	driver, maximo = newMaximo(server, str(tmp_path / "sessions.json"))
+	maximo.login("User", "password")
+
+	with open(tmp_path / "sessions.json") as f:
+		saved = json.load(f)
+
+	entry = saved["maximo.test|user"]["value"]
+	# The id of the UI session is never saved
+	assert entry["url"] == UI_URL
+	assert [cookie["value"] for cookie in entry["cookies"]] == ["session-1"]
+
+
+def test_saved_session_is_restored(tmp_path):
+	server = FakeMaximoServer()
+	store_path = str(tmp_path / "sessions.json")
+	newMaximo(server, store_path)[1].login("user", "password")
+
+	driver, maximo = newMaximo(server, store_path)
+	maximo.login("user", "password")
+
+	assert server.logins == 1
+	assert typedCredentials(driver) == 0
+	assert driver.logged_in
+	assert driver.current_url == UI_URL
+
+
+def test_expired_session_falls_back_to_a_fresh_login(tmp_path):
+	server = FakeMaximoServer()
+	store_path = str(tmp_path / "sessions.json")
+	newMaximo(server, store_path)[1].login("user", "password")
+
+	# The server forgot the session, the cookie file is still there
+	server.expire()
+
+	driver, maximo = newMaximo(server, store_path)
+	maximo.login("user", "password")
+
+	assert server.logins == 2
+	assert typedCredentials(driver) == 2
+	assert driver.logged_in
+
+	# The cookies of the expired session were dropped, and the new session saved
+	assert [cookie["value"] for cookie in driver.cookies] == ["session-2"]
+	assert [cookie["value"] for cookie in maximo._session_store.get(maximo.getCacheKey())["cookies"]] == ["session-2"]
+
+
+def test_expired_cookie_file_is_not_used(tmp_path, monkeypatch):
+	server = FakeMaximoServer()
+	store_path = str(tmp_path / "sessions.json")
+	newMaximo(server, store_path)[1].login("user", "password")
+
+	# The saved session is older than the TTL of the store
+	monkeypatch.setattr(MaximoAutomation, "SESSION_STORE_TTL", -1)
+
+	driver, maximo = newMaximo(server, store_path)
+	maximo.login("user", "password")
+
+	assert server.logins == 2
+	assert "addCookie" not in driver.commands
+
+
+def test_saved_sessions_are_per_user(tmp_path):
+	server = FakeMaximoServer()
+	store_path = str(tmp_path / "sessions.json")
+	newMaximo(server, store_path)[1].login("user", "password")
+
+	driver, maximo = newMaximo(server, store_path)
+	maximo.login("other", "password")
+
+	assert server.logins == 2
+	assert "addCookie" not in driver.commands
+
+
+def test_logout_forgets_the_saved_session(tmp_path):
+	server = FakeMaximoServer()
+	store_path = str(tmp_path / "sessions.json")
+
+	driver, maximo = newMaximo(server, store_path)
+	maximo.login("user", "password")
+	maximo.logout()
+
+	assert maximo._session_store.get(maximo.getCacheKey()) is None
+	assert not driver.logged_in
@@ -0,0 +1,159 @@
+from maximo_gui_connector.main import MaximoAutomation
+from maximo_gui_connector.snapshot import JS_DOM_SNAPSHOT, DomSnapshot
+
+from tests.fakes import LOGIN_URL, FakeElement, FakeMaximoDriver
+
+
+PAGE = """<html><head><script>var x = "<td>";</script></head><body>
+	<label class="text label" for="status">Status:</label><input id="status" value="APPR">
+	<label class="text label" for="summary">Summary:</label><input id="summary">
+	<label class="text label" for="details">Details:</label><textarea id="details" value="Current text">Initial text</textarea>
+	<label class="text label" for="old-details">Old Details:</label><textarea id="old-details">Line 1<br>Line 2</textarea>
+	<label class="text label" for="priority">Priority:</label><select id="priority" value="2"><option value="1" selected>High</option><option value="2">Low</option></select>
+	<label class="text label" for="impact">Impact:</label><select id="impact"><option value="1">High</option><option value="2" selected>Low</option></select>
+	<label class="text label" for="owner">Owner:</label><span id="owner"> JDOE </span>
+	<label class="text label required" for="ignored">Ignored:</label><input id="ignored" value="x">
+
+	<table>
+		<tbody><tr id="m6a7dfd2f_tbod_ttrow-tr">
+			<th></th>
+			<th id="m6a7dfd2f_ttrow_[C:1]-c"><span id="m6a7dfd2f_ttrow_[C:1]_ttitle-lb">Change</span><img alt="Sort Ascending"></th>
+			<th id="m6a7dfd2f_ttrow_[C:2]-c"><span id="m6a7dfd2f_ttrow_[C:2]_ttitle-lb">Summary</span></th>
+		</tr>
+		<tr><td></td><td headers="m6a7dfd2f_ttrow_[C:1]-c"><input id="filter-change"></td><td></td></tr></tbody>
+		<tbody id="m6a7dfd2f_tbod-tbd">
+			<tr class="tablerow" id="m6a7dfd2f_tbod_tdrow-tr[R:0]"><td></td><td>CH001</td><td>First <b>summary</b></td></tr>
+			<tr class="tablerow" id="m6a7dfd2f_tbod_tdrow-tr[R:1]"><td></td><td>CH002</td></tr>
+		</tbody>
+	</table>
+
+	<div id="mb-dialog_inner" role="alertdialog">
+		<div id="mb-dialog_content0">Warning</div>
+		<div id="mb-dialog_content1">
+			<div id="mb_bodydiv">Do you want to save<br>your changes?</div>
+			<button class="text pb" type="button" ctype="pushbutton">Yes</button>
+			<button class="text pb" type="button" ctype="pushbutton">No</button>
+		</div>
+	</div>
+	<div id="mb-dialog_inner_dialogwait" class="wait_modal"></div>
+</body></html>"""
+
+
+def test_labels():
+	labels = DomSnapshot(PAGE).labels()
+
+	assert labels["Status:"] == ["status"]
+	assert "Ignored:" not in labels
+
+
+def test_input_values():
+	snapshot = DomSnapshot(PAGE)
+
+	assert snapshot.inputValues(["Status:", "Summary:", "Owner:", "Missing:"]) == { "Status:": "APPR", "Summary:": "", "Owner:": "JDOE", "Missing:": None }
+
+
+def test_textarea_and_select_use_the_current_value():
+	snapshot = DomSnapshot(PAGE)
+
+	assert snapshot.inputValue("Details:") == "Current text"
+	assert snapshot.inputValue("Priority:") == "2"
+
+	# Without the attribute copied by the snapshot script
+	assert snapshot.inputValue("Old Details:") == "Line 1\nLine 2"
+	assert snapshot.inputValue("Impact:") == "2"
+
+
+def test_table():
+	snapshot = DomSnapshot(PAGE)
+
+	assert snapshot.tableHeaders() == [{ "id": 1, "text": "Change" }, { "id": 2, "text": "Summary" }]
+	assert snapshot.tableRows() == (["Change", "Summary"], [
+		(["CH001", "First summary"], "m6a7dfd2f_tbod_tdrow-tr[R:0]"),
+		(["CH002", None], "m6a7dfd2f_tbod_tdrow-tr[R:1]"),
+	])
+	assert snapshot.tableRows(columns=["SUMMARY"])[1][0] == (["First summary"], "m6a7dfd2f_tbod_tdrow-tr[R:0]")
+
+
+def test_list_filters():
+	assert DomSnapshot(PAGE).listFilters() == {
+		"change": { "element_id": "filter-change", "sorting": "Sort Ascending", "column_number": "1" },
+		"summary": { "element_id": "", "sorting": None, "column_number": "2" },
+	}
+
+
+def test_dialogs():
+	assert DomSnapshot(PAGE).dialogs() == [{
+		"is_foreground": True,
+		"title": "Warning",
+		"text": "Do you want to save your changes?",
+		"type": "alertdialog",
+		"buttons": ["Yes", "No"],
+		"html": None,
+	}]
+
+
+def test_unbalanced_end_tags_are_tolerated():
+	snapshot = DomSnapshot('<div id="a"><p id="b">text</span></div><p id="c"></p>')
+
+	assert snapshot.getElementById("b").parent.id == "a"
+	assert snapshot.getElementById("c").parent.tag == "#document"
+
+
+def test_paging_takes_a_snapshot_of_every_page():
+	driver = FakeMaximoDriver(rows=45, page_size=20)
+	maximo = MaximoAutomation({ "driver": driver, "snapshot_mode": True }, login_url=LOGIN_URL)
+
+	records = list(maximo.iterRecordsFromTable())
+
+	assert [record["data"]["Change"] for record in records] == [f"CH{index:07}" for index in range(1, 46)]
+	assert len(set(record["element_id"] for record in records)) == 45
+
+	# The last page is still valid for the next queries
+	commands = len(driver.commands)
+	assert len(maximo.getTableRowsAll()) == 5
+	assert len(driver.commands) == commands
+
+
+def test_list_filters_ignore_the_inputs_of_the_data_cells():
+	page = PAGE.replace(
+		'<td>CH002</td>',
+		'<td headers="m6a7dfd2f_ttrow_[C:1]-c"><input id="row-1-change" type="checkbox">CH002</td>'
+	)
+
+	assert DomSnapshot(page).listFilters()["change"]["element_id"] == "filter-change"
+
+
+def test_list_filters_are_read_from_the_snapshot():
+	driver = FakeMaximoDriver()
+	live = MaximoAutomation({ "driver": driver }, login_url=LOGIN_URL).getAvailableFiltersInListView()
+
+	maximo = MaximoAutomation({ "driver": driver, "snapshot_mode": True }, login_url=LOGIN_URL)
+	scripts = len(driver.scripts)
+
+	assert maximo.getAvailableFiltersInListView() == live
+	assert driver.scripts[scripts:] == [JS_DOM_SNAPSHOT]
+
+
+def test_dialog_checks_use_the_snapshot():
+	driver = FakeMaximoDriver()
+	maximo = MaximoAutomation({ "driver": driver, "snapshot_mode": True }, login_url=LOGIN_URL)
+	maximo.getTableRowsAll()
+
+	# No dialog in the snapshot: the live page is not queried and the snapshot is still valid
+	commands = len(driver.commands)
+	maximo.handleIfComingFromDetail()
+	assert maximo.checkUpdateError() is False
+	assert len(driver.commands) == commands
+
+	driver.dialogs = [{
+		"is_foreground": True,
+		"title": "System Message",
+		"text": "Do you want to save your changes before continuing?",
+		"type": "alertdialog",
+		"buttons": { "Yes": FakeElement(driver, "dialog-yes"), "No": FakeElement(driver, "dialog-no") },
+	}]
+	maximo.invalidateSnapshot()
+
+	maximo.handleIfComingFromDetail()
+	assert driver.dialogs == []
+	assert any("detectMaximoDialogs" in script for script in driver.scripts)
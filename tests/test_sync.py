@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from maximo_gui_connector.main import MaximoAutomation, MaximoError
+from maximo_gui_connector.sync import IncrementalSync, RecordStore
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver
+
+
+def newSync(store: RecordStore, **kwargs):
+	driver = FakeMaximoDriver()
+	driver.headers = ["Change", "Summary", "Changed Date"]
+	driver.rows = [
+		["CH001", "First", "01/10/24 09:00 AM"],
+		["CH002", "Second", "01/12/24 03:30 PM"],
+		["CH003", "Third", ""],
+	]
+
+	maximo = MaximoAutomation({ "driver": driver }, login_url=LOGIN_URL)
+	options = dict({ "id_column": "Change", "date_column": "Changed Date" }, **kwargs)
+
+	return driver, IncrementalSync(maximo, store, "changes", **options)
+
+
+def test_record_store_upsert_counts_changes():
+	with RecordStore(":memory:") as store:
+		assert store.upsert("sync", { "A": { "x": 1 }, "B": { "x": 2 } }) == { "inserted": 2, "updated": 0, "unchanged": 0 }
+		assert store.upsert("sync", { "A": { "x": 1 }, "B": { "x": 3 } }) == { "inserted": 0, "updated": 1, "unchanged": 1 }
+
+		assert store.get("sync", "B") == { "x": 3 }
+		assert store.get("other", "B") is None
+
+
+def test_record_store_records_by_change_date():
+	with RecordStore(":memory:") as store:
+		store.upsert("sync", { "A": {}, "B": {}, "C": {} }, { "A": "2024-01-01T00:00:00", "B": "2024-01-03T00:00:00" })
+
+		assert list(store.records("sync")) == ["B", "A", "C"]
+		assert list(store.records("sync", changed_since=datetime(2024, 1, 2))) == ["B"]
+
+
+def test_record_store_watermark_and_reset():
+	with RecordStore(":memory:") as store:
+		assert store.getWatermark("sync") is None
+
+		store.upsert("sync", { "A": {} })
+		store.setWatermark("sync", datetime(2024, 1, 2, 3, 4, 5))
+		assert store.getWatermark("sync") == datetime(2024, 1, 2, 3, 4, 5)
+
+		store.reset("sync")
+		assert store.getWatermark("sync") is None
+		assert store.records("sync") == {}
+
+
+def test_first_run_fetches_the_whole_list():
+	with RecordStore(":memory:") as store:
+		driver, sync = newSync(store)
+		result = sync.run()
+
+		assert driver.filters == { "Changed Date": "" }
+		assert result["fetched"] == 3 and result["inserted"] == 3
+		assert result["watermark"] == datetime(2024, 1, 12, 15, 30)
+		assert store.get("changes", "CH003")["Summary"] == "Third"
+
+
+def test_next_run_filters_from_the_watermark():
+	with RecordStore(":memory:") as store:
+		driver, sync = newSync(store, filters={ "Summary": "%" }, overlap=timedelta(minutes=10))
+		sync.run()
+
+		result = sync.run()
+		assert driver.filters == { "Summary": "%", "Changed Date": ">=01/12/24 03:20 PM" }
+		assert result["unchanged"] == 3
+
+
+def test_columns_are_matched_case_insensitively():
+	with RecordStore(":memory:") as store:
+		driver, sync = newSync(store, id_column="change", date_column="changed date")
+		result = sync.run()
+
+		assert result["fetched"] == 3
+		assert result["watermark"] == datetime(2024, 1, 12, 15, 30)
+		assert set(store.records("changes")) == { "CH001", "CH002", "CH003" }
+
+
+@pytest.mark.parametrize("options", [
+	{ "id_column": "Record" },
+	{ "date_column": "Last Change" },
+	{ "filters": { "Owner Group": "MYGROUP" } },
+])
+def test_unknown_columns_are_rejected_before_the_first_run(options):
+	with RecordStore(":memory:") as store:
+		driver, sync = newSync(store, **options)
+
+		with pytest.raises(MaximoError, match="not found in the list view"):
+			sync.run()
+
+		assert driver.filters == {}
+		assert store.getWatermark("changes") is None
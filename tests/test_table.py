@@ -0,0 +1,89 @@
+import copy
+import pickle
+
+import pytest
+
+from maximo_gui_connector.table import ColumnarTable, attributeName
+
+
+RECORDS = [
+	{ "data": { "Change": "CH1", "Status": "APPR", "Owner Group": "G1" }, "element_id": "row-0" },
+	{ "data": { "Change": "CH2", "Status": "APPR", "Owner Group": "G2" }, "element_id": "row-1" },
+	{ "data": { "Change": "CH3", "Status": "NEW" }, "element_id": "row-2" },
+]
+
+
+def test_attribute_name():
+	assert attributeName("Owner Group") == "owner_group"
+	assert attributeName(" Target Start (Date) ") == "target_start_date"
+
+
+def test_from_records_and_back():
+	table = ColumnarTable.fromRecords(RECORDS)
+
+	assert table.headers == ["Change", "Status", "Owner Group"]
+	assert len(table) == 3
+	assert table.column("Status") == ["APPR", "APPR", "NEW"]
+	assert table.element_ids == ["row-0", "row-1", "row-2"]
+
+	# Missing cells become empty strings
+	assert table.toRecords()[2]["data"]["Owner Group"] == ""
+	assert table.toRecords()[0] == RECORDS[0]
+
+
+def test_row_view_access():
+	table = ColumnarTable.fromRecords(RECORDS)
+	row = table[-1]
+
+	assert row["Change"] == "CH3"
+	assert row.owner_group == ""
+	assert row.get("Missing", "default") == "default"
+	assert row.element_id == "row-2"
+
+	with pytest.raises(AttributeError):
+		row.missing
+
+
+def test_reserved_names_are_reachable_as_items():
+	table = ColumnarTable(["Data", "Element ID"])
+	table.append(["value", "id-value"], "row-0")
+
+	row = table[0]
+	assert row["Data"] == "value"
+	assert row["Element ID"] == "id-value"
+
+	# The members win over the columns with the same attribute name
+	assert row.data == { "Data": "value", "Element ID": "id-value" }
+	assert row.element_id == "row-0"
+
+
+def test_append_extend_head():
+	table = ColumnarTable(["A", "B"])
+	table.append(["1", "x"])
+
+	with pytest.raises(ValueError):
+		table.append(["only one"])
+
+	other = ColumnarTable(["A", "B"])
+	other.append(["2", "x"], "id")
+	table.extend(other)
+
+	assert table.column("A") == ["1", "2"]
+	assert len(table.head(1)) == 1
+	assert table.head(5) is table
+
+	with pytest.raises(ValueError):
+		table.extend(ColumnarTable(["A"]))
+
+	with pytest.raises(IndexError):
+		table[2]
+
+
+def test_row_view_can_be_copied_and_pickled():
+	table = ColumnarTable(["Change", "Owner Group"])
+	table.append(["CH001", "GROUP_A"], "row-0")
+	row = table[0]
+
+	for clone in (copy.copy(row), copy.deepcopy(row), pickle.loads(pickle.dumps(row))):
+		assert clone.owner_group == "GROUP_A"
+		assert clone.asdict() == { "data": { "Change": "CH001", "Owner Group": "GROUP_A" }, "element_id": "row-0" }
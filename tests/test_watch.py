@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+import pytest
+
+from maximo_gui_connector.main import MaximoAutomation, MaximoError
+from maximo_gui_connector.watch import ListWatcher, rowHash
+
+from tests.fakes import LOGIN_URL, FakeMaximoDriver
+
+
+def newWatcher(rows: int = 45, **kwargs):
+	driver = FakeMaximoDriver(page_size=20)
+	driver.headers = ["Change", "Summary", "Changed Date"]
+	driver.rows = [[f"CH{index:03}", f"Record {index}", f"2024-01-01 {index // 60:02}:{index % 60:02}"] for index in range(rows)]
+
+	maximo = MaximoAutomation({ "driver": driver }, login_url=LOGIN_URL)
+	options = dict({ "id_column": "Change", "date_column": "Changed Date", "date_format": "%Y-%m-%d %H:%M", "overlap": timedelta(0) }, **kwargs)
+
+	return driver, maximo, ListWatcher(maximo, "changes", **options)
+
+
+def test_row_hash_ignores_the_order_of_the_columns():
+	assert rowHash({ "a": "1", "b": "2" }) == rowHash({ "b": "2", "a": "1" })
+	assert rowHash({ "a": "1" }) != rowHash({ "a": "2" })
+
+
+def test_first_poll_sorts_the_list_and_takes_the_snapshot():
+	driver, maximo, watcher = newWatcher()
+
+	assert watcher.poll() == []
+	assert driver.sorting == (2, "descending")
+	assert driver.rows[0][0] == "CH044"
+	assert len(watcher.snapshot) == 45
+
+
+def test_columns_are_matched_case_insensitively():
+	driver, maximo, watcher = newWatcher(id_column="change", date_column="changed date")
+	watcher.poll()
+
+	assert len(watcher.snapshot) == 45
+	assert "CH044" in watcher.snapshot
+
+	row = next(row for row in driver.rows if row[0] == "CH010")
+	row[1], row[2] = "Changed", "2024-01-01 01:00"
+	driver.sorting = None
+
+	assert [(event["type"], event["id"]) for event in watcher.poll()] == [("changed", "CH010")]
+
+
+def test_unknown_columns_are_rejected():
+	driver, maximo, watcher = newWatcher(id_column="Record")
+
+	with pytest.raises(MaximoError, match="not found in the list view"):
+		watcher.poll()
+
+
+def test_sort_errors():
+	driver, maximo, watcher = newWatcher()
+
+	with pytest.raises(MaximoError, match="not found"):
+		maximo.sortListView("Missing")
+
+	maximo.sortListView("Change")
+	assert driver.sorting == (0, "ascending")
+
+
+def test_partial_poll_stops_at_the_previous_watermark():
+	driver, maximo, watcher = newWatcher()
+	watcher.poll()
+
+	# A record changes after the first poll
+	row = next(row for row in driver.rows if row[0] == "CH010")
+	row[1], row[2] = "Changed", "2024-01-01 01:00"
+	driver.sorting = None
+
+	commands = len(driver.commands)
+	events = watcher.poll()
+
+	assert [(event["type"], event["id"]) for event in events] == [("changed", "CH010")]
+	assert events[0]["previous"]["Summary"] == "Record 10"
+	# Only the first page was read
+	assert "m6a7dfd2f-ti7_img" not in str(driver.commands[commands:])
+	assert driver.page == 0
+
+
+def test_full_pass_reports_removed_rows():
+	driver, maximo, watcher = newWatcher(full_every=1)
+	watcher.poll()
+
+	driver.rows = [row for row in driver.rows if row[0] != "CH003"]
+	driver.rows.append(["CH100", "New", "2024-01-01 02:00"])
+
+	events = watcher.poll()
+	assert sorted((event["type"], event["id"]) for event in events) == [("added", "CH100"), ("removed", "CH003")]
+	assert "CH003" not in watcher.snapshot
+
+
+def test_watch_waits_through_maximo_sleep():
+	driver, maximo, watcher = newWatcher(rows=5, emit_initial=True)
+
+	sleeps = []
+	maximo.sleep = sleeps.append
+
+	polls = list(watcher.watch(interval=30, max_polls=3))
+
+	assert len(polls) == 3
+	assert len(polls[0]) == 5 and polls[1] == [] and polls[2] == []
+	# Between polls only
+	assert len(sleeps) == 2 and all(0 < seconds <= 30 for seconds in sleeps)